@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 import tempfile
 
@@ -28,8 +29,11 @@ class Settings:
 
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def from_env() -> "Settings":
-        """Create settings from environment variables with defaults."""
+        """Create settings from a one-time snapshot of environment variables."""
+        env = os.environ.copy()
+
         def to_bool(value: str | None, default: bool) -> bool:
             if value is None:
                 return default
@@ -40,21 +44,21 @@ class Settings:
                 return False
             return default
 
-        s3_bucket = os.getenv("S3_BUCKET", "").strip()
-        s3_prefix = os.getenv("S3_PREFIX", "plasma-results/").strip()
-        inline_max_bytes = int(os.getenv("INLINE_MAX_BYTES", "200000"))
-        presign_expiry_seconds = int(os.getenv("PRESIGN_EXPIRY_SECONDS", "3600"))
+        s3_bucket = env.get("S3_BUCKET", "").strip()
+        s3_prefix = env.get("S3_PREFIX", "plasma-results/").strip()
+        inline_max_bytes = int(env.get("INLINE_MAX_BYTES", "200000"))
+        presign_expiry_seconds = int(env.get("PRESIGN_EXPIRY_SECONDS", "3600"))
         default_local_dir = os.path.join(tempfile.gettempdir(), "plasma_results")
-        local_storage_dir = os.getenv("LOCAL_STORAGE_DIR", default_local_dir)
-        stripe_secret_key = os.getenv("STRIPE_SECRET_KEY", "").strip()
-        stripe_compare_price_id = os.getenv("STRIPE_COMPARE_PRICE_ID", "").strip()
-        compare_monthly_price_cents = max(50, int(os.getenv("COMPARE_MONTHLY_PRICE_CENTS", "500")))
-        auth_db_path = os.getenv("AUTH_DB_PATH", os.path.join(local_storage_dir, "auth.sqlite3")).strip()
-        auth_session_days = max(1, int(os.getenv("AUTH_SESSION_DAYS", "14")))
-        auth_cookie_name = os.getenv("AUTH_COOKIE_NAME", "plasma_session").strip() or "plasma_session"
-        auth_cookie_secure = to_bool(os.getenv("AUTH_COOKIE_SECURE"), False)
-        admin_bootstrap_email = os.getenv("ADMIN_BOOTSTRAP_EMAIL", "").strip().lower()
-        admin_bootstrap_password = os.getenv("ADMIN_BOOTSTRAP_PASSWORD", "").strip()
+        local_storage_dir = env.get("LOCAL_STORAGE_DIR", default_local_dir)
+        stripe_secret_key = env.get("STRIPE_SECRET_KEY", "").strip()
+        stripe_compare_price_id = env.get("STRIPE_COMPARE_PRICE_ID", "").strip()
+        compare_monthly_price_cents = max(50, int(env.get("COMPARE_MONTHLY_PRICE_CENTS", "500")))
+        auth_db_path = env.get("AUTH_DB_PATH", os.path.join(local_storage_dir, "auth.sqlite3")).strip()
+        auth_session_days = max(1, int(env.get("AUTH_SESSION_DAYS", "14")))
+        auth_cookie_name = env.get("AUTH_COOKIE_NAME", "plasma_session").strip() or "plasma_session"
+        auth_cookie_secure = to_bool(env.get("AUTH_COOKIE_SECURE"), False)
+        admin_bootstrap_email = env.get("ADMIN_BOOTSTRAP_EMAIL", "").strip().lower()
+        admin_bootstrap_password = env.get("ADMIN_BOOTSTRAP_PASSWORD", "").strip()
         return Settings(
             s3_bucket=s3_bucket,
             s3_prefix=s3_prefix,
@@ -7,18 +7,25 @@ Run locally with:
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-import json
+from functools import lru_cache
+import multiprocessing
 import os
+import re
+import time
 from pathlib import Path
 from typing import Any, Literal
-from urllib.parse import urlparse
 from uuid import uuid4
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+import anyio
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_json
 
 from config import settings
 from schemas import SimulationRequest, SimulationResponse, StorageInfo
@@ -29,39 +36,88 @@ from services.auth_store import (
     create_session,
     create_user,
     delete_session,
+    get_cached_user_by_session_token,
     get_user_by_session_token,
     init_auth_db,
     list_users,
-    parse_utc_iso,
+    start_session_sweeper,
     update_user_billing,
 )
 from services.compute_poisson_v1 import run_simulation_poisson_v1
 from services.compute_stub import run_simulation_stub
+from services.field_codec import compact_result
 from services.s3_store import build_store
 
-app = FastAPI(title="Plasma Simulation API", version="0.2.0")
-store = build_store()
+# Settings are frozen; bind the per-request auth values to module globals once.
+_AUTH_DB_PATH = settings.auth_db_path
+_COOKIE_NAME = settings.auth_cookie_name
+_COOKIE_SECURE = settings.auth_cookie_secure
 
-init_auth_db(settings.auth_db_path)
-bootstrap_admin_user(
-    settings.auth_db_path,
-    settings.admin_bootstrap_email,
-    settings.admin_bootstrap_password,
-)
+_SIM_POOL: ProcessPoolExecutor | None = None
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    global _SIM_POOL
+    # Run SQLite setup off the event loop so the server starts accepting connections sooner.
+    await anyio.to_thread.run_sync(init_auth_db, _AUTH_DB_PATH)
+    await anyio.to_thread.run_sync(
+        bootstrap_admin_user,
+        _AUTH_DB_PATH,
+        settings.admin_bootstrap_email,
+        settings.admin_bootstrap_password,
+    )
+    sweeper = start_session_sweeper(_AUTH_DB_PATH)
+    yield
+    if sweeper is not None:
+        sweeper.set()
+    if _SIM_POOL is not None:
+        _SIM_POOL.shutdown(wait=False, cancel_futures=True)
+        # A later startup in the same process (tests, reloads) gets a fresh pool.
+        _SIM_POOL = None
+
+
+app = FastAPI(title="Plasma Simulation API", version="0.2.0", lifespan=lifespan)
+store = build_store()
+# Every endpoint is served both bare and under /api; declare it once and include the router twice.
+router = APIRouter()
 
 
-def _estimate_json_size(payload: dict) -> tuple[int, bytes]:
-    """Estimate JSON payload size in bytes and return the encoded payload."""
-    json_bytes = json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+def _estimate_json_size(result: BaseModel) -> tuple[int, bytes]:
+    """Encode a result model straight to JSON bytes (nulls dropped, as stored) and return its size."""
+    # to_json emits bytes directly, so large results never hold a str copy alongside the bytes.
+    json_bytes = to_json(result, exclude_none=True)
     return len(json_bytes), json_bytes
 
 
+def _inline_simulation_response(envelope: SimulationResponse, result: BaseModel) -> Response:
+    """Splice the encoded result into the response envelope without re-encoding the envelope."""
+    # Inline results keep their null keys, matching the SimulationResponse shape clients read.
+    result_json = to_json(result)
+    envelope_json = envelope.model_dump_json(exclude={"result"}).encode("utf-8")
+    body = b"".join((envelope_json[:-1], b',"result":', result_json, b"}"))
+    return Response(content=body, media_type="application/json")
+
+
 SIM_MAX_CONCURRENCY = max(1, int(os.getenv("SIM_MAX_CONCURRENCY", "2")))
 SIM_QUEUE_WAIT_SECONDS = max(0.1, float(os.getenv("SIM_QUEUE_WAIT_SECONDS", "8")))
-SIM_SEMAPHORE = asyncio.Semaphore(SIM_MAX_CONCURRENCY)
+SIM_LIMITER = anyio.CapacityLimiter(SIM_MAX_CONCURRENCY)
 # Default timeout is intentionally higher because compare page often runs two heavy cases.
 SIM_TIMEOUT_SECONDS = float(os.getenv("SIM_TIMEOUT_SECONDS", "90"))
 COMPARE_ACCESS_ACTIVE_STATUSES = {"active", "trialing"}
+_RZ_COORDINATE_SYSTEMS = frozenset({"r-z", "rz", "r_z", "r/z"})
+
+
+def _get_sim_pool() -> ProcessPoolExecutor:
+    """Return the worker pool for CPU-bound solves, creating it on first use."""
+    global _SIM_POOL
+    if _SIM_POOL is None:
+        # spawn keeps workers free of the parent's threads and open SQLite handles.
+        _SIM_POOL = ProcessPoolExecutor(
+            max_workers=SIM_MAX_CONCURRENCY,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _SIM_POOL
 
 
 class AuthUserResponse(BaseModel):
@@ -131,14 +187,23 @@ class CompareAccessStatusResponse(BaseModel):
     message: str | None = None
 
 
+# Scheme must be http/https and the authority (up to the first / ? or #) non-empty.
+_HTTP_URL_RE = re.compile(r"https?://[^/?#\s]+", re.IGNORECASE)
+
+
 def _require_http_url(url: str, field_name: str) -> str:
-    parsed = urlparse(url)
-    if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+    if _HTTP_URL_RE.match(url) is None:
         raise HTTPException(status_code=400, detail=f"{field_name} must be an absolute http/https URL.")
     return url
 
 
+_STRIPE: Any | None = None
+
+
 def _load_stripe() -> Any:
+    global _STRIPE
+    if _STRIPE is not None:
+        return _STRIPE
     if not settings.stripe_secret_key:
         raise HTTPException(status_code=503, detail="Billing is not configured (missing STRIPE_SECRET_KEY).")
     try:
@@ -148,18 +213,18 @@ def _load_stripe() -> Any:
 
     stripe.api_key = settings.stripe_secret_key
     stripe.max_network_retries = 2
+    _STRIPE = stripe
     return stripe
 
 
-def _as_dict(obj: Any) -> dict[str, Any]:
+def _stripe_field(obj: Any, key: str) -> Any:
+    """Read one top-level field from a Stripe object or plain dict without converting it."""
     if isinstance(obj, dict):
-        return obj
-    to_dict_recursive = getattr(obj, "to_dict_recursive", None)
-    if callable(to_dict_recursive):
-        data = to_dict_recursive()
-        if isinstance(data, dict):
-            return data
-    return {}
+        return obj.get(key)
+    try:
+        return obj[key]
+    except (KeyError, TypeError, IndexError):
+        return None
 
 
 def _build_compare_line_items() -> list[dict[str, Any]]:
@@ -179,14 +244,19 @@ def _build_compare_line_items() -> list[dict[str, Any]]:
     ]
 
 
+# Depends only on frozen settings; the line items are read-only and only encoded by Stripe.
+_COMPARE_LINE_ITEMS = _build_compare_line_items()
+
+
 def _period_end_to_iso(unix_ts: Any) -> str | None:
     if isinstance(unix_ts, (int, float)) and unix_ts > 0:
         return datetime.fromtimestamp(float(unix_ts), tz=timezone.utc).isoformat()
     return None
 
 
+# Rows come from our own SQLite schema and are already typed, so skip re-validation.
 def _serialize_auth_user(user: dict[str, Any]) -> AuthUserResponse:
-    return AuthUserResponse(
+    return AuthUserResponse.model_construct(
         id=int(user["id"]),
         email=str(user["email"]),
         role=str(user["role"]),
@@ -200,7 +270,7 @@ def _serialize_auth_user(user: dict[str, Any]) -> AuthUserResponse:
 
 
 def _serialize_admin_user(user: dict[str, Any]) -> AdminUserResponse:
-    return AdminUserResponse(
+    return AdminUserResponse.model_construct(
         id=int(user["id"]),
         email=str(user["email"]),
         role=str(user["role"]),
@@ -215,20 +285,13 @@ def _serialize_admin_user(user: dict[str, Any]) -> AdminUserResponse:
     )
 
 
-def _set_auth_cookie(response: Response, token: str, expires_at_iso: str) -> None:
-    expires_at = parse_utc_iso(expires_at_iso)
-    if expires_at is None:
-        max_age = settings.auth_session_days * 24 * 60 * 60
-    else:
-        delta_seconds = int((expires_at - datetime.now(tz=timezone.utc)).total_seconds())
-        max_age = max(60, delta_seconds)
-
+def _set_auth_cookie(response: Response, token: str, max_age: int) -> None:
     response.set_cookie(
-        key=settings.auth_cookie_name,
+        key=_COOKIE_NAME,
         value=token,
         max_age=max_age,
         httponly=True,
-        secure=settings.auth_cookie_secure,
+        secure=_COOKIE_SECURE,
         samesite="lax",
         path="/",
     )
@@ -236,36 +299,45 @@ def _set_auth_cookie(response: Response, token: str, expires_at_iso: str) -> Non
 
 def _clear_auth_cookie(response: Response) -> None:
     response.delete_cookie(
-        key=settings.auth_cookie_name,
+        key=_COOKIE_NAME,
         path="/",
-        secure=settings.auth_cookie_secure,
+        secure=_COOKIE_SECURE,
         samesite="lax",
     )
 
 
-def _get_session_token(request: Request) -> str | None:
-    token = request.cookies.get(settings.auth_cookie_name)
-    if not token:
-        return None
-    stripped = token.strip()
-    return stripped if stripped else None
+_UNSET = object()
 
 
-def _get_current_user_optional(request: Request) -> dict[str, Any] | None:
+def _get_session_token(request: Request) -> str | None:
+    cached = getattr(request.state, "session_token", _UNSET)
+    if cached is not _UNSET:
+        return cached
+    token = None
+    # Skip full cookie parsing when the raw header cannot contain our cookie.
+    raw_cookie = request.headers.get("cookie")
+    if raw_cookie and _COOKIE_NAME in raw_cookie:
+        token = (request.cookies.get(_COOKIE_NAME) or "").strip() or None
+    request.state.session_token = token
+    return token
+
+
+# Async so a session-cache hit resolves on the event loop without a thread-pool hop. A miss
+# can write (expired-session delete, last_seen_at refresh) and wait out busy_timeout behind
+# another writer, so it runs in a worker thread.
+async def require_current_user(request: Request) -> dict[str, Any]:
     token = _get_session_token(request)
-    if not token:
-        return None
-    return get_user_by_session_token(settings.auth_db_path, token)
-
-
-def require_current_user(request: Request) -> dict[str, Any]:
-    user = _get_current_user_optional(request)
+    user = None
+    if token:
+        user = get_cached_user_by_session_token(_AUTH_DB_PATH, token)
+        if user is None:
+            user = await anyio.to_thread.run_sync(get_user_by_session_token, _AUTH_DB_PATH, token)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication required.")
     return user
 
 
-def require_admin_user(current_user: dict[str, Any] = Depends(require_current_user)) -> dict[str, Any]:
+async def require_admin_user(current_user: dict[str, Any] = Depends(require_current_user)) -> dict[str, Any]:
     if current_user.get("role") != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required.")
     return current_user
@@ -296,18 +368,18 @@ def _build_compare_access_response(user: dict[str, Any]) -> CompareAccessStatusR
 
 
 def _sync_user_from_subscription(
-    user: dict[str, Any], subscription_data: dict[str, Any]
+    user: dict[str, Any], subscription: Any
 ) -> tuple[dict[str, Any], CompareAccessStatusResponse]:
-    status_raw = subscription_data.get("status")
+    status_raw = _stripe_field(subscription, "status")
     status_value = str(status_raw) if status_raw is not None else "unknown"
     enabled = status_value in COMPARE_ACCESS_ACTIVE_STATUSES
-    current_period_end = _period_end_to_iso(subscription_data.get("current_period_end"))
+    current_period_end = _period_end_to_iso(_stripe_field(subscription, "current_period_end"))
     expires_patch = current_period_end if current_period_end is not None else ""
 
     updated_user = update_user_billing(
-        settings.auth_db_path,
+        _AUTH_DB_PATH,
         int(user["id"]),
-        stripe_subscription_id=str(subscription_data.get("id") or ""),
+        stripe_subscription_id=str(_stripe_field(subscription, "id") or ""),
         stripe_subscription_status=status_value,
         compare_access_enabled=enabled,
         compare_access_expires_at=expires_patch,
@@ -323,58 +395,52 @@ def _sync_user_from_subscription(
     return updated_user, response
 
 
-@app.post("/auth/register", response_model=AuthSessionResponse)
-@app.post("/api/auth/register", response_model=AuthSessionResponse)
+@router.post("/auth/register", response_model=AuthSessionResponse)
 def register(payload: AuthRegisterRequest, response: Response) -> AuthSessionResponse:
     try:
-        user = create_user(settings.auth_db_path, payload.email, payload.password, role="user")
+        user = create_user(_AUTH_DB_PATH, payload.email, payload.password, role="user")
     except ValueError as exc:
         message = str(exc)
         code = status.HTTP_409_CONFLICT if "exists" in message.lower() else status.HTTP_400_BAD_REQUEST
         raise HTTPException(status_code=code, detail=message) from exc
 
-    token, expires_at = create_session(settings.auth_db_path, int(user["id"]), settings.auth_session_days)
-    _set_auth_cookie(response, token, expires_at)
+    token, _, max_age = create_session(_AUTH_DB_PATH, int(user["id"]), settings.auth_session_days)
+    _set_auth_cookie(response, token, max_age)
     return AuthSessionResponse(user=_serialize_auth_user(user))
 
 
-@app.post("/auth/login", response_model=AuthSessionResponse)
-@app.post("/api/auth/login", response_model=AuthSessionResponse)
+@router.post("/auth/login", response_model=AuthSessionResponse)
 def login(payload: AuthLoginRequest, response: Response) -> AuthSessionResponse:
-    user = authenticate_user(settings.auth_db_path, payload.email, payload.password)
+    user = authenticate_user(_AUTH_DB_PATH, payload.email, payload.password)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password.")
 
-    token, expires_at = create_session(settings.auth_db_path, int(user["id"]), settings.auth_session_days)
-    _set_auth_cookie(response, token, expires_at)
+    token, _, max_age = create_session(_AUTH_DB_PATH, int(user["id"]), settings.auth_session_days)
+    _set_auth_cookie(response, token, max_age)
     return AuthSessionResponse(user=_serialize_auth_user(user))
 
 
-@app.post("/auth/logout", response_model=BasicOkResponse)
-@app.post("/api/auth/logout", response_model=BasicOkResponse)
+@router.post("/auth/logout", response_model=BasicOkResponse)
 def logout(request: Request, response: Response) -> BasicOkResponse:
     token = _get_session_token(request)
     if token:
-        delete_session(settings.auth_db_path, token)
+        delete_session(_AUTH_DB_PATH, token)
     _clear_auth_cookie(response)
     return BasicOkResponse(ok=True)
 
 
-@app.get("/auth/me", response_model=AuthSessionResponse)
-@app.get("/api/auth/me", response_model=AuthSessionResponse)
+@router.get("/auth/me", response_model=AuthSessionResponse)
 def me(current_user: dict[str, Any] = Depends(require_current_user)) -> AuthSessionResponse:
     return AuthSessionResponse(user=_serialize_auth_user(current_user))
 
 
-@app.get("/admin/users", response_model=AdminUsersResponse)
-@app.get("/api/admin/users", response_model=AdminUsersResponse)
+@router.get("/admin/users", response_model=AdminUsersResponse)
 def admin_list_users(_: dict[str, Any] = Depends(require_admin_user)) -> AdminUsersResponse:
-    users = list_users(settings.auth_db_path)
-    return AdminUsersResponse(users=[_serialize_admin_user(user) for user in users])
+    users = list_users(_AUTH_DB_PATH)
+    return AdminUsersResponse.model_construct(users=[_serialize_admin_user(user) for user in users])
 
 
-@app.patch("/admin/users/{user_id}", response_model=AdminUserResponse)
-@app.patch("/api/admin/users/{user_id}", response_model=AdminUserResponse)
+@router.patch("/admin/users/{user_id}", response_model=AdminUserResponse)
 def admin_patch_user(
     user_id: int,
     payload: AdminUserUpdateRequest,
@@ -385,7 +451,7 @@ def admin_patch_user(
 
     try:
         updated_user = admin_update_user(
-            settings.auth_db_path,
+            _AUTH_DB_PATH,
             user_id,
             role=payload.role,
             compare_access_enabled=payload.compare_access_enabled,
@@ -399,8 +465,7 @@ def admin_patch_user(
     return _serialize_admin_user(updated_user)
 
 
-@app.post("/billing/compare/checkout-session", response_model=CompareCheckoutSessionCreateResponse)
-@app.post("/api/billing/compare/checkout-session", response_model=CompareCheckoutSessionCreateResponse)
+@router.post("/billing/compare/checkout-session", response_model=CompareCheckoutSessionCreateResponse)
 def create_compare_checkout_session(
     payload: CompareCheckoutSessionCreateRequest,
     current_user: dict[str, Any] = Depends(require_current_user),
@@ -418,12 +483,11 @@ def create_compare_checkout_session(
             )
         except Exception as exc:
             raise HTTPException(status_code=502, detail=f"Stripe customer creation failed: {exc}") from exc
-        customer_data = _as_dict(customer)
-        customer_id = customer_data.get("id")
+        customer_id = _stripe_field(customer, "id")
         if not isinstance(customer_id, str) or not customer_id:
             raise HTTPException(status_code=502, detail="Stripe response missing customer ID.")
         current_user = update_user_billing(
-            settings.auth_db_path,
+            _AUTH_DB_PATH,
             int(current_user["id"]),
             stripe_customer_id=customer_id,
         )
@@ -433,7 +497,7 @@ def create_compare_checkout_session(
             mode="subscription",
             success_url=success_url,
             cancel_url=cancel_url,
-            line_items=_build_compare_line_items(),
+            line_items=_COMPARE_LINE_ITEMS,
             customer=customer_id,
             client_reference_id=str(current_user["id"]),
             allow_promotion_codes=True,
@@ -446,9 +510,8 @@ def create_compare_checkout_session(
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"Stripe checkout session creation failed: {exc}") from exc
 
-    session_data = _as_dict(session)
-    checkout_url = session_data.get("url")
-    checkout_session_id = session_data.get("id")
+    checkout_url = _stripe_field(session, "url")
+    checkout_session_id = _stripe_field(session, "id")
     if not isinstance(checkout_url, str) or not isinstance(checkout_session_id, str):
         raise HTTPException(status_code=502, detail="Stripe response missing checkout URL or session ID.")
 
@@ -458,8 +521,7 @@ def create_compare_checkout_session(
     )
 
 
-@app.post("/billing/compare/confirm", response_model=CompareAccessStatusResponse)
-@app.post("/api/billing/compare/confirm", response_model=CompareAccessStatusResponse)
+@router.post("/billing/compare/confirm", response_model=CompareAccessStatusResponse)
 def confirm_compare_checkout(
     payload: CompareCheckoutConfirmRequest,
     current_user: dict[str, Any] = Depends(require_current_user),
@@ -471,8 +533,7 @@ def confirm_compare_checkout(
     except Exception as exc:
         raise HTTPException(status_code=404, detail=f"Checkout session lookup failed: {exc}") from exc
 
-    session_data = _as_dict(session)
-    customer_id = session_data.get("customer")
+    customer_id = _stripe_field(session, "customer")
     if not isinstance(customer_id, str) or not customer_id:
         raise HTTPException(status_code=400, detail="Checkout session has no customer.")
 
@@ -482,12 +543,12 @@ def confirm_compare_checkout(
 
     if not user_customer_id:
         current_user = update_user_billing(
-            settings.auth_db_path,
+            _AUTH_DB_PATH,
             int(current_user["id"]),
             stripe_customer_id=customer_id,
         )
 
-    subscription_id = session_data.get("subscription")
+    subscription_id = _stripe_field(session, "subscription")
     if not isinstance(subscription_id, str) or not subscription_id:
         return CompareAccessStatusResponse(
             enabled=False,
@@ -502,25 +563,72 @@ def confirm_compare_checkout(
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"Subscription lookup failed: {exc}") from exc
 
-    _, access_response = _sync_user_from_subscription(current_user, _as_dict(subscription))
+    _, access_response = _sync_user_from_subscription(current_user, subscription)
     return access_response
 
 
-@app.get("/billing/compare/access", response_model=CompareAccessStatusResponse)
-@app.get("/api/billing/compare/access", response_model=CompareAccessStatusResponse)
+# Access responses keyed on (user id, updated_at, enabled): any billing or admin write bumps
+# updated_at and expiry flips enabled, so entries go stale only by TTL, never by content.
+_ACCESS_CACHE_TTL_SECONDS = 30.0
+_ACCESS_CACHE_MAX_ENTRIES = 4096
+_ACCESS_CACHE: dict[tuple[int, str, bool], tuple[float, CompareAccessStatusResponse]] = {}
+
+
+def _cached_compare_access_response(user: dict[str, Any]) -> CompareAccessStatusResponse:
+    key = (int(user["id"]), str(user["updated_at"]), bool(user["compare_access_enabled"]))
+    now = time.monotonic()
+    cached = _ACCESS_CACHE.get(key)
+    if cached is not None and now - cached[0] < _ACCESS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    access_response = _build_compare_access_response(user)
+    if len(_ACCESS_CACHE) >= _ACCESS_CACHE_MAX_ENTRIES:
+        _ACCESS_CACHE.clear()
+    _ACCESS_CACHE[key] = (now, access_response)
+    return access_response
+
+
+@router.get("/billing/compare/access", response_model=CompareAccessStatusResponse)
 def get_compare_access_status(current_user: dict[str, Any] = Depends(require_current_user)) -> CompareAccessStatusResponse:
-    return _build_compare_access_response(current_user)
+    return _cached_compare_access_response(current_user)
+
+
+# Simulation bodies go through pydantic-core's fused JSON parse + validate rather than FastAPI's
+# json.loads -> dict -> validate; large region_id grids make the intermediate dict expensive.
+_SIMULATION_REQUEST_SCHEMA = SimulationRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+_SIMULATION_REQUEST_DEFS = _SIMULATION_REQUEST_SCHEMA.pop("$defs", {})
 
 
-@app.post("/simulate", response_model=SimulationResponse)
-@app.post("/api/simulate", response_model=SimulationResponse)
+async def _parse_simulation_request(http_request: Request) -> SimulationRequest:
+    body = await http_request.body()
+    try:
+        return SimulationRequest.model_validate_json(body)
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body) from exc
+
+
+@router.post(
+    "/simulate",
+    response_model=SimulationResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _SIMULATION_REQUEST_SCHEMA}},
+        }
+    },
+)
 async def simulate(
-    request: SimulationRequest, mode: Literal["stub", "poisson_v1"] = "stub"
-) -> SimulationResponse:
+    request: SimulationRequest = Depends(_parse_simulation_request),
+    mode: Literal["stub", "poisson_v1"] = "stub",
+) -> SimulationResponse | Response:
     """Run a stubbed or Poisson-based axisymmetric r-z simulation and return results."""
+    # A per-request borrower token keeps release exact even if the waiter is cancelled.
+    limiter_token = object()
     try:
-        await asyncio.wait_for(SIM_SEMAPHORE.acquire(), timeout=SIM_QUEUE_WAIT_SECONDS)
-    except asyncio.TimeoutError:
+        with anyio.fail_after(SIM_QUEUE_WAIT_SECONDS):
+            await SIM_LIMITER.acquire_on_behalf_of(limiter_token)
+    except TimeoutError:
         raise HTTPException(
             status_code=429,
             detail=(
@@ -534,16 +642,16 @@ async def simulate(
         if not request.geometry.axisymmetric:
             raise HTTPException(status_code=400, detail="Only axisymmetric r-z geometry is supported.")
 
-        coord = request.geometry.coordinate_system.strip().lower()
-        if coord not in {"r-z", "rz", "r_z", "r/z"}:
+        if request.geometry.coordinate_system.strip().lower() not in _RZ_COORDINATE_SYSTEMS:
             raise HTTPException(status_code=400, detail="Only axisymmetric r-z geometry is supported.")
 
         request_id = request.meta.request_id or str(uuid4())
 
         if mode == "poisson_v1":
             try:
+                loop = asyncio.get_running_loop()
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(run_simulation_poisson_v1, request, request_id),
+                    loop.run_in_executor(_get_sim_pool(), run_simulation_poisson_v1, request, request_id),
                     timeout=SIM_TIMEOUT_SECONDS,
                 )
             except asyncio.TimeoutError:
@@ -554,11 +662,15 @@ async def simulate(
         else:
             result = run_simulation_stub(request, request_id)
 
-        payload = result.model_dump(mode="json", exclude_none=True)
-        size_bytes, json_bytes = _estimate_json_size(payload)
+        if request.outputs is not None and request.outputs.compact:
+            result = compact_result(result)
+
+        size_bytes, json_bytes = _estimate_json_size(result)
 
         if size_bytes > settings.inline_max_bytes:
             stored = store.store_bytes(json_bytes, request_id=request_id)
+            # Drop the encoded payload before building the envelope; only metadata is returned.
+            del json_bytes
             storage = StorageInfo(
                 backend=stored.backend,
                 url=stored.url,
@@ -577,42 +689,71 @@ async def simulate(
             )
 
         storage = StorageInfo(backend="inline", url=None, bucket=None, key=None, local_path=None, expires_in=None)
-        return SimulationResponse(
+        envelope = SimulationResponse(
             request_id=request_id,
             stored=False,
             size_bytes=size_bytes,
-            result=result,
+            result=None,
             result_url=None,
             storage=storage,
         )
+        del json_bytes
+        return _inline_simulation_response(envelope, result)
     finally:
-        SIM_SEMAPHORE.release()
+        SIM_LIMITER.release_on_behalf_of(limiter_token)
 
 
-def _resolve_result_path(result_path: str) -> Path:
-    base_dir = Path(settings.local_storage_dir).resolve()
-    candidate = (base_dir / result_path).resolve()
-    try:
-        candidate.relative_to(base_dir)
-    except ValueError:
+# The storage root never changes, so resolve it once instead of on every results fetch.
+_RESULTS_BASE = os.path.realpath(settings.local_storage_dir) + os.sep
+
+
+@lru_cache(maxsize=1024)
+def _contained_result_path(result_path: str) -> str:
+    candidate = os.path.realpath(os.path.join(_RESULTS_BASE, result_path))
+    if not candidate.startswith(_RESULTS_BASE):
         raise HTTPException(status_code=400, detail="Invalid result path.")
-    if not candidate.is_file():
-        raise HTTPException(status_code=404, detail="Result not found.")
     return candidate
 
 
-@app.get("/results/{result_path:path}")
-@app.get("/api/results/{result_path:path}")
+def _resolve_result_path(result_path: str) -> Path:
+    # Clients poll the same result repeatedly; only the existence check is left uncached.
+    candidate = _contained_result_path(result_path)
+    if not os.path.isfile(candidate):
+        raise HTTPException(status_code=404, detail="Result not found.")
+    return Path(candidate)
+
+
+@router.get("/results/{result_path:path}")
 def get_result(result_path: str) -> FileResponse:
     file_path = _resolve_result_path(result_path)
     return FileResponse(file_path, media_type="application/json", filename=file_path.name)
 
 
+app.include_router(router)
+app.include_router(router, prefix="/api")
+
+
+def _openapi() -> dict[str, Any]:
+    # The simulate body is parsed by hand, so register the request models' schemas ourselves.
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, definition in _SIMULATION_REQUEST_DEFS.items():
+            components.setdefault(name, definition)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
+_HERE = Path(__file__).parent.resolve()
+
+
+@lru_cache(maxsize=1)
 def _resolve_frontend_dist() -> Path | None:
-    base_dir = Path(__file__).resolve().parent
     candidates = [
-        base_dir / "frontend" / "dist",
-        base_dir.parent / "frontend" / "dist",
+        _HERE / "frontend" / "dist",
+        _HERE.parent / "frontend" / "dist",
     ]
     for candidate in candidates:
         if candidate.is_dir():
@@ -2,15 +2,50 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Literal
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+import math
+from operator import attrgetter
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Literal, Tuple, Union
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 
 class AppBaseModel(BaseModel):
-    """Base model with strict field handling."""
+    """Base model with strict field handling.
+
+    Request models are read-only once validated; services never mutate them.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
+
+
+# Surface/target tag names: compiled once into pydantic-core's strip + min-length check.
+NonEmptyTag = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+# Optional tags treat blank strings as "not set".
+OptionalTag = Annotated[str, StringConstraints(strip_whitespace=True), AfterValidator(lambda value: value or None)]
 
-    model_config = ConfigDict(extra="forbid")
+
+class ResponseBaseModel(BaseModel):
+    """Base model for server-built simulation output; unknown keys are ignored, not rejected."""
+
+    model_config = ConfigDict(extra="ignore")
 
 
 class Meta(AppBaseModel):
@@ -46,6 +81,9 @@ RegionLegendValue = Literal[
 ]
 
 
+_DENSE_LEGEND_MAX_ID = 4096
+
+
 class GeometryGrid(AppBaseModel):
     """Frontend-rasterized geometry mask grid."""
 
@@ -56,29 +94,57 @@ class GeometryGrid(AppBaseModel):
     region_legend: Dict[int, RegionLegendValue]
     tag_mask: Optional[Dict[str, List[List[bool]]]] = Field(default=None)
 
+    def region_type_rows(self) -> List[List[str]]:
+        """Return the legend region type of every cell as [nz][nr] rows."""
+        legend = self.region_legend
+        lookup = legend.__getitem__
+        if legend and min(legend) >= 0 and max(legend) < _DENSE_LEGEND_MAX_ID:
+            # Small non-negative ids (the frontend emits 0..4): index a dense table instead of hashing.
+            table: List[Optional[str]] = [None] * (max(legend) + 1)
+            for region_value, region_type in legend.items():
+                table[region_value] = region_type
+            lookup = table.__getitem__
+        return [list(map(lookup, row)) for row in self.region_id]
+
+    def region_array(self) -> Any:
+        """Return region_id as an (nz, nr) int64 array, or None without numpy or on int64 overflow."""
+        if np is None:
+            return None
+        try:
+            return np.asarray(self.region_id, dtype=np.int64)
+        except OverflowError:
+            return None
+
     @staticmethod
     def _validate_mask_shape(name: str, mask: List[List[bool]], nz: int, nr: int) -> None:
-        if len(mask) != nz:
+        if len(mask) != nz or not all(len(row) == nr for row in mask):
             raise ValueError(f"{name} must have shape [nz][nr]")
-        for row in mask:
-            if len(row) != nr:
-                raise ValueError(f"{name} must have shape [nz][nr]")
+
+    def _first_unknown_region_id(self) -> Optional[int]:
+        legend_keys = set(self.region_legend.keys())
+        region_arr = self.region_array()
+        if region_arr is not None:
+            known = np.isin(region_arr, [key for key in legend_keys if -(2**63) <= key < 2**63])
+            if known.all():
+                return None
+            return int(region_arr[~known][0])
+
+        # Compare the handful of distinct ids, not every cell, against the legend.
+        missing = set().union(*self.region_id) - legend_keys
+        if not missing:
+            return None
+        return next(value for row in self.region_id for value in row if value in missing)
 
     @model_validator(mode="after")
     def validate_grid(self) -> "GeometryGrid":
-        if len(self.region_id) != self.nz:
+        if len(self.region_id) != self.nz or not all(len(row) == self.nr for row in self.region_id):
             raise ValueError("geometry.grid.region_id must have shape [nz][nr]")
-        for row in self.region_id:
-            if len(row) != self.nr:
-                raise ValueError("geometry.grid.region_id must have shape [nz][nr]")
 
-        legend_keys = set(self.region_legend.keys())
-        for row in self.region_id:
-            for region_value in row:
-                if region_value not in legend_keys:
-                    raise ValueError(
-                        f"geometry.grid.region_id contains unknown id {region_value} not in region_legend"
-                    )
+        unknown_id = self._first_unknown_region_id()
+        if unknown_id is not None:
+            raise ValueError(
+                f"geometry.grid.region_id contains unknown id {unknown_id} not in region_legend"
+            )
 
         if self.tag_mask is not None:
             for tag, mask in self.tag_mask.items():
@@ -95,20 +161,25 @@ class Geometry(AppBaseModel):
     axisymmetric: bool = Field(default=True)
     coordinate_system: str = Field(default="r-z")
     domain: GeometryDomain
-    tags: Optional[List[str]] = Field(default=None)
+    tags: Optional[List[NonEmptyTag]] = Field(default=None)
     grid: Optional[GeometryGrid] = Field(default=None)
 
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, value: Optional[List[str]]) -> Optional[List[str]]:
-        if value is None:
-            return value
-        cleaned: List[str] = []
-        for tag in value:
-            if not isinstance(tag, str) or not tag.strip():
-                raise ValueError("geometry.tags entries must be non-empty strings")
-            cleaned.append(tag.strip())
-        return cleaned
+
+class PlasmaSource(AppBaseModel):
+    """Per-source RF drive configuration for multi-source excitation."""
+
+    name: Optional[str] = Field(default=None)
+    surface_tag: Optional[OptionalTag] = Field(default=None)
+    rf_power_W: float = Field(ge=0)
+    frequency_Hz: float = Field(gt=0)
+    phase_deg: float = Field(default=0.0, ge=-360.0, le=360.0)
+
+
+class DCBiasRegion(AppBaseModel):
+    """Per-tag DC bias override in volts."""
+
+    target_tag: NonEmptyTag
+    dc_bias_V: float = Field(default=0.0, ge=-5000.0, le=5000.0)
 
 
 class Process(AppBaseModel):
@@ -118,8 +189,8 @@ class Process(AppBaseModel):
     rf_power_W: float = Field(ge=0)
     frequency_Hz: float = Field(gt=0)
     dc_bias_V: float = Field(default=0.0, ge=-5000.0, le=5000.0)
-    rf_sources: Optional[List["PlasmaSource"]] = Field(default=None, max_length=3)
-    dc_bias_regions: Optional[List["DCBiasRegion"]] = Field(default=None, max_length=64)
+    rf_sources: Optional[List[PlasmaSource]] = Field(default=None, max_length=3)
+    dc_bias_regions: Optional[List[DCBiasRegion]] = Field(default=None, max_length=64)
 
     @model_validator(mode="after")
     def validate_rf_sources(self) -> "Process":
@@ -134,43 +205,6 @@ class Process(AppBaseModel):
         return self
 
 
-class PlasmaSource(AppBaseModel):
-    """Per-source RF drive configuration for multi-source excitation."""
-
-    name: Optional[str] = Field(default=None)
-    surface_tag: Optional[str] = Field(default=None)
-    rf_power_W: float = Field(ge=0)
-    frequency_Hz: float = Field(gt=0)
-    phase_deg: float = Field(default=0.0, ge=-360.0, le=360.0)
-
-    @field_validator("surface_tag")
-    @classmethod
-    def validate_surface_tag(cls, value: Optional[str]) -> Optional[str]:
-        if value is None:
-            return value
-        trimmed = value.strip()
-        if not trimmed:
-            return None
-        return trimmed
-
-
-class DCBiasRegion(AppBaseModel):
-    """Per-tag DC bias override in volts."""
-
-    target_tag: str
-    dc_bias_V: float = Field(default=0.0, ge=-5000.0, le=5000.0)
-
-    @field_validator("target_tag")
-    @classmethod
-    def validate_target_tag(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("target_tag must be a non-empty string")
-        return value.strip()
-
-
-Process.model_rebuild()
-
-
 class GasComponent(AppBaseModel):
     """One component of the gas mixture."""
 
@@ -187,7 +221,8 @@ class Gas(AppBaseModel):
     def validate_mixture(self) -> "Gas":
         if not self.mixture:
             raise ValueError("gas mixture must include at least one component")
-        total = sum(component.fraction for component in self.mixture)
+        # Compensated summation: the check reflects the fractions sent, not accumulated rounding.
+        total = math.fsum(map(attrgetter("fraction"), self.mixture))
         if abs(total - 1.0) > 1e-6:
             raise ValueError("gas mixture fractions must sum to 1 within 1e-6")
         return self
@@ -197,7 +232,7 @@ class InletSurface(AppBaseModel):
     """Uniform inlet surface definition."""
 
     type: Literal["surface"]
-    surface_tag: str
+    surface_tag: NonEmptyTag
     uniform: bool = Field(default=True)
     total_flow_sccm: float = Field(ge=0)
     direction: Literal[
@@ -209,13 +244,6 @@ class InletSurface(AppBaseModel):
     emit_side: Literal["left", "center", "right"] = Field(default="center")
     active_width_percent: float = Field(default=28.0, ge=5.0, le=100.0)
 
-    @field_validator("surface_tag")
-    @classmethod
-    def validate_surface_tag(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("surface_tag must be a non-empty string")
-        return value.strip()
-
     @field_validator("uniform")
     @classmethod
     def validate_uniform(cls, value: bool) -> bool:
@@ -228,20 +256,13 @@ class OutletSink(AppBaseModel):
     """Outlet sink definition."""
 
     type: Literal["sink"]
-    surface_tag: str
+    surface_tag: NonEmptyTag
     strength: float = Field(default=1.0, ge=0)
     throttle_percent: Optional[float] = Field(default=None, ge=0, le=100)
     conductance_lps: Optional[float] = Field(default=None, ge=0)
     target_pressure_Pa: Optional[float] = Field(default=None, ge=0)
     note: Optional[str] = Field(default=None, max_length=240)
 
-    @field_validator("surface_tag")
-    @classmethod
-    def validate_surface_tag(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("surface_tag must be a non-empty string")
-        return value.strip()
-
     @field_validator("note")
     @classmethod
     def validate_note(cls, value: Optional[str]) -> Optional[str]:
@@ -251,12 +272,19 @@ class OutletSink(AppBaseModel):
         return cleaned or None
 
 
+# Key sets that tell the v1.1 payload layout apart from the legacy one in translate_legacy hooks.
+_LEGACY_FLOW_KEYS = frozenset({"inlet_sccm", "outlet_pressure_Pa"})
+_FLOW_KEYS = frozenset({"inlet", "outlet", "outlets"})
+_LEGACY_MATERIAL_KEYS = frozenset({"epsilon_r", "wall_loss_e"})
+_MATERIAL_KEYS = frozenset({"default", "regions"})
+_POLYLINE_KEYS = frozenset({"polyline_r_mm", "polyline_z_mm"})
+
+
 class FlowBoundary(AppBaseModel):
     """Flow boundary conditions for the chamber."""
 
     inlet: Optional[InletSurface] = Field(default=None)
-    outlet: Optional[OutletSink] = Field(default=None)
-    outlets: Optional[List[OutletSink]] = Field(default=None, max_length=8)
+    outlets: List[OutletSink] = Field(default_factory=list, max_length=8)
     wall_temperature_K: Optional[float] = Field(default=None, gt=0)
 
     @model_validator(mode="before")
@@ -264,9 +292,8 @@ class FlowBoundary(AppBaseModel):
     def translate_legacy(cls, data):
         if not isinstance(data, dict):
             return data
-        legacy_keys = {"inlet_sccm", "outlet_pressure_Pa"}
-        has_legacy = any(key in data for key in legacy_keys)
-        has_new = "inlet" in data or "outlet" in data or "outlets" in data
+        has_legacy = not _LEGACY_FLOW_KEYS.isdisjoint(data)
+        has_new = not _FLOW_KEYS.isdisjoint(data)
         if has_new and has_legacy:
             raise ValueError("flow_boundary must use either v1.1 inlet/outlet or legacy fields")
         if has_legacy:
@@ -284,21 +311,24 @@ class FlowBoundary(AppBaseModel):
                 "emit_side": "center",
                 "active_width_percent": 28.0,
             }
-            outlet = None
+            outlets = []
             if outlet_pressure is not None:
-                outlet = {"type": "sink", "surface_tag": "bottom_pump", "strength": 1.0}
-            return {"inlet": inlet, "outlet": outlet, "outlets": None, "wall_temperature_K": wall_temp}
-        return data
+                outlets.append({"type": "sink", "surface_tag": "bottom_pump", "strength": 1.0})
+            return {"inlet": inlet, "outlets": outlets, "wall_temperature_K": wall_temp}
 
-    @model_validator(mode="after")
-    def validate_definition(self) -> "FlowBoundary":
-        if self.outlet is not None and self.outlets:
+        # The single `outlet` key is still accepted and folded into `outlets`.
+        outlet = data.get("outlet")
+        outlets = data.get("outlets")
+        if outlet is not None and outlets:
             raise ValueError("flow_boundary must use either outlet or outlets, not both")
-        if self.outlets is not None and len(self.outlets) == 0:
+        if isinstance(outlets, list) and not outlets:
             raise ValueError("flow_boundary.outlets must include at least one outlet")
-        if self.inlet is None and self.outlet is None and not self.outlets:
+        if data.get("inlet") is None and outlet is None and not outlets:
             raise ValueError("flow_boundary must define inlet or outlet/outlets")
-        return self
+        if "outlet" in data or outlets is None:
+            data = {key: value for key, value in data.items() if key != "outlet"}
+            data["outlets"] = [outlet] if outlet is not None else []
+        return data
 
 
 class MaterialProps(AppBaseModel):
@@ -311,17 +341,10 @@ class MaterialProps(AppBaseModel):
 class MaterialRegionOverride(AppBaseModel):
     """Per-region material overrides."""
 
-    target_tag: str
+    target_tag: NonEmptyTag
     epsilon_r: Optional[float] = Field(default=None, gt=0)
     wall_loss_e: Optional[float] = Field(default=None, ge=0, le=1)
 
-    @field_validator("target_tag")
-    @classmethod
-    def validate_target_tag(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("target_tag must be a non-empty string")
-        return value.strip()
-
     @model_validator(mode="after")
     def validate_override(self) -> "MaterialRegionOverride":
         if self.epsilon_r is None and self.wall_loss_e is None:
@@ -341,8 +364,8 @@ class MaterialConfig(AppBaseModel):
     def translate_legacy(cls, data):
         if not isinstance(data, dict):
             return data
-        has_legacy = "epsilon_r" in data or "wall_loss_e" in data
-        has_new = "default" in data or "regions" in data
+        has_legacy = not _LEGACY_MATERIAL_KEYS.isdisjoint(data)
+        has_new = not _MATERIAL_KEYS.isdisjoint(data)
         if has_new and has_legacy:
             raise ValueError("material must use either v1.1 default/regions or legacy fields")
         if has_legacy:
@@ -390,6 +413,10 @@ class OutputSelection(AppBaseModel):
         ),
     )
     sheath: bool = Field(default=True)
+    compact: bool = Field(
+        default=False,
+        description="Return 2D fields as uint8-quantized base64 payloads instead of float lists.",
+    )
 
 
 class SimulationRequest(AppBaseModel):
@@ -405,6 +432,21 @@ class SimulationRequest(AppBaseModel):
     baseline: Baseline
     outputs: Optional[OutputSelection] = Field(default=None)
 
+    def _tag_references(self) -> Iterator[Tuple[str, str]]:
+        """Yield (field path, tag) for every surface/target tag the request refers to."""
+        flow_boundary = self.flow_boundary
+        if flow_boundary.inlet is not None:
+            yield "flow_boundary.inlet.surface_tag", flow_boundary.inlet.surface_tag
+        for index, outlet in enumerate(flow_boundary.outlets):
+            yield f"flow_boundary.outlets[{index}].surface_tag", outlet.surface_tag
+        for index, region in enumerate(self.material.regions):
+            yield f"material.regions[{index}].target_tag", region.target_tag
+        for index, source in enumerate(self.process.rf_sources or ()):
+            if source.surface_tag is not None:
+                yield f"process.rf_sources[{index}].surface_tag", source.surface_tag
+        for index, region in enumerate(self.process.dc_bias_regions or ()):
+            yield f"process.dc_bias_regions[{index}].target_tag", region.target_tag
+
     @model_validator(mode="after")
     def validate_tag_consistency(self) -> "SimulationRequest":
         if self.geometry.grid is not None:
@@ -417,56 +459,25 @@ class SimulationRequest(AppBaseModel):
         if tags is None:
             return self
         tag_set = set(tags)
-        if self.flow_boundary.inlet is not None:
-            inlet_tag = self.flow_boundary.inlet.surface_tag
-            if inlet_tag not in tag_set:
-                raise ValueError(f"flow_boundary.inlet.surface_tag '{inlet_tag}' not found in geometry.tags")
-        if self.flow_boundary.outlet is not None:
-            outlet_tag = self.flow_boundary.outlet.surface_tag
-            if outlet_tag not in tag_set:
-                raise ValueError(f"flow_boundary.outlet.surface_tag '{outlet_tag}' not found in geometry.tags")
-        if self.flow_boundary.outlets is not None:
-            for index, outlet in enumerate(self.flow_boundary.outlets):
-                outlet_tag = outlet.surface_tag
-                if outlet_tag not in tag_set:
-                    raise ValueError(
-                        f"flow_boundary.outlets[{index}].surface_tag '{outlet_tag}' not found in geometry.tags"
-                    )
-        for index, region in enumerate(self.material.regions):
-            target_tag = region.target_tag
-            if target_tag not in tag_set:
-                raise ValueError(
-                    f"material.regions[{index}].target_tag '{target_tag}' not found in geometry.tags"
-                )
-        if self.process.rf_sources is not None:
-            for index, source in enumerate(self.process.rf_sources):
-                source_tag = source.surface_tag
-                if source_tag is not None and source_tag not in tag_set:
-                    raise ValueError(
-                        f"process.rf_sources[{index}].surface_tag '{source_tag}' not found in geometry.tags"
-                    )
-        if self.process.dc_bias_regions is not None:
-            for index, region in enumerate(self.process.dc_bias_regions):
-                target_tag = region.target_tag
-                if target_tag not in tag_set:
-                    raise ValueError(
-                        f"process.dc_bias_regions[{index}].target_tag '{target_tag}' not found in geometry.tags"
-                    )
+        missing = next(((path, tag) for path, tag in self._tag_references() if tag not in tag_set), None)
+        if missing is not None:
+            raise ValueError(f"{missing[0]} '{missing[1]}' not found in geometry.tags")
         if self.geometry.grid is not None and self.geometry.grid.tag_mask is not None:
-            for tag in self.geometry.grid.tag_mask.keys():
-                if tag not in tag_set:
-                    raise ValueError(f"geometry.grid.tag_mask['{tag}'] not found in geometry.tags")
+            unknown_mask_tags = self.geometry.grid.tag_mask.keys() - tag_set
+            if unknown_mask_tags:
+                tag = next(tag for tag in self.geometry.grid.tag_mask if tag in unknown_mask_tags)
+                raise ValueError(f"geometry.grid.tag_mask['{tag}'] not found in geometry.tags")
         return self
 
 
-class GeometryGridSummary(AppBaseModel):
+class GeometryGridSummary(ResponseBaseModel):
     """Summary counts derived from the geometry grid."""
 
     region_type_counts: Dict[str, int]
     tag_counts: Optional[Dict[str, int]] = Field(default=None)
 
 
-class NeSolverMetadata(AppBaseModel):
+class NeSolverMetadata(ResponseBaseModel):
     """Metadata for the electron density solver."""
 
     method: str
@@ -485,7 +496,7 @@ class NeSolverMetadata(AppBaseModel):
     warnings: List[str] = Field(default_factory=list)
 
 
-class InsightSummary(AppBaseModel):
+class InsightSummary(ResponseBaseModel):
     """Summary statistics for sheath insights."""
 
     e_on_sheath_mean: Optional[float] = Field(default=None)
@@ -499,7 +510,7 @@ class InsightSummary(AppBaseModel):
     thickness_max_mm: Optional[float] = Field(default=None)
 
 
-class SheathInsights(AppBaseModel):
+class SheathInsights(ResponseBaseModel):
     """1D insight curves for sheath and near-sheath fields."""
 
     r_mm: List[float]
@@ -511,7 +522,7 @@ class SheathInsights(AppBaseModel):
     warnings: List[str] = Field(default_factory=list)
 
 
-class VizCurves(AppBaseModel):
+class VizCurves(ResponseBaseModel):
     """Plot-ready 1D curves for visualization."""
 
     r_mm: List[float]
@@ -522,7 +533,7 @@ class VizCurves(AppBaseModel):
     warnings: List[str] = Field(default_factory=list)
 
 
-class IonProxyCurves(AppBaseModel):
+class IonProxyCurves(ResponseBaseModel):
     """Proxy ion curves derived from phi and ne for plotting."""
 
     ion_energy_proxy_rel_by_r: Optional[List[float]] = Field(default=None)
@@ -533,7 +544,7 @@ class IonProxyCurves(AppBaseModel):
 
 
 
-class SimulationMetadata(AppBaseModel):
+class SimulationMetadata(ResponseBaseModel):
     """Echoed inputs and derived metadata."""
 
     request_id: str
@@ -548,36 +559,69 @@ class SimulationMetadata(AppBaseModel):
     ne_solver: Optional[NeSolverMetadata] = Field(default=None)
 
 
-class Grid(AppBaseModel):
+class Grid(ResponseBaseModel):
     """Grid coordinates for the simulation."""
 
     r_mm: List[float]
     z_mm: List[float]
 
 
-class FieldGrid(AppBaseModel):
+class QuantizedField(ResponseBaseModel):
+    """A [nz][nr] field packed as row-major uint8 codes; value = zero + scale * code."""
+
+    dtype: Literal["uint8"] = Field(default="uint8")
+    shape: Tuple[int, int]
+    zero: float
+    scale: float
+    data_b64: str
+
+
+FieldValues = Union[List[List[float]], QuantizedField]
+
+
+class FieldGrid(ResponseBaseModel):
     """Plasma fields on the grid."""
 
-    E_mag: Optional[List[List[float]]] = Field(default=None)
-    ne: Optional[List[List[float]]] = Field(default=None)
-    volume_loss_density: Optional[List[List[float]]] = Field(
+    E_mag: Optional[FieldValues] = Field(default=None)
+    ne: Optional[FieldValues] = Field(default=None)
+    volume_loss_density: Optional[FieldValues] = Field(
         default=None,
         description=(
             "Backward-compatible key for geometry-local per-volume absorbed power density "
             "proxy field (relative)."
         ),
     )
-    emission: Optional[List[List[float]]] = Field(default=None)
+    emission: Optional[FieldValues] = Field(default=None)
 
 
-class Sheath(AppBaseModel):
-    """Sheath contour and optional mask."""
+class Sheath(ResponseBaseModel):
+    """Sheath contour as parallel r/z coordinate lists, plus an optional mask."""
 
-    polyline_mm: List[Point2D]
+    polyline_r_mm: List[float]
+    polyline_z_mm: List[float]
     mask: Optional[List[List[bool]]] = Field(default=None)
 
+    @model_validator(mode="before")
+    @classmethod
+    def translate_legacy(cls, data):
+        if not isinstance(data, dict) or "polyline_mm" not in data:
+            return data
+        if not _POLYLINE_KEYS.isdisjoint(data):
+            raise ValueError("sheath must use either polyline_r_mm/polyline_z_mm or legacy polyline_mm")
+        translated = dict(data)
+        points = [Point2D.model_validate(point) for point in translated.pop("polyline_mm")]
+        translated["polyline_r_mm"] = [point.r_mm for point in points]
+        translated["polyline_z_mm"] = [point.z_mm for point in points]
+        return translated
+
+    @model_validator(mode="after")
+    def validate_polyline(self) -> "Sheath":
+        if len(self.polyline_r_mm) != len(self.polyline_z_mm):
+            raise ValueError("sheath.polyline_r_mm and sheath.polyline_z_mm must have the same length")
+        return self
+
 
-class SheathMetrics(AppBaseModel):
+class SheathMetrics(ResponseBaseModel):
     """Derived sheath diagnostics for insight views."""
 
     z_mm_by_r: List[float]
@@ -593,7 +637,7 @@ class SheathMetrics(AppBaseModel):
 
 
 
-class Compare(AppBaseModel):
+class Compare(ResponseBaseModel):
     """Baseline comparison outputs."""
 
     enabled: bool
@@ -604,7 +648,7 @@ class Compare(AppBaseModel):
     delta_ion_proxy: Optional[IonProxyCurves] = Field(default=None)
 
 
-class SimulationResult(AppBaseModel):
+class SimulationResult(ResponseBaseModel):
     """Full simulation output payload."""
 
     metadata: SimulationMetadata
@@ -618,10 +662,10 @@ class SimulationResult(AppBaseModel):
     compare: Optional[Compare] = Field(default=None)
 
 
-class StorageInfo(AppBaseModel):
+class StorageInfo(ResponseBaseModel):
     """Storage information for large results."""
 
-    backend: str
+    backend: Literal["inline", "local", "s3"]
     url: Optional[str] = Field(default=None)
     bucket: Optional[str] = Field(default=None)
     key: Optional[str] = Field(default=None)
@@ -629,7 +673,7 @@ class StorageInfo(AppBaseModel):
     expires_in: Optional[int] = Field(default=None)
 
 
-class SimulationResponse(AppBaseModel):
+class SimulationResponse(ResponseBaseModel):
     """API response for simulation requests."""
 
     request_id: str
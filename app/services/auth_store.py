@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import hashlib
+import hmac
 from pathlib import Path
 import secrets
 import sqlite3
-from typing import Any
+import threading
+import time
+from typing import Any, Iterator
+import weakref
 
 
 ALLOWED_ROLES = {"user", "admin"}
@@ -35,57 +41,138 @@ def parse_utc_iso(value: str | None) -> datetime | None:
     return parsed.astimezone(timezone.utc)
 
 
+# Entry points normalize the same address several times per call (validate, look up, insert).
+@lru_cache(maxsize=2048)
 def _normalize_email(email: str) -> str:
     return email.strip().lower()
 
 
-def _connect(db_path: str) -> sqlite3.Connection:
-    connection = sqlite3.connect(db_path)
+# One long-lived connection per (thread, database file) so WAL readers never queue behind each other.
+_LOCAL = threading.local()
+_CONNECTION_PRAGMAS = """
+PRAGMA foreign_keys = ON;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -20000;
+PRAGMA busy_timeout = 5000;
+"""
+
+
+class _ThreadConnections(dict):
+    """A thread's {db_path: connection} map; a dict subclass so it can be weakly referenced."""
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    # isolation_level=None leaves transaction control to _connect (BEGIN IMMEDIATE for writes).
+    connection = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, cached_statements=256)
     connection.row_factory = sqlite3.Row
-    connection.execute("PRAGMA foreign_keys = ON")
+    # Per-connection settings, applied once when this thread first opens the database;
+    # journal_mode=WAL is set once in init_auth_db since it persists in the file.
+    connection.executescript(_CONNECTION_PRAGMAS)
     return connection
 
 
+def _thread_connection(db_path: str) -> sqlite3.Connection:
+    connections: _ThreadConnections | None = getattr(_LOCAL, "connections", None)
+    if connections is None:
+        connections = _LOCAL.connections = _ThreadConnections()
+    connection = connections.get(db_path)
+    if connection is None:
+        connection = connections[db_path] = _open_connection(db_path)
+        # Close it once the owning thread exits and drops its map (worker threads are
+        # retired when idle), or at interpreter exit for threads still alive then.
+        weakref.finalize(connections, connection.close)
+    return connection
+
+
+@contextmanager
+def _connect(db_path: str, *, write: bool = False) -> Iterator[sqlite3.Connection]:
+    """Yield this thread's connection for `db_path`.
+
+    Reads run in autocommit mode. With `write=True` the block runs inside
+    BEGIN IMMEDIATE, so the write lock is taken up front and the block
+    commits on success or rolls back on error.
+    """
+    connection = _thread_connection(db_path)
+    if not write:
+        yield connection
+        return
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+    if connection.in_transaction:
+        connection.execute("COMMIT")
+
+
 def _column_names(connection: sqlite3.Connection, table_name: str) -> set[str]:
     rows = connection.execute(f"PRAGMA table_info({table_name})").fetchall()
     return {str(row["name"]) for row in rows}
 
 
+_SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL UNIQUE,
+        password_hash TEXT NOT NULL,
+        role TEXT NOT NULL DEFAULT 'user',
+        compare_access_enabled INTEGER NOT NULL DEFAULT 0,
+        compare_access_expires_at TEXT,
+        stripe_customer_id TEXT,
+        stripe_subscription_id TEXT,
+        stripe_subscription_status TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        token_hash BLOB NOT NULL UNIQUE,
+        created_at INTEGER NOT NULL,
+        last_seen_at INTEGER NOT NULL,
+        expires_at INTEGER NOT NULL,
+        FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_stripe_customer_id ON users(stripe_customer_id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_stripe_subscription_id ON users(stripe_subscription_id)",
+)
+
+
+# Emails are stored normalized; lookups match lower(email) so legacy mixed-case rows still resolve.
+_SQL_CASE_DUPLICATE_EMAILS = "SELECT lower(email) FROM users GROUP BY 1 HAVING count(*) > 1 LIMIT 1"
+
+
+def _create_email_lookup_index(connection: sqlite3.Connection) -> None:
+    """Index lower(email), uniquely unless older code left case-variant duplicate rows.
+
+    A unique index over such rows would fail and keep the app from starting, so those databases
+    get a plain index and rely on create_user's duplicate check until the rows are merged.
+    """
+    if connection.execute(_SQL_CASE_DUPLICATE_EMAILS).fetchone() is not None:
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_users_email_lower_nonunique ON users(lower(email))")
+        return
+    connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_lower ON users(lower(email))")
+    connection.execute("DROP INDEX IF EXISTS idx_users_email_lower_nonunique")
+
+
 def init_auth_db(db_path: str) -> None:
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     with _connect(db_path) as connection:
-        connection.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT NOT NULL UNIQUE,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL DEFAULT 'user',
-                compare_access_enabled INTEGER NOT NULL DEFAULT 0,
-                compare_access_expires_at TEXT,
-                stripe_customer_id TEXT,
-                stripe_subscription_id TEXT,
-                stripe_subscription_status TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                token_hash TEXT NOT NULL UNIQUE,
-                created_at TEXT NOT NULL,
-                last_seen_at TEXT NOT NULL,
-                expires_at TEXT NOT NULL,
-                FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
-            CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_users_stripe_customer_id ON users(stripe_customer_id);
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_users_stripe_subscription_id ON users(stripe_subscription_id);
-            """
-        )
+        # WAL lets readers proceed while a session write is in flight; the mode persists in the file.
+        connection.execute("PRAGMA journal_mode = WAL")
+    with _connect(db_path, write=True) as connection:
+        # executescript would COMMIT the BEGIN IMMEDIATE first, so run each statement on its own.
+        for statement in _SCHEMA_SQL:
+            connection.execute(statement)
+        _create_email_lookup_index(connection)
 
         user_columns = _column_names(connection, "users")
         required_user_columns = {
@@ -103,13 +190,88 @@ def init_auth_db(db_path: str) -> None:
 
         session_columns = _column_names(connection, "sessions")
         required_session_columns = {
-            "last_seen_at": "TEXT",
-            "expires_at": "TEXT",
+            "last_seen_at": "INTEGER",
+            "expires_at": "INTEGER",
         }
         for column_name, column_ddl in required_session_columns.items():
             if column_name not in session_columns:
                 connection.execute(f"ALTER TABLE sessions ADD COLUMN {column_name} {column_ddl}")
 
+    # Older databases stored token_hash as 64-char hex TEXT; rewrite those rows as 32-byte BLOBs.
+    with _connect(db_path, write=True) as connection:
+        hex_rows = connection.execute(
+            "SELECT id, token_hash FROM sessions WHERE typeof(token_hash) = 'text'"
+        ).fetchall()
+        connection.executemany(
+            "UPDATE sessions SET token_hash = ? WHERE id = ?",
+            [(bytes.fromhex(row["token_hash"]), row["id"]) for row in hex_rows],
+        )
+
+    with _connect(db_path, write=True) as connection:
+        _migrate_session_timestamps(connection)
+        for statement in _SESSION_INDEXES_SQL:
+            connection.execute(statement)
+
+
+_SESSION_INDEXES_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at)",
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_token_cover
+        ON sessions(token_hash, user_id, expires_at, last_seen_at)
+    """,
+)
+
+
+def _iso_to_epoch(value: Any) -> int:
+    parsed = parse_utc_iso(value) if isinstance(value, str) else None
+    return int(parsed.timestamp()) if parsed is not None else 0
+
+
+def _migrate_session_timestamps(connection: sqlite3.Connection) -> None:
+    """Rebuild a sessions table whose timestamps are ISO TEXT into INTEGER epoch seconds.
+
+    Column affinity cannot be altered in place (a TEXT column would store the integers as
+    text), so the table is copied. Unparseable expiries become 0 and read as expired.
+    """
+    rows = connection.execute("PRAGMA table_info(sessions)").fetchall()
+    if {str(row["name"]): str(row["type"]).upper() for row in rows}.get("created_at") == "INTEGER":
+        return
+    sessions = connection.execute(
+        "SELECT id, user_id, token_hash, created_at, last_seen_at, expires_at FROM sessions"
+    ).fetchall()
+    connection.execute("DROP TABLE sessions")
+    connection.execute(
+        """
+        CREATE TABLE sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            token_hash BLOB NOT NULL UNIQUE,
+            created_at INTEGER NOT NULL,
+            last_seen_at INTEGER NOT NULL,
+            expires_at INTEGER NOT NULL,
+            FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+        """
+    )
+    converted = []
+    for row in sessions:
+        created_at = _iso_to_epoch(row["created_at"])
+        converted.append(
+            (
+                row["id"],
+                row["user_id"],
+                row["token_hash"],
+                created_at,
+                _iso_to_epoch(row["last_seen_at"]) or created_at,
+                _iso_to_epoch(row["expires_at"]),
+            )
+        )
+    connection.executemany(
+        "INSERT INTO sessions (id, user_id, token_hash, created_at, last_seen_at, expires_at) VALUES (?, ?, ?, ?, ?, ?)",
+        converted,
+    )
+
 
 def _hash_password(password: str, salt_hex: str | None = None) -> str:
     salt = bytes.fromhex(salt_hex) if salt_hex else secrets.token_bytes(16)
@@ -138,8 +300,8 @@ def _verify_password(password: str, encoded_hash: str) -> bool:
     return secrets.compare_digest(digest, digest_hex)
 
 
-def _session_hash(token: str) -> str:
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+def _session_hash(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
 
 def _is_compare_access_active(raw_enabled: bool, expires_at: str | None) -> bool:
@@ -153,23 +315,113 @@ def _is_compare_access_active(raw_enabled: bool, expires_at: str | None) -> bool
     return expires_dt > utc_now()
 
 
+# Columns read by _user_row_to_dict; queries name them explicitly so password_hash is only
+# decoded where it is checked.
+_USER_COLUMN_NAMES = (
+    "id",
+    "email",
+    "role",
+    "compare_access_enabled",
+    "compare_access_expires_at",
+    "stripe_customer_id",
+    "stripe_subscription_id",
+    "stripe_subscription_status",
+    "created_at",
+    "updated_at",
+)
+_USER_COLUMNS = ", ".join(_USER_COLUMN_NAMES)
+_USER_COLUMN_COUNT = len(_USER_COLUMN_NAMES)
+_USER_COLUMNS_WITH_HASH = f"{_USER_COLUMNS}, password_hash"
+_SESSION_USER_COLUMNS = ", ".join(f"u.{name}" for name in _USER_COLUMN_NAMES)
+
+# Hot-path statements, built once so every call hits the connection's prepared-statement cache.
+_SQL_GET_USER_BY_ID = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+_SQL_GET_USER_BY_EMAIL = f"SELECT {_USER_COLUMNS} FROM users WHERE lower(email) = ?"
+_SQL_GET_USER_WITH_HASH_BY_EMAIL = f"SELECT {_USER_COLUMNS_WITH_HASH} FROM users WHERE lower(email) = ?"
+_SQL_GET_USER_ID_BY_EMAIL = "SELECT id FROM users WHERE lower(email) = ?"
+_SQL_GET_USER_BY_STRIPE_CUSTOMER_ID = f"SELECT {_USER_COLUMNS} FROM users WHERE stripe_customer_id = ?"
+_SQL_LIST_USERS = f"SELECT {_USER_COLUMNS} FROM users ORDER BY created_at DESC, id DESC"
+_SQL_INSERT_USER = """
+INSERT INTO users (
+    email,
+    password_hash,
+    role,
+    compare_access_enabled,
+    compare_access_expires_at,
+    stripe_customer_id,
+    stripe_subscription_id,
+    stripe_subscription_status,
+    created_at,
+    updated_at
+)
+VALUES (?, ?, ?, 0, NULL, NULL, NULL, NULL, ?, ?)
+"""
+# Writes hand back the stored row in the same statement where SQLite supports RETURNING (3.35+);
+# older libraries fall back to re-reading the user by id.
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RETURNING_USER = f" RETURNING {_USER_COLUMNS}" if _SUPPORTS_RETURNING else ""
+_SQL_SESSION_LOOKUP = f"""
+SELECT {_SESSION_USER_COLUMNS},
+    s.id AS session_id, s.expires_at AS session_expires_at, s.last_seen_at AS session_last_seen_at
+FROM sessions s
+JOIN users u ON u.id = s.user_id
+WHERE s.token_hash = ?
+"""
+_SQL_INSERT_SESSION = """
+INSERT INTO sessions (user_id, token_hash, created_at, last_seen_at, expires_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_SESSION_BY_TOKEN = "DELETE FROM sessions WHERE token_hash = ?"
+_SQL_DELETE_SESSION_BY_ID = "DELETE FROM sessions WHERE id = ?"
+_SQL_DELETE_EXPIRED_SESSIONS = "DELETE FROM sessions WHERE expires_at <= ?"
+_SQL_TOUCH_SESSION = "UPDATE sessions SET last_seen_at = ? WHERE id = ?"
+
+# One fixed UPDATE for every admin/billing patch: each column takes a (set?, value) pair, so
+# any combination of fields (including clearing to NULL) shares the same prepared statement.
+_PATCHABLE_USER_COLUMNS = (
+    "role",
+    "compare_access_enabled",
+    "compare_access_expires_at",
+    "stripe_customer_id",
+    "stripe_subscription_id",
+    "stripe_subscription_status",
+)
+_SQL_PATCH_USER = (
+    "UPDATE users SET "
+    + ", ".join(f"{name} = CASE WHEN ? THEN ? ELSE {name} END" for name in _PATCHABLE_USER_COLUMNS)
+    + ", updated_at = ? WHERE id = ?"
+    + _RETURNING_USER
+)
+
+
 def _user_row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
-    raw_enabled = bool(row["compare_access_enabled"])
-    expires_at = row["compare_access_expires_at"] if isinstance(row["compare_access_expires_at"], str) else None
+    # Every user query selects _USER_COLUMNS first, in order; TEXT affinity means the text
+    # columns hold either str or NULL, so no per-column type checks are needed.
+    (
+        user_id,
+        email,
+        role,
+        raw_enabled,
+        expires_at,
+        stripe_customer_id,
+        stripe_subscription_id,
+        stripe_subscription_status,
+        created_at,
+        updated_at,
+    ) = row[:_USER_COLUMN_COUNT]
+    granted = bool(raw_enabled)
     return {
-        "id": int(row["id"]),
-        "email": str(row["email"]),
-        "role": str(row["role"] or "user"),
-        "compare_access_granted": raw_enabled,
-        "compare_access_enabled": _is_compare_access_active(raw_enabled, expires_at),
+        "id": user_id,
+        "email": email,
+        "role": role or "user",
+        "compare_access_granted": granted,
+        "compare_access_enabled": _is_compare_access_active(granted, expires_at),
         "compare_access_expires_at": expires_at,
-        "stripe_customer_id": row["stripe_customer_id"] if isinstance(row["stripe_customer_id"], str) else None,
-        "stripe_subscription_id": row["stripe_subscription_id"] if isinstance(row["stripe_subscription_id"], str) else None,
-        "stripe_subscription_status": row["stripe_subscription_status"]
-        if isinstance(row["stripe_subscription_status"], str)
-        else None,
-        "created_at": str(row["created_at"]),
-        "updated_at": str(row["updated_at"]),
+        "stripe_customer_id": stripe_customer_id,
+        "stripe_subscription_id": stripe_subscription_id,
+        "stripe_subscription_status": stripe_subscription_status,
+        "created_at": str(created_at),
+        "updated_at": str(updated_at),
     }
 
 
@@ -191,7 +443,7 @@ def _require_valid_password(password: str) -> str:
 
 def get_user_by_id(db_path: str, user_id: int) -> dict[str, Any] | None:
     with _connect(db_path) as connection:
-        row = connection.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+        row = connection.execute(_SQL_GET_USER_BY_ID, (user_id,)).fetchone()
     if row is None:
         return None
     return _user_row_to_dict(row)
@@ -200,14 +452,14 @@ def get_user_by_id(db_path: str, user_id: int) -> dict[str, Any] | None:
 def get_user_by_email(db_path: str, email: str) -> dict[str, Any] | None:
     normalized = _normalize_email(email)
     with _connect(db_path) as connection:
-        row = connection.execute("SELECT * FROM users WHERE email = ?", (normalized,)).fetchone()
+        row = connection.execute(_SQL_GET_USER_BY_EMAIL, (normalized,)).fetchone()
     if row is None:
         return None
     return _user_row_to_dict(row)
 
 
 def _get_user_row_by_email(connection: sqlite3.Connection, email: str) -> sqlite3.Row | None:
-    return connection.execute("SELECT * FROM users WHERE email = ?", (_normalize_email(email),)).fetchone()
+    return connection.execute(_SQL_GET_USER_ID_BY_EMAIL, (_normalize_email(email),)).fetchone()
 
 
 def create_user(db_path: str, email: str, password: str, role: str = "user") -> dict[str, Any]:
@@ -219,28 +471,17 @@ def create_user(db_path: str, email: str, password: str, role: str = "user") ->
 
     now_iso = utc_now_iso()
     password_hash = _hash_password(normalized_password)
-    with _connect(db_path) as connection:
+    with _connect(db_path, write=True) as connection:
         if _get_user_row_by_email(connection, normalized_email) is not None:
             raise ValueError("Email already exists.")
         cursor = connection.execute(
-            """
-            INSERT INTO users (
-                email,
-                password_hash,
-                role,
-                compare_access_enabled,
-                compare_access_expires_at,
-                stripe_customer_id,
-                stripe_subscription_id,
-                stripe_subscription_status,
-                created_at,
-                updated_at
-            )
-            VALUES (?, ?, ?, 0, NULL, NULL, NULL, NULL, ?, ?)
-            """,
+            _SQL_INSERT_USER + _RETURNING_USER,
             (normalized_email, password_hash, normalized_role, now_iso, now_iso),
         )
+        rows = cursor.fetchall()
         user_id = int(cursor.lastrowid)
+    if rows:
+        return _user_row_to_dict(rows[0])
     user = get_user_by_id(db_path, user_id)
     if user is None:
         raise RuntimeError("Created user could not be loaded.")
@@ -264,76 +505,226 @@ def bootstrap_admin_user(db_path: str, email: str, password: str) -> dict[str, A
         if existing["role"] == "admin":
             return existing
         return admin_update_user(db_path, int(existing["id"]), role="admin")
-    return create_user(db_path, normalized_email, normalized_password, role="admin")
+    try:
+        return create_user(db_path, normalized_email, normalized_password, role="admin")
+    except ValueError:
+        # Another worker bootstrapped the same account first; promote whatever it created.
+        existing = get_user_by_email(db_path, normalized_email)
+        if existing is None:
+            raise
+        if existing["role"] == "admin":
+            return existing
+        return admin_update_user(db_path, int(existing["id"]), role="admin")
+
+
+# Successful PBKDF2 checks keyed on (email, keyed digest of the password) -> (stored hash, time).
+# A hit only counts while the stored hash is unchanged, so a new password invalidates it. The
+# per-process HMAC key keeps the cached digests useless outside this process.
+_VERIFIED_CACHE_TTL_SECONDS = 300.0
+_VERIFIED_CACHE_MAX_ENTRIES = 1024
+_VERIFIED_CACHE: dict[tuple[str, bytes], tuple[str, float]] = {}
+_VERIFIED_CACHE_LOCK = threading.Lock()
+_VERIFIED_CACHE_KEY = secrets.token_bytes(32)
+
+
+def _verify_password_cached(email: str, password: str, encoded_hash: str) -> bool:
+    key = (email, hmac.digest(_VERIFIED_CACHE_KEY, password.encode("utf-8"), "sha256"))
+    now = time.monotonic()
+    with _VERIFIED_CACHE_LOCK:
+        cached = _VERIFIED_CACHE.get(key)
+    if (
+        cached is not None
+        and now - cached[1] < _VERIFIED_CACHE_TTL_SECONDS
+        and hmac.compare_digest(cached[0], encoded_hash)
+    ):
+        return True
+    if not _verify_password(password, encoded_hash):
+        return False
+    with _VERIFIED_CACHE_LOCK:
+        if len(_VERIFIED_CACHE) >= _VERIFIED_CACHE_MAX_ENTRIES:
+            _VERIFIED_CACHE.clear()
+        _VERIFIED_CACHE[key] = (encoded_hash, now)
+    return True
 
 
 def authenticate_user(db_path: str, email: str, password: str) -> dict[str, Any] | None:
     normalized_email = _normalize_email(email)
     with _connect(db_path) as connection:
-        row = connection.execute("SELECT * FROM users WHERE email = ?", (normalized_email,)).fetchone()
+        row = connection.execute(_SQL_GET_USER_WITH_HASH_BY_EMAIL, (normalized_email,)).fetchone()
     if row is None:
         return None
     password_hash = str(row["password_hash"])
-    if not _verify_password(password, password_hash):
+    if not _verify_password_cached(normalized_email, password, password_hash):
         return None
     return _user_row_to_dict(row)
 
 
-def create_session(db_path: str, user_id: int, session_days: int) -> tuple[str, str]:
+def create_session(db_path: str, user_id: int, session_days: int) -> tuple[str, str, int]:
     token = secrets.token_urlsafe(48)
     token_hash = _session_hash(token)
     created_at = utc_now()
-    expires_at = created_at + timedelta(days=max(1, session_days))
-    created_at_iso = created_at.isoformat()
-    expires_at_iso = expires_at.isoformat()
-    with _connect(db_path) as connection:
+    lifetime = timedelta(days=max(1, session_days))
+    expires_at = created_at + lifetime
+    created_at_epoch = int(created_at.timestamp())
+    with _connect(db_path, write=True) as connection:
         connection.execute(
-            """
-            INSERT INTO sessions (user_id, token_hash, created_at, last_seen_at, expires_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (user_id, token_hash, created_at_iso, created_at_iso, expires_at_iso),
+            _SQL_INSERT_SESSION,
+            (user_id, token_hash, created_at_epoch, created_at_epoch, int(expires_at.timestamp())),
         )
-    return token, expires_at_iso
+    return token, expires_at.isoformat(), int(lifetime.total_seconds())
 
 
 def delete_session(db_path: str, token: str) -> None:
     token_hash = _session_hash(token)
-    with _connect(db_path) as connection:
-        connection.execute("DELETE FROM sessions WHERE token_hash = ?", (token_hash,))
+    with _connect(db_path, write=True) as connection:
+        connection.execute(_SQL_DELETE_SESSION_BY_TOKEN, (token_hash,))
+    _invalidate_cached_sessions(db_path, token_hash=token_hash)
+
+
+# Resolved sessions keyed on (db_path, token_hash) -> (user, session expiry epoch, monotonic cache time).
+# Local writes invalidate entries; changes made by other processes show up within the TTL.
+_SESSION_CACHE_TTL_SECONDS = 30.0
+_SESSION_CACHE_MAX_ENTRIES = 4096
+_SESSION_CACHE: dict[tuple[str, bytes], tuple[dict[str, Any], int, float]] = {}
+_SESSION_CACHE_LOCK = threading.Lock()
+# last_seen_at is activity bookkeeping only; refreshing it once a minute is precise enough.
+_LAST_SEEN_WRITE_INTERVAL_SECONDS = 60.0
+
+
+def _cached_session_user(db_path: str, token_hash: bytes) -> dict[str, Any] | None:
+    key = (db_path, token_hash)
+    with _SESSION_CACHE_LOCK:
+        cached = _SESSION_CACHE.get(key)
+        if cached is None:
+            return None
+        user, expires_at, cached_at = cached
+        if time.monotonic() - cached_at >= _SESSION_CACHE_TTL_SECONDS or expires_at <= time.time():
+            del _SESSION_CACHE[key]
+            return None
+    return dict(user)
+
+
+def _cache_session_user(db_path: str, token_hash: bytes, user: dict[str, Any], expires_at: int) -> None:
+    with _SESSION_CACHE_LOCK:
+        if len(_SESSION_CACHE) >= _SESSION_CACHE_MAX_ENTRIES:
+            _SESSION_CACHE.clear()
+        _SESSION_CACHE[(db_path, token_hash)] = (dict(user), expires_at, time.monotonic())
+
+
+def _invalidate_cached_sessions(db_path: str, *, token_hash: bytes | None = None, user_id: int | None = None) -> None:
+    with _SESSION_CACHE_LOCK:
+        if token_hash is not None:
+            _SESSION_CACHE.pop((db_path, token_hash), None)
+        if user_id is not None:
+            stale = [key for key, (user, _, _) in _SESSION_CACHE.items() if key[0] == db_path and user["id"] == user_id]
+            for key in stale:
+                del _SESSION_CACHE[key]
+
+
+def get_cached_user_by_session_token(db_path: str, token: str) -> dict[str, Any] | None:
+    """Return the user for `token` only if it is in the session cache; never touches the database."""
+    return _cached_session_user(db_path, _session_hash(token))
 
 
 def get_user_by_session_token(db_path: str, token: str) -> dict[str, Any] | None:
     token_hash = _session_hash(token)
+    cached_user = _cached_session_user(db_path, token_hash)
+    if cached_user is not None:
+        return cached_user
+
+    # Hot read path: no explicit transaction; the single DELETE/UPDATE below autocommits.
     with _connect(db_path) as connection:
-        row = connection.execute(
-            """
-            SELECT u.*, s.id AS session_id, s.expires_at AS session_expires_at
-            FROM sessions s
-            JOIN users u ON u.id = s.user_id
-            WHERE s.token_hash = ?
-            """,
-            (token_hash,),
-        ).fetchone()
+        row = connection.execute(_SQL_SESSION_LOOKUP, (token_hash,)).fetchone()
 
         if row is None:
             return None
 
-        expires_at = parse_utc_iso(row["session_expires_at"])
-        if expires_at is None or expires_at <= utc_now():
-            connection.execute("DELETE FROM sessions WHERE id = ?", (row["session_id"],))
+        now = int(time.time())
+        expires_at = int(row["session_expires_at"])
+        if expires_at <= now:
+            connection.execute(_SQL_DELETE_SESSION_BY_ID, (row["session_id"],))
             return None
 
-        connection.execute("UPDATE sessions SET last_seen_at = ? WHERE id = ?", (utc_now_iso(), row["session_id"]))
-    return _user_row_to_dict(row)
+        if now - int(row["session_last_seen_at"]) >= _LAST_SEEN_WRITE_INTERVAL_SECONDS:
+            connection.execute(_SQL_TOUCH_SESSION, (now, row["session_id"]))
+    user = _user_row_to_dict(row)
+    _cache_session_user(db_path, token_hash, user, expires_at)
+    return user
+
+
+def sweep_expired_sessions(db_path: str) -> int:
+    """Delete expired sessions and truncate the WAL; return the number of sessions removed."""
+    with _connect(db_path, write=True) as connection:
+        removed = connection.execute(_SQL_DELETE_EXPIRED_SESSIONS, (int(time.time()),)).rowcount
+    with _connect(db_path) as connection:
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return removed
+
+
+_SWEEPERS: dict[str, threading.Event] = {}
+_SWEEPERS_LOCK = threading.Lock()
+
+
+def start_session_sweeper(db_path: str, interval_seconds: float = 60.0) -> threading.Event | None:
+    """Run sweep_expired_sessions every `interval_seconds` on a daemon thread.
+
+    At most one sweeper runs per database; set the returned event to stop it.
+    In-memory databases are skipped and return None.
+    """
+    if db_path == ":memory:":
+        return None
+    with _SWEEPERS_LOCK:
+        stop = _SWEEPERS.get(db_path)
+        if stop is not None and not stop.is_set():
+            return stop
+        stop = _SWEEPERS[db_path] = threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval_seconds):
+            try:
+                sweep_expired_sessions(db_path)
+            except sqlite3.Error:
+                # A busy or locked database just skips this round.
+                continue
+
+    threading.Thread(target=run, name="auth-session-sweeper", daemon=True).start()
+    return stop
 
 
 def list_users(db_path: str) -> list[dict[str, Any]]:
     with _connect(db_path) as connection:
-        rows = connection.execute("SELECT * FROM users ORDER BY created_at DESC, id DESC").fetchall()
+        rows = connection.execute(_SQL_LIST_USERS).fetchall()
     return [_user_row_to_dict(row) for row in rows]
 
 
+def _patch_user(db_path: str, user_id: int, patch: dict[str, Any]) -> dict[str, Any]:
+    if not patch:
+        user = get_user_by_id(db_path, user_id)
+        if user is None:
+            raise ValueError("User not found.")
+        return user
+
+    values: list[Any] = []
+    for name in _PATCHABLE_USER_COLUMNS:
+        values.append(name in patch)
+        values.append(patch.get(name))
+    values.append(utc_now_iso())
+    values.append(user_id)
+    with _connect(db_path, write=True) as connection:
+        cursor = connection.execute(_SQL_PATCH_USER, values)
+        rows = cursor.fetchall()
+        if cursor.rowcount == 0:
+            raise ValueError("User not found.")
+    _invalidate_cached_sessions(db_path, user_id=user_id)
+
+    if rows:
+        return _user_row_to_dict(rows[0])
+    user = get_user_by_id(db_path, user_id)
+    if user is None:
+        raise RuntimeError("Updated user could not be loaded.")
+    return user
+
+
 def admin_update_user(
     db_path: str,
     user_id: int,
@@ -342,19 +733,16 @@ def admin_update_user(
     compare_access_enabled: bool | None = None,
     compare_access_expires_at: str | None = None,
 ) -> dict[str, Any]:
-    patches: list[str] = []
-    values: list[Any] = []
+    patch: dict[str, Any] = {}
 
     if role is not None:
         normalized_role = role.strip().lower()
         if normalized_role not in ALLOWED_ROLES:
             raise ValueError("Role must be 'user' or 'admin'.")
-        patches.append("role = ?")
-        values.append(normalized_role)
+        patch["role"] = normalized_role
 
     if compare_access_enabled is not None:
-        patches.append("compare_access_enabled = ?")
-        values.append(1 if compare_access_enabled else 0)
+        patch["compare_access_enabled"] = 1 if compare_access_enabled else 0
 
     if compare_access_expires_at is not None:
         normalized_expires: str | None
@@ -366,27 +754,9 @@ def admin_update_user(
             if parsed is None:
                 raise ValueError("compare_access_expires_at must be an ISO-8601 datetime or empty.")
             normalized_expires = parsed.isoformat()
-        patches.append("compare_access_expires_at = ?")
-        values.append(normalized_expires)
-
-    if not patches:
-        user = get_user_by_id(db_path, user_id)
-        if user is None:
-            raise ValueError("User not found.")
-        return user
+        patch["compare_access_expires_at"] = normalized_expires
 
-    patches.append("updated_at = ?")
-    values.append(utc_now_iso())
-    values.append(user_id)
-    with _connect(db_path) as connection:
-        cursor = connection.execute(f"UPDATE users SET {', '.join(patches)} WHERE id = ?", tuple(values))
-        if cursor.rowcount == 0:
-            raise ValueError("User not found.")
-
-    user = get_user_by_id(db_path, user_id)
-    if user is None:
-        raise RuntimeError("Updated user could not be loaded.")
-    return user
+    return _patch_user(db_path, user_id, patch)
 
 
 def update_user_billing(
@@ -399,24 +769,19 @@ def update_user_billing(
     compare_access_enabled: bool | None = None,
     compare_access_expires_at: str | None = None,
 ) -> dict[str, Any]:
-    patches: list[str] = []
-    values: list[Any] = []
+    patch: dict[str, Any] = {}
 
     if stripe_customer_id is not None:
-        patches.append("stripe_customer_id = ?")
-        values.append(stripe_customer_id.strip() or None)
+        patch["stripe_customer_id"] = stripe_customer_id.strip() or None
 
     if stripe_subscription_id is not None:
-        patches.append("stripe_subscription_id = ?")
-        values.append(stripe_subscription_id.strip() or None)
+        patch["stripe_subscription_id"] = stripe_subscription_id.strip() or None
 
     if stripe_subscription_status is not None:
-        patches.append("stripe_subscription_status = ?")
-        values.append(stripe_subscription_status.strip() or None)
+        patch["stripe_subscription_status"] = stripe_subscription_status.strip() or None
 
     if compare_access_enabled is not None:
-        patches.append("compare_access_enabled = ?")
-        values.append(1 if compare_access_enabled else 0)
+        patch["compare_access_enabled"] = 1 if compare_access_enabled else 0
 
     if compare_access_expires_at is not None:
         trimmed = compare_access_expires_at.strip()
@@ -424,29 +789,11 @@ def update_user_billing(
             parsed = parse_utc_iso(trimmed)
             if parsed is None:
                 raise ValueError("compare_access_expires_at must be an ISO-8601 datetime.")
-            values.append(parsed.isoformat())
+            patch["compare_access_expires_at"] = parsed.isoformat()
         else:
-            values.append(None)
-        patches.append("compare_access_expires_at = ?")
+            patch["compare_access_expires_at"] = None
 
-    if not patches:
-        user = get_user_by_id(db_path, user_id)
-        if user is None:
-            raise ValueError("User not found.")
-        return user
-
-    patches.append("updated_at = ?")
-    values.append(utc_now_iso())
-    values.append(user_id)
-    with _connect(db_path) as connection:
-        cursor = connection.execute(f"UPDATE users SET {', '.join(patches)} WHERE id = ?", tuple(values))
-        if cursor.rowcount == 0:
-            raise ValueError("User not found.")
-
-    user = get_user_by_id(db_path, user_id)
-    if user is None:
-        raise RuntimeError("Updated user could not be loaded.")
-    return user
+    return _patch_user(db_path, user_id, patch)
 
 
 def get_user_by_stripe_customer_id(db_path: str, stripe_customer_id: str) -> dict[str, Any] | None:
@@ -454,7 +801,7 @@ def get_user_by_stripe_customer_id(db_path: str, stripe_customer_id: str) -> dic
     if not normalized:
         return None
     with _connect(db_path) as connection:
-        row = connection.execute("SELECT * FROM users WHERE stripe_customer_id = ?", (normalized,)).fetchone()
+        row = connection.execute(_SQL_GET_USER_BY_STRIPE_CUSTOMER_ID, (normalized,)).fetchone()
     if row is None:
         return None
     return _user_row_to_dict(row)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from bisect import bisect_left
+from itertools import chain
 import math
-from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 try:  # pragma: no cover - optional dependency
     import scipy.sparse as sp
@@ -21,12 +22,12 @@ except ImportError:  # pragma: no cover - optional dependency
 from schemas import (
     Compare,
     FieldGrid,
+    GeometryGrid,
     GeometryGridSummary,
     Grid,
     InsightSummary,
     IonProxyCurves,
     NeSolverMetadata,
-    Point2D,
     Sheath,
     SheathInsights,
     SheathMetrics,
@@ -36,6 +37,8 @@ from schemas import (
     VizCurves,
 )
 
+# Result models are assembled with model_construct: every value is solver output or part of an
+# already-validated request, so field validation would only re-walk the grids cell by cell.
 
 _REGION_TYPES = (
     "plasma",
@@ -47,6 +50,9 @@ _REGION_TYPES = (
 
 _SHEATH_METHOD = "phi_drop_fraction"
 
+# Region ids below this bound are mapped through dense per-id tables (the frontend emits 0..4).
+_DENSE_REGION_LUT_MAX_ID = 4096
+
 # Normalized drift-diffusion coefficients (not SI units).
 MU_E = 1.0
 TE_NORM = 1.0
@@ -190,7 +196,8 @@ class BoundaryDriveComponent(NamedTuple):
 
 
 def _clamp(value: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, value))
+    # Same results as max(lo, min(hi, value)), NaN -> hi and -0.0 -> lo included, without the builtin calls.
+    return lo if value <= lo else (value if value < hi else hi)
 
 
 def _weighted_species_factor(
@@ -201,6 +208,12 @@ def _weighted_species_factor(
     mixture = request.gas.mixture if request.gas else None
     if not mixture:
         return fallback
+    if len(mixture) == 1:
+        # Single-gas recipes are the common case; the weighted mean is just the table entry.
+        component = mixture[0]
+        if component.fraction <= 0.0:
+            return fallback
+        return table.get(component.species.strip().lower(), fallback)
     value = 0.0
     weight_total = 0.0
     for component in mixture:
@@ -214,16 +227,6 @@ def _weighted_species_factor(
     return value / weight_total
 
 
-def _collect_outlet_sinks(request: SimulationRequest) -> List[object]:
-    flow = request.flow_boundary
-    outlets: List[object] = []
-    if flow.outlets:
-        outlets.extend(flow.outlets)
-    elif flow.outlet is not None:
-        outlets.append(flow.outlet)
-    return outlets
-
-
 def _inlet_total_flow_sccm(request: SimulationRequest) -> float:
     inlet = request.flow_boundary.inlet
     if inlet is None:
@@ -278,56 +281,127 @@ def _inlet_radial_window(nr: int, emit_side: str, active_width_percent: float) -
     return start, end
 
 
+def _mask_array(mask: List[List[bool]], nz: int, nr: int) -> Any:
+    """Return a tag mask as an (nz, nr) bool array, or None without numpy or on a shape mismatch."""
+    if np is None or len(mask) != nz or any(len(row) != nr for row in mask):
+        return None
+    # Masks are validated bool lists; packing them as bytes is cheaper than np.asarray on nested lists.
+    return np.frombuffer(bytes(chain.from_iterable(mask)), dtype=bool).reshape(nz, nr)
+
+
+def _build_tag_mask_arrays(grid: Optional[GeometryGrid]) -> Dict[str, Any]:
+    """Convert every grid tag mask to an (nz, nr) bool array once per solve; empty without numpy."""
+    if np is None or grid is None or grid.tag_mask is None:
+        return {}
+    arrays: Dict[str, Any] = {}
+    for tag, mask in grid.tag_mask.items():
+        mask_arr = _mask_array(mask, grid.nz, grid.nr)
+        if mask_arr is not None:
+            arrays[tag] = mask_arr
+    return arrays
+
+
+def _cached_mask_array(
+    mask_arrays: Optional[Dict[str, Any]],
+    tag_mask: Optional[Dict[str, List[List[bool]]]],
+    tag: str,
+    nz: int,
+    nr: int,
+) -> Any:
+    """Return tag_mask[tag] as an (nz, nr) bool array, reusing mask_arrays (built from tag_mask) when given."""
+    if np is None:
+        return None
+    cached = mask_arrays.get(tag) if mask_arrays is not None else None
+    if cached is not None and cached.shape == (nz, nr):
+        return cached
+    mask = tag_mask.get(tag) if tag_mask is not None else None
+    return _mask_array(mask, nz, nr) if mask is not None else None
+
+
+def _zero_map(nz: int, nr: int) -> Any:
+    if np is not None:
+        return np.zeros((nz, nr), dtype=float)
+    return [[0.0 for _ in range(nr)] for _ in range(nz)]
+
+
+def _as_rows(values: Any) -> List[List[float]]:
+    """Return z-major rows for per-cell indexing, converting (nz, nr) arrays once."""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+    return values
+
+
 def _build_inlet_source_map(
     request: SimulationRequest,
     nz: int,
     nr: int,
     tag_mask: Optional[Dict[str, List[List[bool]]]],
     warnings: List[str],
-) -> Tuple[List[List[float]], float]:
-    source_map = [[0.0 for _ in range(nr)] for _ in range(nz)]
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> Tuple[Any, float]:
+    """Return the inlet source map ((nz, nr) array with numpy, else rows) and its grid coverage."""
     inlet = request.flow_boundary.inlet
     if inlet is None or inlet.total_flow_sccm <= 0.0:
-        return source_map, 0.0
+        return _zero_map(nz, nr), 0.0
 
     emit_side = _inlet_emit_side(request)
     active_width_percent = _inlet_active_width_percent(request)
     j_start, j_end = _inlet_radial_window(nr, emit_side, active_width_percent)
     inlet_tag = str(getattr(inlet, "surface_tag", "")).strip()
 
-    touched = 0
-    masked_cells = 0
-
+    mask = None
     if tag_mask is not None and inlet_tag:
         mask = tag_mask.get(inlet_tag)
         if mask is None:
             warnings.append(f"inlet tag '{inlet_tag}' missing in geometry.tag_mask")
-        else:
+    elif tag_mask is None:
+        warnings.append("flow inlet defined but geometry.tag_mask is missing")
+
+    mask_arr = (
+        _cached_mask_array(mask_arrays, tag_mask, inlet_tag, nz, nr) if mask is not None else None
+    )
+    if mask_arr is not None:
+        source_arr = np.zeros((nz, nr), dtype=float)
+        source_arr[:, j_start:j_end] = mask_arr[:, j_start:j_end]
+        touched = int(np.count_nonzero(source_arr))
+        if touched == 0 and mask_arr.any():
+            # Keep solve stable even when user-selected side/window misses the inlet tag mask.
+            source_arr[mask_arr] = 1.0
+            touched = int(np.count_nonzero(mask_arr))
+            warnings.append("inlet active window did not overlap inlet surface; fell back to full inlet surface")
+        if touched == 0:
+            source_arr[nz - 1, j_start:j_end] = 1.0
+            touched = j_end - j_start
+            warnings.append("inlet source map used top-boundary fallback")
+        return source_arr, touched / max(1, nr * nz)
+
+    source_map = [[0.0 for _ in range(nr)] for _ in range(nz)]
+    touched = 0
+    masked_cells = 0
+    if mask is not None:
+        for k in range(min(nz, len(mask))):
+            row = mask[k]
+            width = min(nr, len(row))
+            for j in range(width):
+                if not row[j]:
+                    continue
+                masked_cells += 1
+                if j_start <= j < j_end:
+                    source_map[k][j] = 1.0
+                    touched += 1
+
+        if masked_cells > 0 and touched == 0:
+            # Keep solve stable even when user-selected side/window misses the inlet tag mask.
             for k in range(min(nz, len(mask))):
                 row = mask[k]
                 width = min(nr, len(row))
                 for j in range(width):
-                    if not row[j]:
-                        continue
-                    masked_cells += 1
-                    if j_start <= j < j_end:
+                    if row[j]:
                         source_map[k][j] = 1.0
                         touched += 1
-
-            if masked_cells > 0 and touched == 0:
-                # Keep solve stable even when user-selected side/window misses the inlet tag mask.
-                for k in range(min(nz, len(mask))):
-                    row = mask[k]
-                    width = min(nr, len(row))
-                    for j in range(width):
-                        if row[j]:
-                            source_map[k][j] = 1.0
-                            touched += 1
-                warnings.append(
-                    "inlet active window did not overlap inlet surface; fell back to full inlet surface"
-                )
-    elif tag_mask is None:
-        warnings.append("flow inlet defined but geometry.tag_mask is missing")
+            warnings.append(
+                "inlet active window did not overlap inlet surface; fell back to full inlet surface"
+            )
 
     if touched == 0:
         top_k = nz - 1
@@ -379,19 +453,27 @@ def _build_inlet_axial_profile(direction: str, nz: int) -> List[float]:
     return profile
 
 
-def _build_frequency_radial_profile(nr: int, frequency_hz: float) -> List[float]:
-    if nr <= 1:
-        return [1.0]
+def _frequency_weights(frequency_hz: float) -> Tuple[float, float]:
+    """Return the (high, low) frequency weights shared by the radial and axial profiles."""
     freq_ratio = max(frequency_hz, 1.0) / RF_REF_FREQ_HZ
     high_freq_weight = _clamp(math.log10(freq_ratio + 1.0), 0.0, 0.8)
     low_freq_weight = _clamp(math.log10((1.0 / max(freq_ratio, 1e-6)) + 1.0), 0.0, 0.8)
+    return high_freq_weight, low_freq_weight
+
+
+def _build_frequency_radial_profile(nr: int, frequency_hz: float) -> List[float]:
+    if nr <= 1:
+        return [1.0]
+    high_freq_weight, low_freq_weight = _frequency_weights(frequency_hz)
+    edge_scale = 0.28 * high_freq_weight
+    center_scale = 0.18 * low_freq_weight
     center = 0.5 * (nr - 1)
     span = max(center, 1.0)
     profile: List[float] = []
     for j in range(nr):
         radial = abs(j - center) / span
-        edge_gain = 0.28 * high_freq_weight * (radial ** 1.35)
-        center_gain = 0.18 * low_freq_weight * ((1.0 - radial) ** 1.2)
+        edge_gain = edge_scale * (radial ** 1.35)
+        center_gain = center_scale * ((1.0 - radial) ** 1.2)
         profile.append(_clamp(1.0 + edge_gain + center_gain, 0.72, 1.75))
     return profile
 
@@ -399,14 +481,14 @@ def _build_frequency_radial_profile(nr: int, frequency_hz: float) -> List[float]
 def _build_frequency_axial_profile(nz: int, frequency_hz: float) -> List[float]:
     if nz <= 1:
         return [1.0]
-    freq_ratio = max(frequency_hz, 1.0) / RF_REF_FREQ_HZ
-    high_freq_weight = _clamp(math.log10(freq_ratio + 1.0), 0.0, 0.8)
-    low_freq_weight = _clamp(math.log10((1.0 / max(freq_ratio, 1e-6)) + 1.0), 0.0, 0.8)
+    high_freq_weight, low_freq_weight = _frequency_weights(frequency_hz)
+    top_scale = 0.24 * high_freq_weight
+    bottom_scale = 0.16 * low_freq_weight
     profile: List[float] = []
     denom = max(nz - 1, 1)
     for k in range(nz):
         topness = k / denom
-        gain = 1.0 + 0.24 * high_freq_weight * topness + 0.16 * low_freq_weight * (1.0 - topness)
+        gain = 1.0 + top_scale * topness + bottom_scale * (1.0 - topness)
         profile.append(_clamp(gain, 0.72, 1.65))
     return profile
 
@@ -461,11 +543,12 @@ def _build_outlet_strength_map(
     nr: int,
     tag_mask: Optional[Dict[str, List[List[bool]]]],
     warnings: List[str],
-) -> Tuple[List[List[float]], float]:
-    outlet_strength_map = [[0.0 for _ in range(nr)] for _ in range(nz)]
-    outlets = _collect_outlet_sinks(request)
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> Tuple[Any, float]:
+    """Return the summed pump strength map ((nz, nr) array with numpy, else rows) and total strength."""
+    outlets = request.flow_boundary.outlets
     if not outlets:
-        return outlet_strength_map, 0.0
+        return _zero_map(nz, nr), 0.0
 
     strength_by_tag: Dict[str, float] = {}
     total_strength = 0.0
@@ -480,26 +563,45 @@ def _build_outlet_strength_map(
         total_strength += strength
 
     if not strength_by_tag:
-        return outlet_strength_map, 0.0
+        return _zero_map(nz, nr), 0.0
 
     if tag_mask is None:
         warnings.append("flow outlets defined but geometry.tag_mask is missing")
-        return outlet_strength_map, total_strength
+        return _zero_map(nz, nr), total_strength
 
     missing_tags: List[str] = []
     touched = False
-    for tag, strength in strength_by_tag.items():
-        mask = tag_mask.get(tag)
-        if mask is None:
-            missing_tags.append(tag)
-            continue
-        for k in range(min(nz, len(mask))):
-            row = mask[k]
-            width = min(nr, len(row))
-            for j in range(width):
-                if row[j]:
-                    outlet_strength_map[k][j] += strength
-                    touched = True
+    outlet_arrays: Dict[str, Any] = {}
+    if np is not None:
+        for tag in strength_by_tag:
+            mask = tag_mask.get(tag)
+            if mask is not None:
+                outlet_arrays[tag] = _cached_mask_array(mask_arrays, tag_mask, tag, nz, nr)
+    if outlet_arrays and all(arr is not None for arr in outlet_arrays.values()):
+        strength_arr = np.zeros((nz, nr), dtype=float)
+        for tag, strength in strength_by_tag.items():
+            mask_arr = outlet_arrays.get(tag)
+            if mask_arr is None:
+                missing_tags.append(tag)
+                continue
+            # Accumulate per tag in the same order as the loop below so sums match bit for bit.
+            strength_arr[mask_arr] += strength
+            touched = touched or bool(mask_arr.any())
+        outlet_strength_map = strength_arr
+    else:
+        outlet_strength_map = [[0.0 for _ in range(nr)] for _ in range(nz)]
+        for tag, strength in strength_by_tag.items():
+            mask = tag_mask.get(tag)
+            if mask is None:
+                missing_tags.append(tag)
+                continue
+            for k in range(min(nz, len(mask))):
+                row = mask[k]
+                width = min(nr, len(row))
+                for j in range(width):
+                    if row[j]:
+                        outlet_strength_map[k][j] += strength
+                        touched = True
 
     if missing_tags:
         missing_sorted = ", ".join(sorted(missing_tags))
@@ -510,35 +612,68 @@ def _build_outlet_strength_map(
 
 
 def _spread_outlet_influence(
-    source_map: List[List[float]],
+    source_map: Any,
     steps: int,
     decay: float,
 ) -> List[List[float]]:
+    if np is not None:
+        return _spread_influence_array(source_map, steps, decay)
     if not source_map or not source_map[0] or steps <= 0:
         return source_map
 
     nz = len(source_map)
     nr = len(source_map[0])
+    # Ping-pong between two preallocated grids instead of copying a fresh one every step.
     influence = [row[:] for row in source_map]
+    updated = [row[:] for row in source_map]
     for _ in range(steps):
-        updated = [row[:] for row in influence]
         changed = False
         for k in range(nz):
+            row = influence[k]
+            updated_row = updated[k]
+            updated_row[:] = row
+            north_row = influence[k - 1] if k > 0 else None
+            south_row = influence[k + 1] if k + 1 < nz else None
             for j in range(nr):
-                north = influence[k - 1][j] if k > 0 else 0.0
-                south = influence[k + 1][j] if k + 1 < nz else 0.0
-                west = influence[k][j - 1] if j > 0 else 0.0
-                east = influence[k][j + 1] if j + 1 < nr else 0.0
+                north = north_row[j] if north_row is not None else 0.0
+                south = south_row[j] if south_row is not None else 0.0
+                west = row[j - 1] if j > 0 else 0.0
+                east = row[j + 1] if j + 1 < nr else 0.0
                 propagated = max(north, south, west, east) * decay
-                if propagated > updated[k][j] + 1e-9:
-                    updated[k][j] = propagated
+                if propagated > updated_row[j] + 1e-9:
+                    updated_row[j] = propagated
                     changed = True
-        influence = updated
+        influence, updated = updated, influence
         if not changed:
             break
     return influence
 
 
+def _spread_influence_array(source_map: Any, steps: int, decay: float) -> List[List[float]]:
+    """Array form of the 4-neighbour max-decay spread; each step matches one pass of the loop version."""
+    influence = np.array(source_map, dtype=float)
+    if influence.ndim != 2 or influence.size == 0 or steps <= 0:
+        return _as_rows(source_map)
+
+    neighbor = np.empty_like(influence)
+    for _ in range(steps):
+        # Max over north/south/west/east, with 0.0 standing in for neighbours outside the grid.
+        neighbor[0] = 0.0
+        neighbor[1:] = influence[:-1]
+        np.maximum(neighbor[:-1], influence[1:], out=neighbor[:-1])
+        np.maximum(neighbor[-1], 0.0, out=neighbor[-1])
+        np.maximum(neighbor[:, 1:], influence[:, :-1], out=neighbor[:, 1:])
+        np.maximum(neighbor[:, 0], 0.0, out=neighbor[:, 0])
+        np.maximum(neighbor[:, :-1], influence[:, 1:], out=neighbor[:, :-1])
+        np.maximum(neighbor[:, -1], 0.0, out=neighbor[:, -1])
+        neighbor *= decay
+        raised = neighbor > influence + 1e-9
+        if not raised.any():
+            break
+        influence[raised] = neighbor[raised]
+    return influence.tolist()
+
+
 def _to_density_observable(
     ne_raw: List[List[float]],
     request: SimulationRequest,
@@ -591,6 +726,14 @@ def _to_density_observable(
         1.0,
     )
 
+    if np is not None:
+        ne_arr = np.asarray(ne_raw, dtype=float)
+        with np.errstate(over="ignore", invalid="ignore"):
+            value_eff = ne_arr * rf_nonlin_gain * gas_reactivity_gain * pump_damping
+            mapped = np.clip(value_eff / (value_eff + n_sat), 0.0, 1.0)
+        valid = np.isfinite(ne_arr) & (ne_arr > 0.0) & np.isfinite(mapped)
+        return np.where(valid, mapped, 0.0).tolist()
+
     result: List[List[float]] = []
     for row in ne_raw:
         mapped_row: List[float] = []
@@ -913,6 +1056,57 @@ def _bernoulli(x: float) -> float:
     return x / (math.exp(x) - 1.0)
 
 
+def _bernoulli_array(x: Any) -> Any:
+    """Elementwise _bernoulli over an ndarray, with the same branches."""
+    out = np.empty_like(x)
+    small = np.abs(x) < 1e-6
+    high = x > 50.0
+    low = x < -50.0
+    mid = ~(small | high | low)
+    x_small = x[small]
+    out[small] = 1.0 - 0.5 * x_small + (x_small * x_small) / 12.0
+    out[high] = 0.0
+    out[low] = -x[low]
+    x_mid = x[mid]
+    # math.exp rather than np.exp: the two can differ by an ulp, which x / (e^x - 1) amplifies near zero.
+    exp_mid = np.fromiter(map(math.exp, x_mid.tolist()), dtype=float, count=x_mid.size)
+    out[mid] = x_mid / (exp_mid - 1.0)
+    return out
+
+
+def _sg_face_bernoulli(
+    phi: List[List[float]],
+    mu_e: float,
+    d_e: float,
+) -> Tuple[List[List[float]], List[List[float]], List[List[float]], List[List[float]]]:
+    """Return B(pe) and B(-pe) for every radial face [nz][nr-1] and axial face [nz-1][nr].
+
+    Face (k, j) of the radial tables sits between cells (k, j) and (k, j + 1); face (k, j) of the
+    axial tables between (k, j) and (k + 1, j). Both neighbouring cells read the same entry.
+    """
+    if np is not None:
+        phi_arr = np.asarray(phi, dtype=float)
+        pe_r = mu_e * (phi_arr[:, 1:] - phi_arr[:, :-1]) / d_e
+        pe_z = mu_e * (phi_arr[1:, :] - phi_arr[:-1, :]) / d_e
+        return (
+            _bernoulli_array(pe_r).tolist(),
+            _bernoulli_array(-pe_r).tolist(),
+            _bernoulli_array(pe_z).tolist(),
+            _bernoulli_array(-pe_z).tolist(),
+        )
+
+    nz = len(phi)
+    nr = len(phi[0]) if phi else 0
+    pe_r = [[mu_e * (phi[k][j + 1] - phi[k][j]) / d_e for j in range(nr - 1)] for k in range(nz)]
+    pe_z = [[mu_e * (phi[k + 1][j] - phi[k][j]) / d_e for j in range(nr)] for k in range(nz - 1)]
+    return (
+        [[_bernoulli(pe) for pe in row] for row in pe_r],
+        [[_bernoulli(-pe) for pe in row] for row in pe_r],
+        [[_bernoulli(pe) for pe in row] for row in pe_z],
+        [[_bernoulli(-pe) for pe in row] for row in pe_z],
+    )
+
+
 def _grid_summary(request: SimulationRequest) -> Optional[GeometryGridSummary]:
     grid = request.geometry.grid
     if grid is None:
@@ -922,32 +1116,70 @@ def _grid_summary(request: SimulationRequest) -> Optional[GeometryGridSummary]:
     for region_type in grid.region_legend.values():
         region_type_counts.setdefault(region_type, 0)
 
-    for row in grid.region_id:
-        for region_value in row:
+    region_arr = grid.region_array()
+    if region_arr is not None:
+        # Count each distinct id once instead of looking up the legend per cell.
+        region_ids, counts = np.unique(region_arr, return_counts=True)
+        for region_value, count in zip(region_ids.tolist(), counts.tolist()):
             region_type = grid.region_legend.get(region_value)
             if region_type is None:
                 continue
-            region_type_counts[region_type] = region_type_counts.get(region_type, 0) + 1
+            region_type_counts[region_type] = region_type_counts.get(region_type, 0) + count
+    else:
+        for row in grid.region_id:
+            for region_value in row:
+                region_type = grid.region_legend.get(region_value)
+                if region_type is None:
+                    continue
+                region_type_counts[region_type] = region_type_counts.get(region_type, 0) + 1
 
     tag_counts = None
     if grid.tag_mask is not None:
         tag_counts = {}
         for tag, mask in grid.tag_mask.items():
-            tag_counts[tag] = sum(1 for row in mask for cell in row if cell)
+            tag_counts[tag] = sum(row.count(True) for row in mask)
 
-    return GeometryGridSummary(region_type_counts=region_type_counts, tag_counts=tag_counts)
+    return GeometryGridSummary.model_construct(region_type_counts=region_type_counts, tag_counts=tag_counts)
 
 
-def build_epsilon_map(request: SimulationRequest) -> List[List[float]]:
-    """Build a relative permittivity map from region ids and material config."""
+def build_epsilon_map(
+    request: SimulationRequest,
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> List[List[float]]:
+    """Build a relative permittivity map from region ids and material config.
+
+    mask_arrays is the per-solve _build_tag_mask_arrays result; it is built here when omitted.
+    """
     grid = request.geometry.grid
     if grid is None:
         raise ValueError("geometry.grid is required for poisson_v1")
 
+    region_arr = grid.region_array()
+    legend = grid.region_legend
+    if region_arr is not None and min(legend) >= 0 and max(legend) < _DENSE_REGION_LUT_MAX_ID:
+        # Gather per-cell permittivity from a table indexed by region id instead of a legend lookup per cell.
+        eps_by_id = np.ones(max(legend) + 1, dtype=float)
+        for region_value, region_type in legend.items():
+            if region_type == "dielectric":
+                eps_by_id[region_value] = request.material.default.epsilon_r
+        eps_arr = eps_by_id[region_arr]
+        if grid.tag_mask is not None:
+            if mask_arrays is None:
+                mask_arrays = _build_tag_mask_arrays(grid)
+            for override in request.material.regions:
+                if override.epsilon_r is None:
+                    continue
+                mask_arr = mask_arrays.get(override.target_tag)
+                if mask_arr is None:
+                    continue
+                eps_arr[mask_arr] = override.epsilon_r
+        return eps_arr.tolist()
+
     eps = [[1.0 for _ in range(grid.nr)] for _ in range(grid.nz)]
+    region_types = grid.region_type_rows()
     for k in range(grid.nz):
         for j in range(grid.nr):
-            region_type = grid.region_legend[grid.region_id[k][j]]
+            region_type = region_types[k][j]
             if region_type == "dielectric":
                 eps[k][j] = request.material.default.epsilon_r
             else:
@@ -968,13 +1200,30 @@ def build_epsilon_map(request: SimulationRequest) -> List[List[float]]:
     return eps
 
 
-def build_wall_loss_map(request: SimulationRequest) -> List[List[float]]:
+def build_wall_loss_map(
+    request: SimulationRequest,
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> List[List[float]]:
     """Build a wall-loss map with default + tag overrides."""
     grid = request.geometry.grid
     if grid is None:
         raise ValueError("geometry.grid is required for poisson_v1")
 
     default_loss = _clamp(float(request.material.default.wall_loss_e), 0.0, 1.0)
+    if np is not None:
+        wall_loss_arr = np.full((grid.nz, grid.nr), default_loss, dtype=float)
+        if grid.tag_mask is not None:
+            if mask_arrays is None:
+                mask_arrays = _build_tag_mask_arrays(grid)
+            for override in request.material.regions:
+                if override.wall_loss_e is None:
+                    continue
+                mask_arr = mask_arrays.get(override.target_tag)
+                if mask_arr is None:
+                    continue
+                wall_loss_arr[mask_arr] = _clamp(float(override.wall_loss_e), 0.0, 1.0)
+        return wall_loss_arr.tolist()
+
     wall_loss = [[default_loss for _ in range(grid.nr)] for _ in range(grid.nz)]
 
     if grid.tag_mask is not None:
@@ -1010,20 +1259,32 @@ def _is_excluded_vld_tag(tag: str) -> bool:
     }
 
 
-def build_vld_geometry_mask(request: SimulationRequest) -> Optional[List[List[bool]]]:
-    """Build a mask that keeps VLD/PAD only on explicit geometry tags (excluding chamber/common tags)."""
+def build_vld_geometry_mask(
+    request: SimulationRequest,
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Build a mask that keeps VLD/PAD only on explicit geometry tags (excluding chamber/common tags).
+
+    Returns an (nz, nr) bool array with numpy, else rows, or None when no tag qualifies.
+    """
     grid = request.geometry.grid
     if grid is None or grid.tag_mask is None:
         return None
 
-    selected_masks = [
-        mask
-        for tag, mask in grid.tag_mask.items()
-        if not _is_excluded_vld_tag(tag)
-    ]
-    if not selected_masks:
+    selected_tags = [tag for tag in grid.tag_mask if not _is_excluded_vld_tag(tag)]
+    if not selected_tags:
         return None
 
+    if np is not None:
+        if mask_arrays is None:
+            mask_arrays = _build_tag_mask_arrays(grid)
+        geometry_arr = np.zeros((grid.nz, grid.nr), dtype=bool)
+        for tag in selected_tags:
+            geometry_arr |= mask_arrays[tag]
+        return geometry_arr
+
+    selected_masks = [grid.tag_mask[tag] for tag in selected_tags]
+
     geometry_mask: List[List[bool]] = [[False for _ in range(grid.nr)] for _ in range(grid.nz)]
     for mask in selected_masks:
         z_limit = min(grid.nz, len(mask))
@@ -1077,11 +1338,28 @@ def _build_tag_weight_map(
     tag_weights: Dict[str, float],
     nz: int,
     nr: int,
-) -> List[List[float]]:
-    weighted_map: List[List[float]] = [[0.0 for _ in range(nr)] for _ in range(nz)]
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Return summed tag weights per cell ((nz, nr) array with numpy, else rows)."""
     if tag_mask is None:
-        return weighted_map
+        return _zero_map(nz, nr)
 
+    if np is not None:
+        weighted_arr = np.zeros((nz, nr), dtype=float)
+        for tag, weight in tag_weights.items():
+            if weight <= 0.0:
+                continue
+            mask = tag_mask.get(tag)
+            if mask is None:
+                continue
+            mask_arr = _cached_mask_array(mask_arrays, tag_mask, tag, nz, nr)
+            if mask_arr is None:
+                break
+            weighted_arr[mask_arr] += weight
+        else:
+            return weighted_arr
+
+    weighted_map: List[List[float]] = [[0.0 for _ in range(nr)] for _ in range(nz)]
     for tag, weight in tag_weights.items():
         if weight <= 0.0:
             continue
@@ -1103,7 +1381,27 @@ def _build_tag_boolean_mask(
     tags: Iterable[str],
     nz: int,
     nr: int,
-) -> List[List[bool]]:
+    mask_arrays: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Return the union of the tag masks ((nz, nr) bool array with numpy, else rows)."""
+    if np is not None:
+        union_arr = np.zeros((nz, nr), dtype=bool)
+        if tag_mask is None:
+            return union_arr
+        for tag in tags:
+            key = tag.strip()
+            if not key:
+                continue
+            mask = tag_mask.get(key)
+            if mask is None:
+                continue
+            mask_arr = _cached_mask_array(mask_arrays, tag_mask, key, nz, nr)
+            if mask_arr is None:
+                break
+            union_arr |= mask_arr
+        else:
+            return union_arr
+
     mask_out: List[List[bool]] = [[False for _ in range(nr)] for _ in range(nz)]
     if tag_mask is None:
         return mask_out
@@ -1125,13 +1423,54 @@ def _build_tag_boolean_mask(
     return mask_out
 
 
+def _volume_loss_cells(
+    outlet_exclusion: Any,
+    geometry_mask: Any,
+    rf_influence: List[List[float]],
+    rf_cutoff: Optional[float],
+    nz: int,
+    nr: int,
+) -> List[Tuple[int, int]]:
+    """Return the (k, j) cells, in row-major order, that are not excluded from the volume-loss map."""
+    if geometry_mask is None or isinstance(geometry_mask, list):
+        geometry = _mask_array(geometry_mask, nz, nr) if geometry_mask is not None else None
+    else:
+        geometry = geometry_mask if geometry_mask.shape == (nz, nr) else None
+    if isinstance(outlet_exclusion, list):
+        excluded = _mask_array(outlet_exclusion, nz, nr)
+    else:
+        excluded = outlet_exclusion
+    if excluded is not None and (geometry_mask is None or geometry is not None):
+        active = ~excluded
+        if geometry is not None:
+            active &= geometry
+        if rf_cutoff is not None:
+            active &= ~(np.array(rf_influence, dtype=float) <= rf_cutoff)
+        k_idx, j_idx = np.nonzero(active)
+        return list(zip(k_idx.tolist(), j_idx.tolist()))
+
+    cells: List[Tuple[int, int]] = []
+    for k in range(nz):
+        for j in range(nr):
+            if outlet_exclusion[k][j]:
+                continue
+            if geometry_mask is not None:
+                if k >= len(geometry_mask) or j >= len(geometry_mask[k]) or not geometry_mask[k][j]:
+                    continue
+            if rf_cutoff is not None and rf_influence[k][j] <= rf_cutoff:
+                continue
+            cells.append((k, j))
+    return cells
+
+
 def compute_volume_loss_density(
     ne_norm: Optional[List[List[float]]],
     e_mag: Optional[List[List[float]]],
     wall_loss_map: List[List[float]],
     epsilon_map: List[List[float]],
     request: SimulationRequest,
-    geometry_mask: Optional[List[List[bool]]] = None,
+    geometry_mask: Any = None,
+    mask_arrays: Optional[Dict[str, Any]] = None,
 ) -> Optional[List[List[float]]]:
     """Compute geometry-local per-volume power absorption density proxy.
 
@@ -1171,14 +1510,14 @@ def compute_volume_loss_density(
             if "powered" in normalized or "rf" in normalized or "source" in normalized:
                 rf_tag_weights[tag] = 1.0
 
-    rf_seed_map = _build_tag_weight_map(tag_mask, rf_tag_weights, nz, nr)
+    rf_seed_map = _build_tag_weight_map(tag_mask, rf_tag_weights, nz, nr, mask_arrays)
     rf_influence = _spread_outlet_influence(rf_seed_map, steps=8, decay=0.84)
     rf_ref = max((max(row) for row in rf_influence), default=0.0)
     rf_contact_threshold = 1e-9
 
     outlet_tag_weights: Dict[str, float] = {}
     outlet_tags: set[str] = set()
-    for outlet in _collect_outlet_sinks(request):
+    for outlet in request.flow_boundary.outlets:
         tag = str(getattr(outlet, "surface_tag", "")).strip()
         if not tag:
             continue
@@ -1188,115 +1527,88 @@ def compute_volume_loss_density(
             continue
         outlet_tag_weights[tag] = outlet_tag_weights.get(tag, 0.0) + weight
 
-    outlet_exclusion = _build_tag_boolean_mask(tag_mask, outlet_tags, nz, nr)
-    outlet_seed_map = _build_tag_weight_map(tag_mask, outlet_tag_weights, nz, nr)
+    outlet_exclusion = _build_tag_boolean_mask(tag_mask, outlet_tags, nz, nr, mask_arrays)
+    outlet_seed_map = _build_tag_weight_map(tag_mask, outlet_tag_weights, nz, nr, mask_arrays)
     outlet_influence = _spread_outlet_influence(outlet_seed_map, steps=7, decay=0.82)
     outlet_ref = max((max(row) for row in outlet_influence), default=0.0)
 
-    for k in range(nz):
-        for j in range(nr):
-            if outlet_exclusion[k][j]:
-                continue
-            if geometry_mask is not None:
-                if k >= len(geometry_mask) or j >= len(geometry_mask[k]) or not geometry_mask[k][j]:
-                    continue
-            if rf_ref > 1e-12 and rf_influence[k][j] <= rf_contact_threshold * rf_ref:
-                continue
-            e_here = e_mag[k][j] if k < len(e_mag) and j < len(e_mag[k]) else 0.0
-            if not math.isfinite(e_here):
-                e_here = 0.0
-            e_neighbor_max, e_neighbor_mean = _neighbor_max_mean(e_mag, k, j, radius=2)
-            e_interface = max(
-                e_here,
-                0.90 * e_neighbor_max,
-                0.65 * e_neighbor_mean,
-            )
-            if e_interface <= 0.0:
-                continue
-            e_ref = max(e_ref, e_interface)
+    rf_cutoff = rf_contact_threshold * rf_ref if rf_ref > 1e-12 else None
+    # Remember each cell's interface field so the scaling pass below does not repeat the 5x5 window scan.
+    e_interfaces: Dict[Tuple[int, int], float] = {}
+    for k, j in _volume_loss_cells(outlet_exclusion, geometry_mask, rf_influence, rf_cutoff, nz, nr):
+        e_here = e_mag[k][j] if k < len(e_mag) and j < len(e_mag[k]) else 0.0
+        if not math.isfinite(e_here):
+            e_here = 0.0
+        e_neighbor_max, e_neighbor_mean = _neighbor_max_mean(e_mag, k, j, radius=2)
+        e_interface = max(
+            e_here,
+            0.90 * e_neighbor_max,
+            0.65 * e_neighbor_mean,
+        )
+        e_interfaces[k, j] = e_interface
+        if e_interface <= 0.0:
+            continue
+        e_ref = max(e_ref, e_interface)
 
     e_ref = max(e_ref, 1e-9)
 
-    for k in range(nz):
-        for j in range(nr):
-            if outlet_exclusion[k][j]:
-                result[k][j] = 0.0
-                continue
-            if geometry_mask is not None:
-                if k >= len(geometry_mask) or j >= len(geometry_mask[k]) or not geometry_mask[k][j]:
-                    result[k][j] = 0.0
-                    continue
-            if rf_ref > 1e-12 and rf_influence[k][j] <= rf_contact_threshold * rf_ref:
-                result[k][j] = 0.0
-                continue
-            if k >= len(e_mag) or j >= len(e_mag[k]):
-                result[k][j] = 0.0
-                continue
-            e_here = e_mag[k][j]
-            if not math.isfinite(e_here):
-                e_here = 0.0
-            e_neighbor_max, e_neighbor_mean = _neighbor_max_mean(e_mag, k, j, radius=2)
-            e_interface = max(
-                e_here,
-                0.90 * e_neighbor_max,
-                0.65 * e_neighbor_mean,
-            )
-            if e_interface <= 0.0:
-                result[k][j] = 0.0
-                continue
+    # Cells outside e_interfaces stay at the 0.0 the result grid was created with.
+    for (k, j), e_interface in e_interfaces.items():
+        if k >= len(e_mag) or j >= len(e_mag[k]) or e_interface <= 0.0:
+            continue
 
-            ne_here = 0.0
-            if ne_norm is not None and k < len(ne_norm) and j < len(ne_norm[k]):
-                ne_raw = ne_norm[k][j]
-                if math.isfinite(ne_raw):
-                    ne_here = max(0.0, ne_raw)
-            ne_neighbor_max, ne_neighbor_mean = _neighbor_max_mean(ne_norm, k, j, radius=1)
-            ne_interface = max(
-                ne_here,
-                0.72 * ne_neighbor_max,
-                0.45 * ne_neighbor_mean,
+        ne_here = 0.0
+        if ne_norm is not None and k < len(ne_norm) and j < len(ne_norm[k]):
+            ne_raw = ne_norm[k][j]
+            if math.isfinite(ne_raw):
+                ne_here = max(0.0, ne_raw)
+        ne_neighbor_max, ne_neighbor_mean = _neighbor_max_mean(ne_norm, k, j, radius=1)
+        ne_interface = max(
+            ne_here,
+            0.72 * ne_neighbor_max,
+            0.45 * ne_neighbor_mean,
+        )
+        plasma_coupling = _clamp(0.22 + 0.78 * math.sqrt(ne_interface), 0.22, 1.0)
+
+        wall_loss = _clamp(float(wall_loss_map[k][j]), 0.0, 1.0)
+        eps_r = 1.0
+        if k < len(epsilon_map) and j < len(epsilon_map[k]):
+            eps_raw = epsilon_map[k][j]
+            if math.isfinite(eps_raw):
+                eps_r = max(1.0, eps_raw)
+        loss_tangent_proxy = _clamp(0.08 + 0.92 * wall_loss, 0.08, 1.0)
+        eps_coupling = _clamp(eps_r ** 0.22, 1.0, 2.1)
+        material_coupling = loss_tangent_proxy * eps_coupling
+
+        source_factor = 1.0
+        if rf_ref > 1e-12:
+            source_factor = _clamp(
+                0.72 + 0.88 * (rf_influence[k][j] / rf_ref),
+                0.72,
+                1.6,
             )
-            plasma_coupling = _clamp(0.22 + 0.78 * math.sqrt(ne_interface), 0.22, 1.0)
-
-            wall_loss = _clamp(float(wall_loss_map[k][j]), 0.0, 1.0)
-            eps_r = 1.0
-            if k < len(epsilon_map) and j < len(epsilon_map[k]):
-                eps_raw = epsilon_map[k][j]
-                if math.isfinite(eps_raw):
-                    eps_r = max(1.0, eps_raw)
-            loss_tangent_proxy = _clamp(0.08 + 0.92 * wall_loss, 0.08, 1.0)
-            eps_coupling = _clamp(eps_r ** 0.22, 1.0, 2.1)
-            material_coupling = loss_tangent_proxy * eps_coupling
-
-            source_factor = 1.0
-            if rf_ref > 1e-12:
-                source_factor = _clamp(
-                    0.72 + 0.88 * (rf_influence[k][j] / rf_ref),
-                    0.72,
-                    1.6,
-                )
 
-            sink_factor = 1.0
-            if outlet_ref > 1e-12:
-                sink_factor = _clamp(
-                    1.0 - 0.32 * (outlet_influence[k][j] / outlet_ref),
-                    0.58,
-                    1.0,
-                )
-
-            e_rel = _clamp(e_interface / e_ref, 0.0, 1.0)
-            scaled = (
-                (e_rel ** 2)
-                * (0.55 + 0.45 * plasma_coupling)
-                * material_coupling
-                * power_gain
-                * freq_gain
-                * dc_bias_gain
-                * multi_source_gain
-                * source_factor
-                * sink_factor
+        sink_factor = 1.0
+        if outlet_ref > 1e-12:
+            sink_factor = _clamp(
+                1.0 - 0.32 * (outlet_influence[k][j] / outlet_ref),
+                0.58,
+                1.0,
             )
-            result[k][j] = _clamp(scaled, 0.0, 3.6)
+
+        e_rel = _clamp(e_interface / e_ref, 0.0, 1.0)
+        scaled = (
+            (e_rel ** 2)
+            * (0.55 + 0.45 * plasma_coupling)
+            * material_coupling
+            * power_gain
+            * freq_gain
+            * dc_bias_gain
+            * multi_source_gain
+            * source_factor
+            * sink_factor
+        )
+        result[k][j] = _clamp(scaled, 0.0, 3.6)
 
     return result
 
@@ -1350,9 +1662,10 @@ def build_dirichlet_mask_values(
                 offset += tag_offset
         return offset
 
+    region_types = grid.region_type_rows()
     for k in range(grid.nz):
         for j in range(grid.nr):
-            region_type = grid.region_legend[grid.region_id[k][j]]
+            region_type = region_types[k][j]
             if region_type == "powered_electrode":
                 mask[k][j] = True
                 powered_cells.append((k, j))
@@ -1400,6 +1713,88 @@ def _add_entry(rows: List[Dict[int, float]], row: int, col: int, value: float) -
     rows[row][col] = rows[row].get(col, 0.0) + value
 
 
+def _harmonic_array(a: Any, b: Any) -> Any:
+    """Elementwise _harmonic over matching ndarrays."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((a <= 0) | (b <= 0), 0.0, 2.0 * a * b / (a + b))
+
+
+def _assemble_poisson_diagonals(
+    eps: List[List[float]],
+    dr: float,
+    dz: float,
+    nz: int,
+    nr: int,
+    dirichlet_mask: List[List[bool]],
+    dirichlet_values: List[List[float]],
+):
+    """Build the assemble_poisson_matrix stencil as five CSR diagonals.
+
+    Coefficients are summed in the same east, west, north, south order as the per-cell loop,
+    so matrix entries and RHS values are bit-identical to it.
+    """
+    total = nz * nr
+    eps_arr = np.asarray(eps, dtype=float)
+    fixed = np.asarray(dirichlet_mask, dtype=bool)
+    fixed_values = np.asarray(dirichlet_values, dtype=float)
+    # Face (k, j) of face_r sits between cells (k, j) and (k, j + 1); face_z between (k, j) and (k + 1, j).
+    face_r = _harmonic_array(eps_arr[:, :-1], eps_arr[:, 1:])
+    face_z = _harmonic_array(eps_arr[:-1, :], eps_arr[1:, :])
+
+    coef_e = np.zeros((nz, nr))
+    coef_w = np.zeros((nz, nr))
+    coef_n = np.zeros((nz, nr))
+    coef_s = np.zeros((nz, nr))
+    # Mirror (r=0 / z=0) and outer boundaries take a doubled one-sided coefficient.
+    coef_e[:, 0] = 2.0 * face_r[:, 0] / (dr * dr)
+    coef_e[:, 1:-1] = face_r[:, 1:] / (dr * dr)
+    coef_w[:, -1] = 2.0 * face_r[:, -1] / (dr * dr)
+    coef_w[:, 1:-1] = face_r[:, :-1] / (dr * dr)
+    coef_n[0, :] = 2.0 * face_z[0, :] / (dz * dz)
+    coef_n[1:-1, :] = face_z[1:, :] / (dz * dz)
+    coef_s[-1, :] = 2.0 * face_z[-1, :] / (dz * dz)
+    coef_s[1:-1, :] = face_z[:-1, :] / (dz * dz)
+
+    fixed_e = np.zeros((nz, nr), dtype=bool)
+    fixed_w = np.zeros((nz, nr), dtype=bool)
+    fixed_n = np.zeros((nz, nr), dtype=bool)
+    fixed_s = np.zeros((nz, nr), dtype=bool)
+    fixed_e[:, :-1] = fixed[:, 1:]
+    fixed_w[:, 1:] = fixed[:, :-1]
+    fixed_n[:-1, :] = fixed[1:, :]
+    fixed_s[1:, :] = fixed[:-1, :]
+    value_e = np.zeros((nz, nr))
+    value_w = np.zeros((nz, nr))
+    value_n = np.zeros((nz, nr))
+    value_s = np.zeros((nz, nr))
+    value_e[:, :-1] = fixed_values[:, 1:]
+    value_w[:, 1:] = fixed_values[:, :-1]
+    value_n[:-1, :] = fixed_values[1:, :]
+    value_s[1:, :] = fixed_values[:-1, :]
+
+    main = np.where(fixed, 1.0, coef_e + coef_w + coef_n + coef_s)
+    rhs = (
+        np.where(fixed_e, coef_e * value_e, 0.0)
+        + np.where(fixed_w, coef_w * value_w, 0.0)
+        + np.where(fixed_n, coef_n * value_n, 0.0)
+        + np.where(fixed_s, coef_s * value_s, 0.0)
+    )
+    rhs = np.where(fixed, fixed_values, rhs)
+    # Dirichlet rows and Dirichlet neighbours carry no off-diagonal entry; zeros are dropped by diags.
+    off_e = np.where(fixed | fixed_e, 0.0, -coef_e).ravel()
+    off_w = np.where(fixed | fixed_w, 0.0, -coef_w).ravel()
+    off_n = np.where(fixed | fixed_n, 0.0, -coef_n).ravel()
+    off_s = np.where(fixed | fixed_s, 0.0, -coef_s).ravel()
+
+    matrix = sp.diags(
+        [main.ravel(), off_e[:-1], off_w[1:], off_n[:-nr], off_s[nr:]],
+        [0, 1, -1, nr, -nr],
+        shape=(total, total),
+        format="csr",
+    )
+    return matrix, rhs.ravel().tolist()
+
+
 def assemble_poisson_matrix(
     eps: List[List[float]],
     dr: float,
@@ -1410,6 +1805,9 @@ def assemble_poisson_matrix(
     dirichlet_values: List[List[float]],
 ):
     """Assemble the sparse Poisson matrix and RHS using a 5-point stencil."""
+    if sp is not None and np is not None:
+        return _assemble_poisson_diagonals(eps, dr, dz, nz, nr, dirichlet_mask, dirichlet_values)
+
     total = nz * nr
     rows: List[Dict[int, float]] = [dict() for _ in range(total)]
     b = [0.0 for _ in range(total)]
@@ -1509,29 +1907,103 @@ def cg_solve(matvec, b: List[float], tol: float = 1e-10, maxiter: int = 5000) ->
     return x
 
 
-def solve_phi(A, b: List[float], nz: int, nr: int) -> List[List[float]]:
-    """Solve for phi and reshape to [nz][nr]."""
-    if sp is not None and hasattr(A, "shape"):
+def _rows_to_csr(rows: List[Dict[int, float]]) -> Tuple[Any, Any, Any]:
+    """Flatten dict rows into CSR-style (row ids, column indices, values) arrays in row entry order."""
+    counts = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    row_ids = np.repeat(np.arange(len(rows), dtype=np.int64), counts)
+    nnz = int(counts.sum())
+    indices = np.fromiter(chain.from_iterable(rows), dtype=np.int64, count=nnz)
+    data = np.fromiter(chain.from_iterable(row.values() for row in rows), dtype=float, count=nnz)
+    return row_ids, indices, data
+
+
+def _cg_solve_rows_array(
+    rows: List[Dict[int, float]],
+    b: List[float],
+    tol: float = 1e-10,
+    maxiter: int = 5000,
+) -> List[float]:
+    """cg_solve over dict rows with numpy vectors; each matvec row is summed in the same order as _matvec_rows."""
+    row_ids, indices, data = _rows_to_csr(rows)
+    n = len(rows)
+
+    def matvec(vec):
+        # bincount adds each row's products in entry order starting from 0.0, like the accumulator loop.
+        return np.bincount(row_ids, weights=data * vec[indices], minlength=n)
+
+    x = np.zeros(n, dtype=float)
+    r = np.array(b, dtype=float)
+    p = r.copy()
+    rsold = float(r @ r)
+
+    for _ in range(maxiter):
+        Ap = matvec(p)
+        denom = float(p @ Ap)
+        if denom == 0.0:
+            break
+        alpha = rsold / denom
+        x += alpha * p
+        r -= alpha * Ap
+        rsnew = float(r @ r)
+        if math.sqrt(rsnew) < tol:
+            break
+        beta = rsnew / rsold
+        p = r + beta * p
+        rsold = rsnew
+
+    return x.tolist()
+
+
+def factorize_poisson_matrix(A) -> Any:
+    """Return a reusable LU factorization of the sparse Poisson matrix, or None without SciPy."""
+    if sp is None or not hasattr(A, "shape"):
+        return None
+    try:
+        # Factoring the CSC transpose and solving with trans="T" reproduces spsolve on the CSR matrix exactly.
+        return spla.splu(A.T)
+    except RuntimeError:
+        # Singular matrix: let spsolve report it the usual way.
+        return None
+
+
+def solve_phi(A, b: List[float], nz: int, nr: int, factor: Any = None) -> List[List[float]]:
+    """Solve for phi and reshape to [nz][nr], reusing `factor` from factorize_poisson_matrix when given."""
+    if factor is not None:
+        phi_list = factor.solve(np.asarray(b, dtype=float), trans="T").tolist()
+    elif sp is not None and hasattr(A, "shape"):
         phi = spla.spsolve(A, b)
         phi_list = phi.tolist()
     else:
         rows = A
-        phi_list = cg_solve(lambda v: _matvec_rows(rows, v), b)
+        if np is not None:
+            phi_list = _cg_solve_rows_array(rows, b)
+        else:
+            phi_list = cg_solve(lambda v: _matvec_rows(rows, v), b)
 
     phi_2d = [phi_list[k * nr : (k + 1) * nr] for k in range(nz)]
     return phi_2d
 
 
+def _E_component_arrays(phi: List[List[float]], dr: float, dz: float) -> Optional[Tuple[Any, Any]]:
+    """Return (Er, Ez) as (nz, nr) arrays, or None when numpy is missing or the grid is degenerate."""
+    if np is None:
+        return None
+    phi_arr = np.asarray(phi, dtype=float)
+    if phi_arr.ndim != 2 or phi_arr.shape[0] <= 1 or phi_arr.shape[1] <= 1:
+        return None
+    dphi_dz, dphi_dr = np.gradient(phi_arr, dz, dr, edge_order=1)
+    er_arr = -dphi_dr
+    ez_arr = -dphi_dz
+    er_arr[:, 0] = 0.0  # r=0 axis symmetry
+    return er_arr, ez_arr
+
+
 def compute_E_components(phi: List[List[float]], dr: float, dz: float) -> Tuple[List[List[float]], List[List[float]]]:
     """Compute Er and Ez from the potential."""
-    if np is not None:
-        phi_arr = np.asarray(phi, dtype=float)
-        if phi_arr.ndim == 2 and phi_arr.shape[0] > 1 and phi_arr.shape[1] > 1:
-            dphi_dz, dphi_dr = np.gradient(phi_arr, dz, dr, edge_order=1)
-            er_arr = -dphi_dr
-            ez_arr = -dphi_dz
-            er_arr[:, 0] = 0.0  # r=0 axis symmetry
-            return er_arr.tolist(), ez_arr.tolist()
+    components = _E_component_arrays(phi, dr, dz)
+    if components is not None:
+        er_arr, ez_arr = components
+        return er_arr.tolist(), ez_arr.tolist()
 
     nz = len(phi)
     nr = len(phi[0]) if nz > 0 else 0
@@ -1559,13 +2031,12 @@ def compute_E_components(phi: List[List[float]], dr: float, dz: float) -> Tuple[
 
 def compute_Emag(phi: List[List[float]], dr: float, dz: float) -> List[List[float]]:
     """Compute the electric field magnitude from the potential."""
-    er, ez = compute_E_components(phi, dr, dz)
-    if np is not None:
-        er_arr = np.asarray(er, dtype=float)
-        ez_arr = np.asarray(ez, dtype=float)
-        if er_arr.shape == ez_arr.shape:
-            return np.hypot(er_arr, ez_arr).tolist()
+    components = _E_component_arrays(phi, dr, dz)
+    if components is not None:
+        # Stay in arrays: Er/Ez rows are only needed here to form the magnitude.
+        return np.hypot(*components).tolist()
 
+    er, ez = compute_E_components(phi, dr, dz)
     nz = len(phi)
     nr = len(phi[0]) if nz > 0 else 0
     e_mag = [[0.0 for _ in range(nr)] for _ in range(nz)]
@@ -1579,6 +2050,18 @@ def compute_Emag(phi: List[List[float]], dr: float, dz: float) -> List[List[floa
 
 def build_ne_proxy_from_phi(phi: List[List[float]], alpha: float = 1.0) -> List[List[float]]:
     """Build a deterministic proxy n_ref from phi (normalized)."""
+    phi_arr = np.asarray(phi, dtype=float) if np is not None else None
+    if phi_arr is not None and phi_arr.ndim == 2 and phi_arr.size > 0:
+        shifted = (alpha * (phi_arr - phi_arr.min())).ravel().tolist()
+        # math.exp rather than np.exp: the vector exp can differ from libm in the last ulp.
+        ne_raw_arr = np.fromiter(map(math.exp, shifted), dtype=float, count=len(shifted)).reshape(phi_arr.shape)
+        min_ne = ne_raw_arr.min()
+        max_ne = ne_raw_arr.max()
+        if max_ne <= min_ne:
+            return np.zeros(phi_arr.shape, dtype=float).tolist()
+        with np.errstate(invalid="ignore"):
+            return ((ne_raw_arr - min_ne) / (max_ne - min_ne)).tolist()
+
     flat_phi = [value for row in phi for value in row]
     phi_ref = min(flat_phi) if flat_phi else 0.0
     ne_raw = [math.exp(alpha * (value - phi_ref)) for value in flat_phi]
@@ -1596,6 +2079,15 @@ def build_ne_proxy_from_phi(phi: List[List[float]], alpha: float = 1.0) -> List[
 
 def normalize_ne(ne: List[List[float]]) -> List[List[float]]:
     """Normalize n_e to [0,1] with safe flat handling."""
+    ne_arr = np.asarray(ne, dtype=float) if np is not None else None
+    if ne_arr is not None and ne_arr.ndim == 2 and ne_arr.size > 0:
+        min_ne = ne_arr.min()
+        max_ne = ne_arr.max()
+        if max_ne <= min_ne:
+            return np.zeros(ne_arr.shape, dtype=float).tolist()
+        with np.errstate(invalid="ignore"):
+            return ((ne_arr - min_ne) / (max_ne - min_ne)).tolist()
+
     flat = [value for row in ne for value in row]
     if not flat:
         return ne
@@ -1618,18 +2110,21 @@ def _solve_linear_gs(
     warnings: List[str] = []
     converged = False
     residual = 0.0
+    # Split each row once into its diagonal and off-diagonal entries instead of on every sweep.
+    diagonals = [row.get(i) for i, row in enumerate(rows)]
+    off_diagonals = [
+        [(j, value) for j, value in row.items() if j != i]
+        for i, row in enumerate(rows)
+    ]
 
     for iteration in range(1, maxiter + 1):
         max_delta = 0.0
-        for i, row in enumerate(rows):
-            diag = row.get(i)
+        for i, diag in enumerate(diagonals):
             if diag is None or diag == 0.0:
                 warnings.append("zero diagonal in GS solver")
                 return x, False, iteration, 1e9, warnings
             sigma = 0.0
-            for j, value in row.items():
-                if j == i:
-                    continue
+            for j, value in off_diagonals[i]:
                 sigma += value * x[j]
             new_value = (b[i] - sigma) / diag
             if new_value < N_FLOOR:
@@ -1661,6 +2156,7 @@ def solve_ne_drift_diffusion_sg(
     phi: List[List[float]],
     request: SimulationRequest,
     coefficients: Optional[TransportCoefficients] = None,
+    mask_arrays: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List[List[float]], NeSolverMetadata]:
     """Solve steady drift-diffusion for electrons using SG discretization."""
     grid = request.geometry.grid
@@ -1681,7 +2177,7 @@ def solve_ne_drift_diffusion_sg(
     if d_e <= 0.0:
         warnings.append("D_e must be positive; using proxy ne")
         n_ref = build_ne_proxy_from_phi(phi)
-        meta = NeSolverMetadata(
+        meta = NeSolverMetadata.model_construct(
             method="drift_diffusion_sg_v1",
             mu_e=mu_e,
             D_e=d_e,
@@ -1717,6 +2213,7 @@ def solve_ne_drift_diffusion_sg(
         nr,
         grid.tag_mask,
         warnings,
+        mask_arrays,
     )
     inlet_spread_steps = max(6, min(28, int(0.08 * (nr + nz))))
     inlet_influence_map = _spread_outlet_influence(
@@ -1752,6 +2249,7 @@ def solve_ne_drift_diffusion_sg(
         nr,
         grid.tag_mask,
         warnings,
+        mask_arrays,
     )
     spread_steps = max(6, min(24, int(0.06 * (nr + nz))))
     outlet_influence_map = _spread_outlet_influence(
@@ -1759,6 +2257,7 @@ def solve_ne_drift_diffusion_sg(
         steps=spread_steps,
         decay=0.88,
     )
+    outlet_strength_map = _as_rows(outlet_strength_map)
     pump_bulk_loss = _clamp(0.018 * total_pump_strength, 0.0, 0.16)
     flow_residence_loss = _clamp(
         0.0012 * inlet_flow_sccm / max(pressure_torr, 0.2),
@@ -1820,8 +2319,10 @@ def solve_ne_drift_diffusion_sg(
     def idx(k: int, j: int) -> int:
         return k * nr + j
 
+    region_types = grid.region_type_rows()
+
     def region_type(k: int, j: int) -> str:
-        return grid.region_legend[grid.region_id[k][j]]
+        return region_types[k][j]
 
     def outlet_strength(k: int, j: int) -> float:
         if k < 0 or k >= nz or j < 0 or j >= nr:
@@ -1844,6 +2345,7 @@ def solve_ne_drift_diffusion_sg(
     e_ref = _clamp(0.07 + 0.26 * (pressure_torr / (pressure_torr + 0.6)), 0.05, 0.38)
 
     # SG flux coefficients for div(Gamma) with fixed E from phi.
+    b_pos_r, b_neg_r, b_pos_z, b_neg_z = _sg_face_bernoulli(phi, mu_e, d_e)
 
     for k in range(nz):
         for j in range(nr):
@@ -1871,9 +2373,8 @@ def solve_ne_drift_diffusion_sg(
             if j < nr - 1:
                 east_region = region_type(k, j + 1)
                 if east_region == "plasma":
-                    pe = mu_e * (phi[k][j + 1] - phi[k][j]) / d_e
-                    bpe = _bernoulli(pe)
-                    bme = _bernoulli(-pe)
+                    bpe = b_pos_r[k][j]
+                    bme = b_neg_r[k][j]
                     a_p += coef_r * bpe
                     _add_entry(rows, i, idx(k, j + 1), -coef_r * bme)
                 else:
@@ -1888,9 +2389,8 @@ def solve_ne_drift_diffusion_sg(
             if j > 0:
                 west_region = region_type(k, j - 1)
                 if west_region == "plasma":
-                    pe = mu_e * (phi[k][j] - phi[k][j - 1]) / d_e
-                    bpw = _bernoulli(pe)
-                    bmw = _bernoulli(-pe)
+                    bpw = b_pos_r[k][j - 1]
+                    bmw = b_neg_r[k][j - 1]
                     a_p += coef_r * bmw
                     _add_entry(rows, i, idx(k, j - 1), -coef_r * bpw)
                 else:
@@ -1902,9 +2402,8 @@ def solve_ne_drift_diffusion_sg(
             if k < nz - 1:
                 north_region = region_type(k + 1, j)
                 if north_region == "plasma":
-                    pe = mu_e * (phi[k + 1][j] - phi[k][j]) / d_e
-                    bpn = _bernoulli(pe)
-                    bmn = _bernoulli(-pe)
+                    bpn = b_pos_z[k][j]
+                    bmn = b_neg_z[k][j]
                     a_p += coef_z * bpn
                     _add_entry(rows, i, idx(k + 1, j), -coef_z * bmn)
                 else:
@@ -1919,9 +2418,8 @@ def solve_ne_drift_diffusion_sg(
             if k > 0:
                 south_region = region_type(k - 1, j)
                 if south_region == "plasma":
-                    pe = mu_e * (phi[k][j] - phi[k - 1][j]) / d_e
-                    bps = _bernoulli(pe)
-                    bms = _bernoulli(-pe)
+                    bps = b_pos_z[k - 1][j]
+                    bms = b_neg_z[k - 1][j]
                     a_p += coef_z * bms
                     _add_entry(rows, i, idx(k - 1, j), -coef_z * bps)
                 else:
@@ -2031,7 +2529,7 @@ def solve_ne_drift_diffusion_sg(
     ne_raw = [solution[k * nr : (k + 1) * nr] for k in range(nz)]
     ne_norm = _to_density_observable(ne_raw, request, total_pump_strength)
 
-    meta = NeSolverMetadata(
+    meta = NeSolverMetadata.model_construct(
         method="drift_diffusion_sg_v1",
         mu_e=mu_e,
         D_e=d_e,
@@ -2053,10 +2551,9 @@ def solve_ne_drift_diffusion_sg(
 
 def _sheath_from_phi_drop(
     phi: List[List[float]],
-    r_values: List[float],
     z_values: List[float],
     fraction: float = 0.9,
-) -> Tuple[List[Point2D], List[List[bool]]]:
+) -> Tuple[List[float], List[List[bool]]]:
     """Build sheath boundary from a potential drop fraction."""
     nz = len(phi)
     nr = len(phi[0]) if nz > 0 else 0
@@ -2071,18 +2568,16 @@ def _sheath_from_phi_drop(
                 break
         z_boundary[j] = z_found
 
-    polyline = [Point2D(r_mm=r_values[j], z_mm=z_boundary[j]) for j in range(nr)]
     mask = [[z_values[k] <= z_boundary[j] for j in range(nr)] for k in range(nz)]
 
-    return polyline, mask
+    return z_boundary, mask
 
 
 def _sheath_from_emag_threshold(
     e_mag: List[List[float]],
-    r_values: List[float],
     z_values: List[float],
     threshold: float = 0.2,
-) -> Tuple[List[Point2D], List[List[bool]]]:
+) -> Tuple[List[float], List[List[bool]]]:
     """Build sheath boundary from an E-field magnitude threshold."""
     nz = len(e_mag)
     nr = len(e_mag[0]) if nz > 0 else 0
@@ -2099,10 +2594,9 @@ def _sheath_from_emag_threshold(
                 break
         z_boundary[j] = z_found
 
-    polyline = [Point2D(r_mm=r_values[j], z_mm=z_boundary[j]) for j in range(nr)]
     mask = [[z_values[k] <= z_boundary[j] for j in range(nr)] for k in range(nz)]
 
-    return polyline, mask
+    return z_boundary, mask
 
 
 def build_sheath(
@@ -2113,15 +2607,15 @@ def build_sheath(
 ) -> Sheath:
     """Build a sheath polyline and mask from phi or E-field."""
     if _SHEATH_METHOD == "e_threshold":
-        polyline, mask = _sheath_from_emag_threshold(e_mag, r_values, z_values)
+        z_boundary, mask = _sheath_from_emag_threshold(e_mag, z_values)
     else:
-        polyline, mask = _sheath_from_phi_drop(phi, r_values, z_values)
-    return Sheath(polyline_mm=polyline, mask=mask)
+        z_boundary, mask = _sheath_from_phi_drop(phi, z_values)
+    return Sheath.model_construct(polyline_r_mm=r_values, polyline_z_mm=z_boundary, mask=mask)
 
 
 def extract_sheath_z_by_r(sheath: Sheath) -> List[float]:
     """Extract sheath boundary z-values from the polyline."""
-    return [point.z_mm for point in sheath.polyline_mm]
+    return list(sheath.polyline_z_mm)
 
 
 def _format_index_list(indices: List[int], limit: int = 6) -> str:
@@ -2288,7 +2782,7 @@ def compute_sheath_metrics(
     thickness_mean, thickness_min, thickness_max = _summary_stats(thickness_mm_by_r)
     z_mean, z_min, z_max = _summary_stats(z_mm_by_r)
 
-    return SheathMetrics(
+    return SheathMetrics.model_construct(
         z_mm_by_r=z_mm_by_r,
         electrode_z_mm_by_r=electrode_z_mm_by_r,
         thickness_mm_by_r=thickness_mm_by_r,
@@ -2329,7 +2823,7 @@ def compute_delta_sheath_metrics(
         f"perturbed: {msg}" for msg in perturbed.warnings
     ]
 
-    return SheathMetrics(
+    return SheathMetrics.model_construct(
         z_mm_by_r=z_delta,
         electrode_z_mm_by_r=None,
         thickness_mm_by_r=thickness_delta,
@@ -2475,7 +2969,7 @@ def compute_viz_curves(
         else:
             warnings.append("sheath thickness missing; delta thickness unavailable")
 
-    return VizCurves(
+    return VizCurves.model_construct(
         r_mm=r_values,
         sheath_z_mm_by_r=sheath_metrics.z_mm_by_r,
         sheath_thickness_mm_by_r=thickness,
@@ -2551,7 +3045,7 @@ def compute_ion_proxy(
             ion_flux_proxy = None
             warnings.append(f"failed to compute ion_flux_proxy: {exc}")
 
-    return IonProxyCurves(
+    return IonProxyCurves.model_construct(
         ion_energy_proxy_rel_by_r=ion_energy_proxy,
         ion_flux_proxy_rel_by_r=ion_flux_proxy,
         Te_eV_used=te_eV,
@@ -2593,7 +3087,7 @@ def compute_delta_ion_proxy(
         "ion_flux_proxy_rel_by_r",
     )
 
-    return IonProxyCurves(
+    return IonProxyCurves.model_construct(
         ion_energy_proxy_rel_by_r=energy_delta,
         ion_flux_proxy_rel_by_r=flux_delta,
         Te_eV_used=baseline.Te_eV_used,
@@ -2640,7 +3134,7 @@ def compute_insights(
     ne_mean, ne_min, ne_max = _summary_stats_optional(ne_on_sheath)
     t_mean, t_min, t_max = _summary_stats_optional(thickness)
 
-    summary = InsightSummary(
+    summary = InsightSummary.model_construct(
         e_on_sheath_mean=e_mean,
         e_on_sheath_min=e_min,
         e_on_sheath_max=e_max,
@@ -2652,7 +3146,7 @@ def compute_insights(
         thickness_max_mm=t_max,
     )
 
-    return SheathInsights(
+    return SheathInsights.model_construct(
         r_mm=r_values,
         sheath_z_mm_by_r=sheath_metrics.z_mm_by_r,
         sheath_thickness_mm_by_r=thickness,
@@ -2705,7 +3199,7 @@ def compute_delta_insights(
         baseline.sheath_z_mm_by_r, perturbed.sheath_z_mm_by_r, "sheath_z_mm_by_r"
     )
 
-    summary = InsightSummary(
+    summary = InsightSummary.model_construct(
         e_on_sheath_mean=delta_value(
             baseline.summary.e_on_sheath_mean, perturbed.summary.e_on_sheath_mean
         ),
@@ -2738,7 +3232,7 @@ def compute_delta_insights(
     if len(baseline.r_mm) != len(perturbed.r_mm):
         warnings.append("r_mm length mismatch; using baseline r_mm")
 
-    return SheathInsights(
+    return SheathInsights.model_construct(
         r_mm=baseline.r_mm,
         sheath_z_mm_by_r=sheath_z_delta or [],
         sheath_thickness_mm_by_r=thickness_delta,
@@ -2770,27 +3264,29 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
     need_ne_solver = expose_ne or enable_vld
 
     transport = derive_transport_coefficients(request)
-    eps = build_epsilon_map(request)
-    wall_loss_map = build_wall_loss_map(request)
-    vld_geometry_mask = build_vld_geometry_mask(request) if enable_vld else None
+    # Convert the tag masks once for every builder below; kept off the request model so it stays plain data.
+    mask_arrays = _build_tag_mask_arrays(grid)
+    eps = build_epsilon_map(request, mask_arrays)
+    wall_loss_map = build_wall_loss_map(request, mask_arrays)
+    vld_geometry_mask = build_vld_geometry_mask(request, mask_arrays) if enable_vld else None
     powered_voltage = derive_powered_boundary_voltage(request)
     dc_offset = derive_dc_bias_offset(request)
     dirichlet_mask, dirichlet_values = build_dirichlet_mask_values(
         request, powered_voltage=powered_voltage, dc_offset=dc_offset
     )
     A, b = assemble_poisson_matrix(eps, dr, dz, nz, nr, dirichlet_mask, dirichlet_values)
-    phi = solve_phi(A, b, nz, nr)
+    phi_factor = factorize_poisson_matrix(A)
+    phi = solve_phi(A, b, nz, nr, factor=phi_factor)
     e_mag = compute_Emag(phi, dr, dz)
 
     ne_norm_raw: Optional[List[List[float]]] = None
     ne_meta: Optional[NeSolverMetadata] = None
-    plasma_mask = [
-        [grid.region_legend[grid.region_id[k][j]] == "plasma" for j in range(nr)]
-        for k in range(nz)
-    ]
+    plasma_mask = [[region_type == "plasma" for region_type in row] for row in grid.region_type_rows()]
 
     if need_ne_solver:
-        solved_ne, ne_meta = solve_ne_drift_diffusion_sg(phi, request, coefficients=transport)
+        solved_ne, ne_meta = solve_ne_drift_diffusion_sg(
+            phi, request, coefficients=transport, mask_arrays=mask_arrays
+        )
         ne_norm_raw = [
             [solved_ne[k][j] if plasma_mask[k][j] else 0.0 for j in range(nr)]
             for k in range(nz)
@@ -2804,6 +3300,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
             eps,
             request,
             geometry_mask=vld_geometry_mask,
+            mask_arrays=mask_arrays,
         )
         if enable_vld
         else None
@@ -2811,13 +3308,13 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
 
     r_values = _linspace(0.0, domain.r_max_mm, nr)
     z_values = _linspace(0.0, domain.z_max_mm, nz)
-    grid_out = Grid(r_mm=r_values, z_mm=z_values)
+    grid_out = Grid.model_construct(r_mm=r_values, z_mm=z_values)
 
     fields_e = e_mag if enable_efield else None
     fields_ne = ne_norm_raw if expose_ne else None
     has_any_field = fields_e is not None or fields_ne is not None or volume_loss_density is not None
     fields = (
-        FieldGrid(
+        FieldGrid.model_construct(
             E_mag=fields_e,
             ne=fields_ne,
             volume_loss_density=volume_loss_density,
@@ -2834,7 +3331,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
     if enable_sheath:
         sheath_metrics = compute_sheath_metrics(request, sheath, z_values)
         if sheath_metrics is not None:
-            insights_fields = FieldGrid(E_mag=fields_e, ne=fields_ne, volume_loss_density=None, emission=None)
+            insights_fields = FieldGrid.model_construct(E_mag=fields_e, ne=fields_ne, volume_loss_density=None, emission=None)
             if fields_e is not None or fields_ne is not None:
                 insights = compute_insights(request, insights_fields, sheath_metrics, z_values, r_values)
             ion_proxy = compute_ion_proxy(
@@ -2860,12 +3357,16 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
         A2, b2 = assemble_poisson_matrix(
             eps, dr, dz, nz, nr, dirichlet_mask_perturbed, dirichlet_values_perturbed
         )
-        phi2 = solve_phi(A2, b2, nz, nr)
+        # The matrix depends only on eps and the Dirichlet mask; a voltage-only perturbation reuses the factorization.
+        phi2_factor = phi_factor if dirichlet_mask_perturbed == dirichlet_mask else factorize_poisson_matrix(A2)
+        phi2 = solve_phi(A2, b2, nz, nr, factor=phi2_factor)
         e_mag2 = compute_Emag(phi2, dr, dz)
 
         ne_norm2: Optional[List[List[float]]] = None
         if need_ne_solver:
-            solved_ne2, _ = solve_ne_drift_diffusion_sg(phi2, request, coefficients=transport)
+            solved_ne2, _ = solve_ne_drift_diffusion_sg(
+                phi2, request, coefficients=transport, mask_arrays=mask_arrays
+            )
             ne_norm2 = [
                 [solved_ne2[k][j] if plasma_mask[k][j] else 0.0 for j in range(nr)]
                 for k in range(nz)
@@ -2879,6 +3380,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
                 eps,
                 request,
                 geometry_mask=vld_geometry_mask,
+                mask_arrays=mask_arrays,
             )
             if enable_vld
             else None
@@ -2894,7 +3396,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
             delta_sheath_metrics = compute_delta_sheath_metrics(sheath_metrics, sheath_metrics2)
 
             if fields_e is not None or fields_ne is not None:
-                fields2 = FieldGrid(
+                fields2 = FieldGrid.model_construct(
                     E_mag=e_mag2 if enable_efield else None,
                     ne=ne_norm2 if expose_ne else None,
                     volume_loss_density=None,
@@ -2940,7 +3442,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
 
         delta_fields = None
         if delta_e is not None or delta_ne is not None or delta_vld is not None:
-            delta_fields = FieldGrid(
+            delta_fields = FieldGrid.model_construct(
                 E_mag=delta_e,
                 ne=delta_ne,
                 volume_loss_density=delta_vld,
@@ -2951,7 +3453,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
         if delta_sheath_metrics is not None and delta_sheath_metrics.thickness_mm_by_r is not None:
             delta_thickness_mean, _, _ = _summary_stats(delta_sheath_metrics.thickness_mm_by_r)
 
-        compare = Compare(
+        compare = Compare.model_construct(
             enabled=True,
             delta_fields=delta_fields,
             delta_sheath_thickness_mm=delta_thickness_mean,
@@ -2966,7 +3468,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
         else None
     )
 
-    metadata = SimulationMetadata(
+    metadata = SimulationMetadata.model_construct(
         request_id=request_id,
         eta=impedance_delta_to_eta(request.impedance.delta_percent),
         geometry=request.geometry,
@@ -2979,7 +3481,7 @@ def run_simulation_poisson_v1(request: SimulationRequest, request_id: str) -> Si
         ne_solver=ne_meta,
     )
 
-    return SimulationResult(
+    return SimulationResult.model_construct(
         metadata=metadata,
         grid=grid_out,
         fields=fields,
@@ -4,18 +4,23 @@ from __future__ import annotations
 
 from typing import List, Optional
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 from schemas import (
     Compare,
     FieldGrid,
     GeometryGridSummary,
     Grid,
-    Point2D,
     Sheath,
     SimulationMetadata,
     SimulationRequest,
     SimulationResult,
 )
 
+# Result models hold server-generated values only, so they skip validation via model_construct.
 
 _REGION_TYPES = (
     "plasma",
@@ -57,24 +62,34 @@ def _grid_summary(request: SimulationRequest) -> Optional[GeometryGridSummary]:
         return None
 
     region_type_counts = {region_type: 0 for region_type in _REGION_TYPES}
-    for row in grid.region_id:
-        for region_value in row:
+    region_arr = grid.region_array()
+    if region_arr is not None:
+        # Count each distinct id once instead of looking up the legend per cell.
+        region_ids, counts = np.unique(region_arr, return_counts=True)
+        for region_value, count in zip(region_ids.tolist(), counts.tolist()):
             region_type = grid.region_legend.get(region_value)
             if region_type is None:
                 continue
-            region_type_counts[region_type] = region_type_counts.get(region_type, 0) + 1
+            region_type_counts[region_type] = region_type_counts.get(region_type, 0) + count
+    else:
+        for row in grid.region_id:
+            for region_value in row:
+                region_type = grid.region_legend.get(region_value)
+                if region_type is None:
+                    continue
+                region_type_counts[region_type] = region_type_counts.get(region_type, 0) + 1
 
     tag_counts = None
     if grid.tag_mask is not None:
         tag_counts = {}
         for tag, mask in grid.tag_mask.items():
-            tag_counts[tag] = sum(1 for row in mask for cell in row if cell)
+            tag_counts[tag] = sum(row.count(True) for row in mask)
 
-    return GeometryGridSummary(region_type_counts=region_type_counts, tag_counts=tag_counts)
+    return GeometryGridSummary.model_construct(region_type_counts=region_type_counts, tag_counts=tag_counts)
 
 
 def _build_metadata(request: SimulationRequest, request_id: str, eta: float) -> SimulationMetadata:
-    return SimulationMetadata(
+    return SimulationMetadata.model_construct(
         request_id=request_id,
         eta=eta,
         geometry=request.geometry,
@@ -96,7 +111,7 @@ def run_simulation_stub(request: SimulationRequest, request_id: str) -> Simulati
     r_values = _linspace(0.0, domain.r_max_mm, nr)
     z_values = _linspace(0.0, domain.z_max_mm, nz)
 
-    grid = Grid(r_mm=r_values, z_mm=z_values)
+    grid = Grid.model_construct(r_mm=r_values, z_mm=z_values)
     outputs = request.outputs
     show_e = outputs.efield if outputs is not None else True
     show_ne = outputs.ne if outputs is not None else True
@@ -107,7 +122,7 @@ def run_simulation_stub(request: SimulationRequest, request_id: str) -> Simulati
     # Backward-compatible key `volume_loss_density` carries a per-volume
     # absorbed-power-density proxy field (relative).
     vld_field = _make_field(z_values, r_values, scale=4e-3)
-    fields = FieldGrid(
+    fields = FieldGrid.model_construct(
         E_mag=e_field if show_e else None,
         ne=ne_field if show_ne else None,
         volume_loss_density=vld_field if show_vld else None,
@@ -115,19 +130,22 @@ def run_simulation_stub(request: SimulationRequest, request_id: str) -> Simulati
     )
 
     sheath_z = domain.z_max_mm * 0.1
-    polyline = [Point2D(r_mm=r, z_mm=sheath_z) for r in r_values]
     mask = [[z <= sheath_z for _ in r_values] for z in z_values]
-    sheath = Sheath(polyline_mm=polyline, mask=mask)
+    sheath = Sheath.model_construct(
+        polyline_r_mm=r_values,
+        polyline_z_mm=[sheath_z] * len(r_values),
+        mask=mask,
+    )
 
     compare: Optional[Compare] = None
     if request.baseline.enabled:
-        delta_fields = FieldGrid(
+        delta_fields = FieldGrid.model_construct(
             E_mag=_make_field(z_values, r_values, scale=0.05) if show_e else None,
             ne=_make_field(z_values, r_values, scale=0.0) if show_ne else None,
             volume_loss_density=_make_field(z_values, r_values, scale=1e-3) if show_vld else None,
             emission=_make_field(z_values, r_values, scale=-0.02),
         )
-        compare = Compare(
+        compare = Compare.model_construct(
             enabled=True,
             delta_fields=delta_fields,
             delta_sheath_thickness_mm=0.2,
@@ -135,7 +153,7 @@ def run_simulation_stub(request: SimulationRequest, request_id: str) -> Simulati
 
     metadata = _build_metadata(request, request_id, impedance_delta_to_eta(request.impedance.delta_percent))
 
-    return SimulationResult(
+    return SimulationResult.model_construct(
         metadata=metadata,
         grid=grid,
         fields=fields,
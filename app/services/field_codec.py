@@ -0,0 +1,83 @@
+"""Compact encodings for 2D result fields."""
+
+from __future__ import annotations
+
+import base64
+import math
+from typing import List, Optional
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from schemas import Compare, FieldGrid, QuantizedField, SimulationResult
+
+_UINT8_LEVELS = 255
+
+
+def quantize_field(values: List[List[float]]) -> QuantizedField:
+    """Pack a [nz][nr] field into uint8 codes spanning its finite min..max range."""
+    nz = len(values)
+    nr = len(values[0]) if nz > 0 else 0
+    if np is not None:
+        arr = np.asarray(values, dtype=np.float64)
+        finite = arr[np.isfinite(arr)]
+        zero = float(finite.min()) if finite.size else 0.0
+        span = float(finite.max()) - zero if finite.size else 0.0
+        scale = span / _UINT8_LEVELS if span > 0.0 else 1.0
+        steps = np.nan_to_num((arr - zero) / scale, nan=0.0, posinf=_UINT8_LEVELS, neginf=0.0)
+        codes = np.clip(np.rint(steps), 0, _UINT8_LEVELS).astype(np.uint8)
+        payload = codes.tobytes()
+    else:
+        finite_values = [value for row in values for value in row if math.isfinite(value)]
+        zero = min(finite_values) if finite_values else 0.0
+        span = max(finite_values) - zero if finite_values else 0.0
+        scale = span / _UINT8_LEVELS if span > 0.0 else 1.0
+        payload = bytes(
+            min(_UINT8_LEVELS, max(0, round((value - zero) / scale)))
+            if math.isfinite(value)
+            else (_UINT8_LEVELS if value > 0 else 0)
+            for row in values
+            for value in row
+        )
+    return QuantizedField.model_construct(
+        dtype="uint8",
+        shape=(nz, nr),
+        zero=zero,
+        scale=scale,
+        data_b64=base64.b64encode(payload).decode("ascii"),
+    )
+
+
+def dequantize_field(field: QuantizedField) -> List[List[float]]:
+    """Expand a QuantizedField back into nested float rows."""
+    nz, nr = field.shape
+    codes = base64.b64decode(field.data_b64)
+    return [
+        [field.zero + field.scale * code for code in codes[k * nr : (k + 1) * nr]]
+        for k in range(nz)
+    ]
+
+
+def _compact_field_grid(fields: Optional[FieldGrid]) -> Optional[FieldGrid]:
+    if fields is None:
+        return None
+    packed = {
+        name: quantize_field(values) if isinstance(values, list) else values
+        for name, values in (
+            ("E_mag", fields.E_mag),
+            ("ne", fields.ne),
+            ("volume_loss_density", fields.volume_loss_density),
+            ("emission", fields.emission),
+        )
+    }
+    return FieldGrid.model_construct(**packed)
+
+
+def compact_result(result: SimulationResult) -> SimulationResult:
+    """Return a copy of result whose 2D fields (including compare deltas) are quantized."""
+    compare: Optional[Compare] = result.compare
+    if compare is not None:
+        compare = compare.model_copy(update={"delta_fields": _compact_field_grid(compare.delta_fields)})
+    return result.model_copy(update={"fields": _compact_field_grid(result.fields), "compare": compare})
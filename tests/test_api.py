@@ -0,0 +1,141 @@
+"""HTTP-level tests for the simulation endpoint."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+import main
+from schemas import SimulationRequest
+from services.compute_poisson_v1 import run_simulation_poisson_v1
+from services.compute_stub import run_simulation_stub
+
+
+def _request_payload() -> dict:
+    return {
+        "meta": {"request_id": "api-test"},
+        "geometry": {
+            "axisymmetric": True,
+            "coordinate_system": "r-z",
+            "domain": {"r_max_mm": 10.0, "z_max_mm": 20.0, "nr": 4, "nz": 4},
+            "tags": ["showerhead", "bottom_pump", "dielectric_block"],
+            "grid": {
+                "schema": "mask_v1",
+                "nr": 4,
+                "nz": 4,
+                "region_id": [
+                    [2, 2, 1, 1],
+                    [0, 0, 1, 1],
+                    [4, 4, 3, 3],
+                    [4, 4, 3, 3],
+                ],
+                "region_legend": {
+                    "0": "plasma",
+                    "1": "solid_wall",
+                    "2": "powered_electrode",
+                    "3": "ground_electrode",
+                    "4": "dielectric",
+                },
+                "tag_mask": {
+                    "dielectric_block": [
+                        [False, False, False, False],
+                        [False, False, False, False],
+                        [True, True, False, False],
+                        [True, True, False, False],
+                    ]
+                },
+            },
+        },
+        "process": {"pressure_Pa": 10.0, "rf_power_W": 100.0, "frequency_Hz": 13_560_000.0},
+        "gas": {"mixture": [{"species": "Ar", "fraction": 1.0}]},
+        "flow_boundary": {
+            "inlet": {"type": "surface", "surface_tag": "showerhead", "total_flow_sccm": 10.0},
+            "outlet": {"type": "sink", "surface_tag": "bottom_pump", "strength": 1.0},
+        },
+        "material": {"default": {"epsilon_r": 4.0, "wall_loss_e": 0.2}},
+        "impedance": {"delta_percent": 5.0},
+        "baseline": {"enabled": False},
+    }
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(main, "_AUTH_DB_PATH", str(tmp_path / "auth.sqlite3"))
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def test_inline_response_keeps_null_result_keys(client: TestClient) -> None:
+    request = SimulationRequest.model_validate(_request_payload())
+    expected = run_simulation_stub(request, "api-test").model_dump(mode="json")
+
+    for path in ("/simulate", "/api/simulate"):
+        response = client.post(path, json=_request_payload())
+        assert response.status_code == 200
+        body = response.json()
+        assert body["stored"] is False
+        assert body["storage"]["backend"] == "inline"
+        assert body["result"] == expected
+        assert None in body["result"].values()
+
+
+def test_large_result_is_stored_without_null_keys(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(main, "settings", dataclasses.replace(main.settings, inline_max_bytes=0))
+    monkeypatch.setattr(main.store, "local_dir", str(tmp_path / "results"))
+    monkeypatch.setattr(main.store, "prefix", "")
+
+    response = client.post("/simulate", json=_request_payload())
+    assert response.status_code == 200
+    body = response.json()
+    assert body["stored"] is True
+    assert body["result"] is None
+    assert body["storage"]["backend"] == "local"
+
+    stored = Path(body["storage"]["local_path"]).read_bytes()
+    assert body["size_bytes"] == len(stored)
+    request = SimulationRequest.model_validate(_request_payload())
+    expected = run_simulation_stub(request, "api-test").model_dump(mode="json", exclude_none=True)
+    assert json.loads(stored) == expected
+
+
+def test_invalid_json_body_is_a_422(client: TestClient) -> None:
+    response = client.post("/simulate", content=b'{"meta": ', headers={"content-type": "application/json"})
+    assert response.status_code == 422
+    (error,) = response.json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body"]
+
+
+def test_schema_violation_is_a_422_with_body_locations(client: TestClient) -> None:
+    payload = _request_payload()
+    del payload["process"]
+    payload["geometry"]["domain"]["nr"] = 1
+
+    response = client.post("/api/simulate", json=payload)
+    assert response.status_code == 422
+    locations = {tuple(error["loc"]) for error in response.json()["detail"]}
+    assert ("body", "process") in locations
+    assert ("body", "geometry", "domain", "nr") in locations
+
+
+def test_poisson_request_runs_in_worker_pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main, "_AUTH_DB_PATH", str(tmp_path / "auth.sqlite3"))
+    request = SimulationRequest.model_validate(_request_payload())
+    expected = run_simulation_poisson_v1(request, "api-test").model_dump(mode="json")
+
+    # Two app lifespans in a row: shutdown must leave a fresh pool for the next startup.
+    for _ in range(2):
+        with TestClient(main.app) as test_client:
+            response = test_client.post("/simulate?mode=poisson_v1", json=_request_payload())
+            assert main._SIM_POOL is not None
+        assert main._SIM_POOL is None
+        assert response.status_code == 200
+        assert response.json()["result"] == expected
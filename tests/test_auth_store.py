@@ -0,0 +1,345 @@
+"""SQLite auth store tests."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+import threading
+
+import pytest
+
+from services import auth_store
+from services.auth_store import (
+    _SESSION_CACHE,
+    admin_update_user,
+    authenticate_user,
+    bootstrap_admin_user,
+    create_session,
+    create_user,
+    delete_session,
+    get_cached_user_by_session_token,
+    get_user_by_email,
+    get_user_by_session_token,
+    init_auth_db,
+    list_users,
+    start_session_sweeper,
+    sweep_expired_sessions,
+    update_user_billing,
+)
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "auth.sqlite3")
+    init_auth_db(path)
+    return path
+
+
+def test_create_and_authenticate_user(db_path: str) -> None:
+    user = create_user(db_path, " Alice@Example.com ", "correct-horse")
+    assert user["email"] == "alice@example.com"
+    assert user["role"] == "user"
+
+    assert authenticate_user(db_path, "alice@example.com", "correct-horse")["id"] == user["id"]
+    assert authenticate_user(db_path, "alice@example.com", "wrong-password") is None
+    assert authenticate_user(db_path, "nobody@example.com", "correct-horse") is None
+
+
+def test_repeat_authentication_skips_pbkdf2(db_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    create_user(db_path, "gina@example.com", "correct-horse")
+    calls = []
+    verify = auth_store._verify_password
+    monkeypatch.setattr(auth_store, "_verify_password", lambda *args: calls.append(args) or verify(*args))
+
+    assert authenticate_user(db_path, "gina@example.com", "correct-horse") is not None
+    assert authenticate_user(db_path, "gina@example.com", "correct-horse") is not None
+    assert authenticate_user(db_path, "gina@example.com", "wrong-horse") is None
+    assert len(calls) == 2
+
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("UPDATE users SET password_hash = ?", (auth_store._hash_password("new-password"),))
+    assert authenticate_user(db_path, "gina@example.com", "correct-horse") is None
+    assert authenticate_user(db_path, "gina@example.com", "new-password") is not None
+
+
+def test_duplicate_email_is_rejected(db_path: str) -> None:
+    create_user(db_path, "bob@example.com", "password-1")
+    with pytest.raises(ValueError, match="exists"):
+        create_user(db_path, "BOB@example.com", "password-2")
+    assert len(list_users(db_path)) == 1
+
+
+def test_legacy_mixed_case_email_rows_still_match(db_path: str) -> None:
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "INSERT INTO users (email, password_hash, created_at, updated_at) VALUES (?, ?, ?, ?)",
+            ("Ivy@Example.com", auth_store._hash_password("password-1"), "t", "t"),
+        )
+    assert authenticate_user(db_path, "ivy@example.com", "password-1") is not None
+    with pytest.raises(ValueError, match="exists"):
+        create_user(db_path, "ivy@example.com", "password-2")
+
+
+def test_init_tolerates_legacy_case_variant_duplicates(tmp_path: Path) -> None:
+    path = str(tmp_path / "legacy.sqlite3")
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            """
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                email TEXT NOT NULL UNIQUE,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL DEFAULT 'user',
+                compare_access_enabled INTEGER NOT NULL DEFAULT 0,
+                compare_access_expires_at TEXT,
+                stripe_customer_id TEXT,
+                stripe_subscription_id TEXT,
+                stripe_subscription_status TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        connection.executemany(
+            "INSERT INTO users (email, password_hash, created_at, updated_at) VALUES (?, ?, 't', 't')",
+            [("Ivy@Example.com", auth_store._hash_password("password-1")), ("ivy@example.com", "x")],
+        )
+
+    init_auth_db(path)
+    with pytest.raises(ValueError, match="exists"):
+        create_user(path, "IVY@example.com", "password-2")
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM users WHERE email = 'ivy@example.com'")
+    init_auth_db(path)
+    with sqlite3.connect(path) as connection:
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_users_email_lower" in indexes
+    assert "idx_users_email_lower_nonunique" not in indexes
+
+
+def test_session_round_trip(db_path: str) -> None:
+    user = create_user(db_path, "carol@example.com", "password-1")
+    token, expires_at, max_age = create_session(db_path, user["id"], session_days=3)
+    assert expires_at
+    assert max_age == 3 * 24 * 60 * 60
+
+    loaded = get_user_by_session_token(db_path, token)
+    assert loaded is not None
+    assert loaded["id"] == user["id"]
+
+    delete_session(db_path, token)
+    assert get_user_by_session_token(db_path, token) is None
+    assert get_user_by_session_token(db_path, "not-a-token") is None
+
+
+def test_cached_lookup_never_reads_the_database(db_path: str) -> None:
+    user = create_user(db_path, "olga@example.com", "password-1")
+    token, _, _ = create_session(db_path, user["id"], session_days=1)
+    _SESSION_CACHE.clear()
+
+    assert get_cached_user_by_session_token(db_path, token) is None
+    assert get_user_by_session_token(db_path, token)["id"] == user["id"]
+    assert get_cached_user_by_session_token(db_path, token)["id"] == user["id"]
+
+    delete_session(db_path, token)
+    assert get_cached_user_by_session_token(db_path, token) is None
+
+
+def test_cached_session_sees_local_user_updates(db_path: str) -> None:
+    user = create_user(db_path, "erin@example.com", "password-1")
+    token, _, _ = create_session(db_path, user["id"], session_days=1)
+    assert get_user_by_session_token(db_path, token)["role"] == "user"
+
+    admin_update_user(db_path, user["id"], role="admin")
+    assert get_user_by_session_token(db_path, token)["role"] == "admin"
+
+    update_user_billing(db_path, user["id"], stripe_customer_id="cus_erin")
+    assert get_user_by_session_token(db_path, token)["stripe_customer_id"] == "cus_erin"
+
+
+def test_last_seen_at_is_only_refreshed_when_stale(db_path: str) -> None:
+    user = create_user(db_path, "frank@example.com", "password-1")
+    token, _, _ = create_session(db_path, user["id"], session_days=1)
+
+    def last_seen_at() -> int:
+        with sqlite3.connect(db_path) as connection:
+            return connection.execute("SELECT last_seen_at FROM sessions").fetchone()[0]
+
+    created = last_seen_at()
+    _SESSION_CACHE.clear()
+    get_user_by_session_token(db_path, token)
+    assert last_seen_at() == created
+
+    stale = created - 3600
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("UPDATE sessions SET last_seen_at = ?", (stale,))
+    _SESSION_CACHE.clear()
+    get_user_by_session_token(db_path, token)
+    assert last_seen_at() > stale
+
+
+def test_init_migrates_hex_token_hashes_to_blobs(db_path: str) -> None:
+    user = create_user(db_path, "hank@example.com", "password-1")
+    token, _, _ = create_session(db_path, user["id"], session_days=1)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("UPDATE sessions SET token_hash = hex(token_hash)")
+
+    init_auth_db(db_path)
+    _SESSION_CACHE.clear()
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT typeof(token_hash) FROM sessions").fetchone()[0] == "blob"
+    assert get_user_by_session_token(db_path, token)["id"] == user["id"]
+
+
+def test_init_schema_rolls_back_with_its_write_transaction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = str(tmp_path / "fresh.sqlite3")
+
+    def fail(*_: object) -> None:
+        raise RuntimeError("migration failed")
+
+    monkeypatch.setattr(auth_store, "_column_names", fail)
+    with pytest.raises(RuntimeError, match="migration failed"):
+        init_auth_db(path)
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall() == []
+
+
+def test_init_migrates_iso_session_timestamps(tmp_path: Path) -> None:
+    path = str(tmp_path / "legacy.sqlite3")
+    token = "legacy-token"
+    created = "2024-01-01T00:00:00+00:00"
+    with sqlite3.connect(path) as connection:
+        connection.executescript(
+            """
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                email TEXT NOT NULL UNIQUE,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL DEFAULT 'user',
+                compare_access_enabled INTEGER NOT NULL DEFAULT 0,
+                compare_access_expires_at TEXT,
+                stripe_customer_id TEXT,
+                stripe_subscription_id TEXT,
+                stripe_subscription_status TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                token_hash TEXT NOT NULL UNIQUE,
+                created_at TEXT NOT NULL,
+                last_seen_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            );
+            """
+        )
+        connection.execute(
+            "INSERT INTO users (email, password_hash, created_at, updated_at) VALUES ('kim@example.com', 'x', 't', 't')"
+        )
+        connection.executemany(
+            "INSERT INTO sessions (user_id, token_hash, created_at, last_seen_at, expires_at) VALUES (1, ?, ?, ?, ?)",
+            [
+                (auth_store._session_hash(token).hex(), created, created, "2999-01-01T00:00:00+00:00"),
+                (auth_store._session_hash("expired").hex(), created, "bogus", "bogus"),
+            ],
+        )
+
+    init_auth_db(path)
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute("SELECT typeof(expires_at), last_seen_at, expires_at FROM sessions ORDER BY id").fetchall()
+    assert rows == [("integer", 1704067200, 32472144000), ("integer", 1704067200, 0)]
+    assert get_user_by_session_token(path, token)["email"] == "kim@example.com"
+    assert get_user_by_session_token(path, "expired") is None
+
+
+def test_sweeper_removes_expired_sessions(db_path: str) -> None:
+    user = create_user(db_path, "lee@example.com", "password-1")
+    live, _, _ = create_session(db_path, user["id"], session_days=1)
+    create_session(db_path, user["id"], session_days=1)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("UPDATE sessions SET expires_at = 0 WHERE id = 2")
+
+    assert sweep_expired_sessions(db_path) == 1
+    assert sweep_expired_sessions(db_path) == 0
+    assert get_user_by_session_token(db_path, live)["id"] == user["id"]
+
+    stop = start_session_sweeper(db_path, interval_seconds=60.0)
+    assert stop is not None
+    assert start_session_sweeper(db_path) is stop
+    stop.set()
+    assert start_session_sweeper(":memory:") is None
+
+
+def test_updates_are_visible_to_later_reads(db_path: str) -> None:
+    user = create_user(db_path, "dave@example.com", "password-1")
+
+    updated = admin_update_user(db_path, user["id"], role="admin", compare_access_enabled=True)
+    assert updated["role"] == "admin"
+    assert updated["compare_access_enabled"] is True
+
+    billed = update_user_billing(
+        db_path,
+        user["id"],
+        stripe_customer_id="cus_123",
+        compare_access_expires_at="2000-01-01T00:00:00+00:00",
+    )
+    assert billed["stripe_customer_id"] == "cus_123"
+    assert billed["compare_access_granted"] is True
+    assert billed["compare_access_enabled"] is False
+
+    reloaded = get_user_by_email(db_path, "dave@example.com")
+    assert reloaded == billed
+
+    with pytest.raises(ValueError, match="not found"):
+        admin_update_user(db_path, 9999, role="user")
+
+
+def test_partial_updates_keep_untouched_columns(db_path: str) -> None:
+    user = create_user(db_path, "jane@example.com", "password-1")
+    update_user_billing(db_path, user["id"], stripe_customer_id="cus_jane", stripe_subscription_status="active")
+
+    updated = admin_update_user(db_path, user["id"], role="admin")
+    assert (updated["role"], updated["stripe_customer_id"]) == ("admin", "cus_jane")
+
+    cleared = update_user_billing(db_path, user["id"], stripe_customer_id="")
+    assert cleared["stripe_customer_id"] is None
+    assert cleared["stripe_subscription_status"] == "active"
+    assert cleared["role"] == "admin"
+
+
+def test_bootstrap_admin_user_is_idempotent(db_path: str) -> None:
+    create_user(db_path, "root@example.com", "password-1")
+
+    first = bootstrap_admin_user(db_path, "root@example.com", "password-1")
+    second = bootstrap_admin_user(db_path, "root@example.com", "password-1")
+    assert first is not None and first["role"] == "admin"
+    assert second == first
+    assert len(list_users(db_path)) == 1
+    assert bootstrap_admin_user(db_path, "", "") is None
+
+
+def test_thread_connection_is_closed_when_its_thread_exits(db_path: str) -> None:
+    opened: list[sqlite3.Connection] = []
+    worker = threading.Thread(target=lambda: opened.append(auth_store._thread_connection(db_path)))
+    worker.start()
+    worker.join()
+
+    with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+        opened[0].execute("SELECT 1")
+    assert auth_store._thread_connection(db_path).execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_concurrent_writers_on_separate_threads(db_path: str) -> None:
+    def register(index: int) -> int:
+        user = create_user(db_path, f"user{index}@example.com", "password-1")
+        token, _, _ = create_session(db_path, user["id"], session_days=1)
+        return get_user_by_session_token(db_path, token)["id"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        user_ids = list(pool.map(register, range(6)))
+
+    assert sorted(user_ids) == sorted(user["id"] for user in list_users(db_path))
+    assert len(set(user_ids)) == 6
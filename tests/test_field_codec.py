@@ -0,0 +1,45 @@
+"""Compact field encoding tests."""
+
+from __future__ import annotations
+
+import math
+
+from schemas import FieldGrid, QuantizedField, SimulationRequest, SimulationResult
+from services.compute_stub import run_simulation_stub
+from services.field_codec import compact_result, dequantize_field, quantize_field
+from test_poisson_v1 import _poisson_request_payload
+
+
+def test_quantize_round_trip_within_one_step() -> None:
+    values = [[0.0, 0.25, 0.5], [0.75, 1.0, -1.0]]
+    packed = quantize_field(values)
+
+    assert packed.shape == (2, 3)
+    restored = dequantize_field(packed)
+    for row, restored_row in zip(values, restored):
+        for value, restored_value in zip(row, restored_row):
+            assert abs(value - restored_value) <= packed.scale / 2 + 1e-12
+
+
+def test_quantize_constant_and_non_finite_fields() -> None:
+    constant = quantize_field([[2.0, 2.0], [2.0, 2.0]])
+    assert dequantize_field(constant) == [[2.0, 2.0], [2.0, 2.0]]
+
+    packed = quantize_field([[0.0, math.nan], [math.inf, 1.0]])
+    restored = dequantize_field(packed)
+    assert restored[0][0] == 0.0
+    assert restored[1][1] == 1.0
+
+
+def test_compact_result_quantizes_fields_and_deltas() -> None:
+    payload = _poisson_request_payload()
+    payload["baseline"] = {"enabled": True}
+    payload["outputs"] = {"compact": True}
+    request = SimulationRequest.model_validate(payload)
+
+    result = compact_result(run_simulation_stub(request, "compact"))
+
+    assert isinstance(result.fields.E_mag, QuantizedField)
+    assert isinstance(result.compare.delta_fields.E_mag, QuantizedField)
+    dumped = result.model_dump(mode="json", exclude_none=True)
+    assert SimulationResult.model_validate(dumped).fields == FieldGrid.model_validate(dumped["fields"])
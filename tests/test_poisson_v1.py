@@ -5,7 +5,9 @@ from __future__ import annotations
 import copy
 import math
 
-from schemas import FieldGrid, SimulationRequest
+import pytest
+
+from schemas import FieldGrid, SimulationRequest, SimulationResult
 from services import compute_poisson_v1
 from services.compute_poisson_v1 import (
     assemble_poisson_matrix,
@@ -18,6 +20,7 @@ from services.compute_poisson_v1 import (
     derive_powered_boundary_voltage,
     derive_transport_coefficients,
     estimate_te_eV,
+    factorize_poisson_matrix,
     run_simulation_poisson_v1,
     solve_phi,
 )
@@ -290,10 +293,11 @@ def test_poisson_v1_sheath_and_ne_shapes() -> None:
     result = run_simulation_poisson_v1(request, "test")
 
     sheath = result.sheath
-    assert len(sheath.polyline_mm) == request.geometry.domain.nr
-    for point in sheath.polyline_mm:
-        assert 0.0 <= point.r_mm <= request.geometry.domain.r_max_mm
-        assert 0.0 <= point.z_mm <= request.geometry.domain.z_max_mm
+    assert len(sheath.polyline_r_mm) == request.geometry.domain.nr
+    assert len(sheath.polyline_z_mm) == request.geometry.domain.nr
+    for r_mm, z_mm in zip(sheath.polyline_r_mm, sheath.polyline_z_mm):
+        assert 0.0 <= r_mm <= request.geometry.domain.r_max_mm
+        assert 0.0 <= z_mm <= request.geometry.domain.z_max_mm
 
     mask = sheath.mask
     assert len(mask) == request.geometry.domain.nz
@@ -314,6 +318,22 @@ def test_poisson_v1_sheath_and_ne_shapes() -> None:
     assert ne_meta.method == "drift_diffusion_sg_v1"
 
 
+def test_poisson_v1_grid_summary_counts() -> None:
+    payload = _poisson_request_payload()
+    request = SimulationRequest.model_validate(payload)
+    summary = run_simulation_poisson_v1(request, "test").metadata.grid_summary
+
+    assert summary is not None
+    assert summary.region_type_counts == {
+        "plasma": 2,
+        "solid_wall": 4,
+        "powered_electrode": 2,
+        "ground_electrode": 4,
+        "dielectric": 4,
+    }
+    assert summary.tag_counts == {"dielectric_block": 4}
+
+
 def test_poisson_v1_deterministic_output() -> None:
     payload = _poisson_request_payload()
     request = SimulationRequest.model_validate(payload)
@@ -324,10 +344,34 @@ def test_poisson_v1_deterministic_output() -> None:
     _assert_close_grid(result_a.fields.E_mag, result_b.fields.E_mag)
     _assert_close_grid(result_a.fields.ne, result_b.fields.ne)
 
-    assert result_a.sheath.polyline_mm == result_b.sheath.polyline_mm
+    assert result_a.sheath.polyline_r_mm == result_b.sheath.polyline_r_mm
+    assert result_a.sheath.polyline_z_mm == result_b.sheath.polyline_z_mm
     assert result_a.sheath.mask == result_b.sheath.mask
 
 
+def test_solving_leaves_request_models_comparable() -> None:
+    request_a = SimulationRequest.model_validate(_pad_request_payload())
+    request_b = SimulationRequest.model_validate(_pad_request_payload())
+
+    run_simulation_poisson_v1(request_a, "test")
+    assert request_a == request_b
+    result = run_simulation_poisson_v1(request_b, "test")
+    assert request_a == request_b
+    assert request_a.geometry.grid.__pydantic_private__ in (None, {})
+    assert result.metadata.geometry == request_a.geometry
+
+
+def test_poisson_v1_result_passes_validation() -> None:
+    payload = _poisson_request_payload()
+    payload["baseline"] = {"enabled": True}
+    request = SimulationRequest.model_validate(payload)
+
+    result = run_simulation_poisson_v1(request, "test")
+    dumped = result.model_dump(mode="json")
+
+    assert SimulationResult.model_validate(dumped).model_dump(mode="json") == dumped
+
+
 def test_ne_solver_fallback(monkeypatch) -> None:
     payload = _poisson_request_payload()
     request = SimulationRequest.model_validate(payload)
@@ -575,6 +619,55 @@ def test_cg_fallback_solves_spd() -> None:
     assert abs(solution[1] - (7.0 / 11.0)) < 1e-6
 
 
+def test_array_cg_fallback_matches_list_cg(monkeypatch) -> None:
+    request = SimulationRequest.model_validate(_pad_request_payload())
+    eps = build_epsilon_map(request)
+    dirichlet_mask, dirichlet_values = build_dirichlet_mask_values(request, powered_voltage=1.0)
+    monkeypatch.setattr(compute_poisson_v1, "sp", None)
+    rows, rhs = assemble_poisson_matrix(eps, 2.4, 2.4, 6, 6, dirichlet_mask, dirichlet_values)
+
+    phi = solve_phi(rows, rhs, 6, 6)
+    monkeypatch.setattr(compute_poisson_v1, "np", None)
+    loop_phi = solve_phi(rows, rhs, 6, 6)
+
+    for row, loop_row in zip(phi, loop_phi):
+        for value, loop_value in zip(row, loop_row):
+            assert math.isclose(value, loop_value, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def test_diagonal_poisson_assembly_matches_per_cell_loop(monkeypatch) -> None:
+    pytest.importorskip("scipy.sparse")
+    request = SimulationRequest.model_validate(_pad_request_payload())
+    eps = build_epsilon_map(request)
+    dirichlet_mask, dirichlet_values = build_dirichlet_mask_values(request, powered_voltage=1.0)
+    args = (eps, 2.4, 2.4, 6, 6, dirichlet_mask, dirichlet_values)
+
+    matrix, rhs = assemble_poisson_matrix(*args)
+    monkeypatch.setattr(compute_poisson_v1, "sp", None)
+    rows, loop_rhs = assemble_poisson_matrix(*args)
+
+    assert rhs == loop_rhs
+    dense = matrix.toarray().tolist()
+    for i, row in enumerate(rows):
+        assert {j: value for j, value in enumerate(dense[i]) if value != 0.0} == row
+
+
+def test_reused_poisson_factorization_matches_spsolve() -> None:
+    pytest.importorskip("scipy.sparse")
+    request = SimulationRequest.model_validate(_pad_request_payload())
+    eps = build_epsilon_map(request)
+    dirichlet_mask, dirichlet_values = build_dirichlet_mask_values(request, powered_voltage=1.0)
+    _, perturbed_values = build_dirichlet_mask_values(request, powered_voltage=1.02)
+
+    matrix, rhs = assemble_poisson_matrix(eps, 2.4, 2.4, 6, 6, dirichlet_mask, dirichlet_values)
+    _, perturbed_rhs = assemble_poisson_matrix(eps, 2.4, 2.4, 6, 6, dirichlet_mask, perturbed_values)
+    factor = factorize_poisson_matrix(matrix)
+
+    assert factor is not None
+    assert solve_phi(matrix, rhs, 6, 6, factor=factor) == solve_phi(matrix, rhs, 6, 6)
+    assert solve_phi(matrix, perturbed_rhs, 6, 6, factor=factor) == solve_phi(matrix, perturbed_rhs, 6, 6)
+
+
 def test_transport_coefficients_are_positive() -> None:
     payload = _poisson_request_payload()
     request = SimulationRequest.model_validate(payload)
@@ -618,6 +711,23 @@ def test_powered_boundary_voltage_tracks_power_pressure_and_gas() -> None:
     assert derive_powered_boundary_voltage(high) > derive_powered_boundary_voltage(low)
 
 
+def test_species_factor_weights_mixture_and_short_circuits_single_gas() -> None:
+    table = compute_poisson_v1._IONIZATION_FACTOR_BY_SPECIES
+
+    payload = _poisson_request_payload()
+    payload["gas"]["mixture"] = [{"species": " O2 ", "fraction": 0.9999995}]
+    single = SimulationRequest.model_validate(payload)
+    assert compute_poisson_v1._weighted_species_factor(single, table, 1.0) == table["o2"]
+
+    payload["gas"]["mixture"] = [
+        {"species": "Ar", "fraction": 0.5},
+        {"species": "He", "fraction": 0.5},
+    ]
+    mixed = SimulationRequest.model_validate(payload)
+    expected = 0.5 * (table["ar"] + table["he"])
+    assert math.isclose(compute_poisson_v1._weighted_species_factor(mixed, table, 1.0), expected)
+
+
 def test_rf_sources_override_legacy_power_frequency_inputs() -> None:
     payload = _poisson_request_payload()
     payload["process"]["rf_power_W"] = 20.0
@@ -757,6 +867,96 @@ def test_inlet_emit_side_changes_ne_solution() -> None:
     assert max_delta > 1e-4
 
 
+def test_flow_maps_match_pure_python_fallback(monkeypatch) -> None:
+    payload = _poisson_request_payload()
+    payload["geometry"]["grid"]["tag_mask"]["showerhead"] = [
+        [False, False, False, False],
+        [False, False, False, False],
+        [False, False, False, False],
+        [True, True, False, False],
+    ]
+    payload["geometry"]["grid"]["tag_mask"]["bottom_pump"] = [
+        [False, True, True, False],
+        [False, False, False, False],
+        [False, False, False, False],
+        [False, False, False, False],
+    ]
+    payload["flow_boundary"]["inlet"]["emit_side"] = "right"
+    payload["flow_boundary"]["inlet"]["active_width_percent"] = 25.0
+    request = SimulationRequest.model_validate(payload)
+    tag_mask = request.geometry.grid.tag_mask
+
+    def build_maps():
+        warnings: list[str] = []
+        inlet_map, coverage = compute_poisson_v1._build_inlet_source_map(request, 4, 4, tag_mask, warnings)
+        outlet_map, total = compute_poisson_v1._build_outlet_strength_map(request, 4, 4, tag_mask, warnings)
+        return compute_poisson_v1._as_rows(inlet_map), coverage, compute_poisson_v1._as_rows(outlet_map), total, warnings
+
+    vectorized = build_maps()
+    monkeypatch.setattr(compute_poisson_v1, "np", None)
+    assert build_maps() == vectorized
+    assert vectorized[0][3] == [1.0, 1.0, 0.0, 0.0]
+    assert vectorized[2][0] == [0.0, vectorized[3], vectorized[3], 0.0]
+    assert any("fell back to full inlet surface" in warning for warning in vectorized[4])
+
+
+def test_wall_loss_map_matches_pure_python_fallback(monkeypatch) -> None:
+    payload = _poisson_request_payload()
+    payload["geometry"]["grid"]["tag_mask"]["showerhead"] = [
+        [False, False, False, False],
+        [False, False, False, False],
+        [True, False, False, False],
+        [True, True, True, True],
+    ]
+    payload["material"]["regions"] = [
+        {"target_tag": "dielectric_block", "wall_loss_e": 0.6},
+        {"target_tag": "showerhead", "wall_loss_e": 0.9},
+    ]
+    request = SimulationRequest.model_validate(payload)
+
+    wall_loss = compute_poisson_v1.build_wall_loss_map(request)
+    monkeypatch.setattr(compute_poisson_v1, "np", None)
+    assert compute_poisson_v1.build_wall_loss_map(request) == wall_loss
+    assert wall_loss[0] == [0.2, 0.2, 0.2, 0.2]
+    assert wall_loss[2] == [0.9, 0.6, 0.2, 0.2]
+    assert wall_loss[3] == [0.9, 0.9, 0.9, 0.9]
+
+
+def test_volume_loss_density_matches_pure_python_fallback(monkeypatch) -> None:
+    request = SimulationRequest.model_validate(_pad_request_payload())
+    eps = build_epsilon_map(request)
+    wall_loss = compute_poisson_v1.build_wall_loss_map(request)
+    geometry_mask = compute_poisson_v1.build_vld_geometry_mask(request)
+    e_mag = [[float(k + j) for j in range(6)] for k in range(6)]
+    e_mag[2][3] = float("nan")
+    ne_norm = [[0.05 * (k * 6 + j) for j in range(6)] for k in range(6)]
+
+    def build_maps():
+        return (
+            compute_poisson_v1.compute_volume_loss_density(ne_norm, e_mag, wall_loss, eps, request, geometry_mask),
+            compute_poisson_v1.compute_volume_loss_density(ne_norm, e_mag, wall_loss, eps, request),
+        )
+
+    vectorized = build_maps()
+    monkeypatch.setattr(compute_poisson_v1, "np", None)
+    assert build_maps() == vectorized
+    assert any(value > 0.0 for row in vectorized[0] for value in row)
+
+
+def test_influence_spread_matches_pure_python_fallback(monkeypatch) -> None:
+    source = [
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 2.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.5],
+    ]
+    spread = compute_poisson_v1._spread_outlet_influence(source, steps=6, decay=0.88)
+    monkeypatch.setattr(compute_poisson_v1, "np", None)
+    assert compute_poisson_v1._spread_outlet_influence(source, steps=6, decay=0.88) == spread
+    assert spread[1][1] == 2.0
+    assert spread[0][1] == 2.0 * 0.88
+    assert spread[2][4] == 2.0 * 0.88 ** 4
+
+
 def test_rf_power_decade_changes_ne_solution() -> None:
     low_payload = _poisson_request_payload()
     low_payload["process"]["rf_power_W"] = 500.0
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
-from schemas import SimulationRequest, SimulationResponse
+from schemas import GeometryGrid, Sheath, SimulationRequest, SimulationResponse
 
 
 def _base_request() -> dict:
@@ -167,6 +167,21 @@ def test_rf_sources_accepts_up_to_three_sources() -> None:
     SimulationRequest.model_validate(payload)
 
 
+def test_tags_are_stripped_and_blank_tags_rejected() -> None:
+    payload = _base_request()
+    payload["flow_boundary"]["inlet"]["surface_tag"] = "  showerhead "
+    payload["process"]["rf_sources"] = [
+        {"surface_tag": "   ", "rf_power_W": 100.0, "frequency_Hz": 13_560_000.0},
+    ]
+    request = SimulationRequest.model_validate(payload)
+    assert request.flow_boundary.inlet.surface_tag == "showerhead"
+    assert request.process.rf_sources[0].surface_tag is None
+
+    payload["flow_boundary"]["outlet"]["surface_tag"] = "  "
+    with pytest.raises(ValidationError):
+        SimulationRequest.model_validate(payload)
+
+
 def test_rf_sources_rejects_more_than_three_sources() -> None:
     payload = _base_request()
     payload["process"]["rf_sources"] = [
@@ -285,6 +300,20 @@ def test_flow_boundary_rejects_outlet_and_outlets_together() -> None:
         SimulationRequest.model_validate(payload)
 
 
+def test_flow_boundary_folds_single_outlet_into_outlets() -> None:
+    request = SimulationRequest.model_validate(_base_request())
+    assert [outlet.surface_tag for outlet in request.flow_boundary.outlets] == ["bottom_pump"]
+    assert "outlet" not in request.flow_boundary.model_dump()
+
+    payload = _base_request()
+    del payload["flow_boundary"]["outlet"]
+    assert SimulationRequest.model_validate(payload).flow_boundary.outlets == []
+
+    payload["flow_boundary"]["outlets"] = []
+    with pytest.raises(ValidationError, match="at least one outlet"):
+        SimulationRequest.model_validate(payload)
+
+
 def test_flow_boundary_outlets_tag_must_exist() -> None:
     payload = _base_request()
     payload["flow_boundary"] = {
@@ -332,7 +361,7 @@ def test_material_region_tag_must_exist_in_geometry_tags() -> None:
     payload = _base_request()
     payload["geometry"]["tags"] = ["liner", "bottom_pump", "showerhead"]
     payload["material"]["regions"] = [{"target_tag": "ghost", "epsilon_r": 4.2}]
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError, match=r"material\.regions\[0\]\.target_tag 'ghost' not found"):
         SimulationRequest.model_validate(payload)
 
 
@@ -346,7 +375,7 @@ def test_geometry_grid_shape_mismatch() -> None:
 def test_region_id_requires_legend() -> None:
     payload = _base_request()
     payload["geometry"]["grid"]["region_id"][0][0] = 99
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError, match="unknown id 99"):
         SimulationRequest.model_validate(payload)
 
 
@@ -370,7 +399,7 @@ def test_tag_mask_requires_known_tag() -> None:
             [False, False, False, False],
         ]
     }
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError, match=r"geometry\.grid\.tag_mask\['ghost'\] not found"):
         SimulationRequest.model_validate(payload)
 
 
@@ -446,3 +475,33 @@ def test_response_with_insights_validates() -> None:
     }
 
     SimulationResponse.model_validate(response)
+
+
+def test_sheath_translates_legacy_polyline() -> None:
+    sheath = Sheath.model_validate(
+        {"polyline_mm": [{"r_mm": 0.0, "z_mm": 0.2}, {"r_mm": 1.0, "z_mm": 0.3}]}
+    )
+    assert sheath.polyline_r_mm == [0.0, 1.0]
+    assert sheath.polyline_z_mm == [0.2, 0.3]
+
+    with pytest.raises(ValidationError, match="same length"):
+        Sheath.model_validate({"polyline_r_mm": [0.0, 1.0], "polyline_z_mm": [0.2]})
+
+
+def test_region_type_rows_handles_dense_and_sparse_legends() -> None:
+    dense = GeometryGrid(nr=2, nz=2, region_id=[[0, 1], [1, 0]], region_legend={0: "plasma", 1: "dielectric"})
+    assert dense.region_type_rows() == [["plasma", "dielectric"], ["dielectric", "plasma"]]
+
+    sparse = GeometryGrid(
+        nr=2,
+        nz=2,
+        region_id=[[-1, 9000], [9000, -1]],
+        region_legend={-1: "solid_wall", 9000: "plasma"},
+    )
+    assert sparse.region_type_rows() == [["solid_wall", "plasma"], ["plasma", "solid_wall"]]
+
+
+def test_request_models_are_frozen() -> None:
+    request = SimulationRequest.model_validate(_base_request())
+    with pytest.raises(ValidationError, match="frozen"):
+        request.process.pressure_Pa = 1.0